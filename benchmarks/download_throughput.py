@@ -0,0 +1,77 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Benchmark download throughput.
+
+Downloads files from the stand-in server, which runs in a separate process,
+through Session.stream and StreamingBody.write, and reports throughput and
+the CPU time used by the client.
+
+Example:
+
+    python benchmarks/download_throughput.py --size-mb 512 --files 4
+"""
+import argparse
+import asyncio
+from pathlib import Path
+import tempfile
+import time
+
+from planet import Auth, Session
+from planet.models import StreamingBody
+
+from server import StandInServer
+
+
+async def _download(url, directory, files, chunk_size):
+    async with Session(auth=Auth.from_key('benchmark')) as sess:
+
+        async def _one(i):
+            async with sess.stream(method='GET', url=url) as resp:
+                await StreamingBody(resp).write(Path(directory, str(i)),
+                                                progress_bar=False,
+                                                chunk_size=chunk_size)
+
+        await asyncio.gather(*[_one(i) for i in range(files)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=4)
+    parser.add_argument('--size-mb', type=int, default=256)
+    parser.add_argument('--chunk-size',
+                        type=int,
+                        default=None,
+                        help='Read chunk size in bytes, default is '
+                        'network sized chunks.')
+    args = parser.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    with StandInServer() as base_url, \
+            tempfile.TemporaryDirectory() as directory:
+        url = f'{base_url}/download/{size}'
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        asyncio.run(_download(url, directory, args.files, args.chunk_size))
+        cpu = time.process_time() - cpu
+        wall = time.perf_counter() - wall
+
+    total = args.files * size
+    print(f'downloaded {total / 1e6:.0f} MB in {wall:.2f}s: '
+          f'{total / wall / 1e6:.1f} MB/s, '
+          f'client CPU {100 * cpu / wall:.0f}% '
+          f'({cpu / (total / 1e9):.2f} CPU s/GB)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Benchmark writing downloads to a slow disk.
+
+Runs concurrent StreamingBody.write calls against in-memory responses while
+every file write is delayed to simulate slow (e.g. network) storage, and
+reports the longest time the event loop was blocked along with throughput.
+
+Example:
+
+    python benchmarks/download_write.py --files 50 --write-latency 0.02
+
+Use --unthreaded to compare with writing directly from the event loop.
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from planet import models
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _Response:
+    """Minimal stand-in for a streaming response."""
+
+    def __init__(self, size, chunk_delay):
+        self.headers = {'Content-Length': str(size)}
+        self.num_bytes_downloaded = 0
+        self._size = size
+        self._chunk_delay = chunk_delay
+
+    async def aiter_bytes(self):
+        chunk = b'x' * CHUNK_SIZE
+        while self.num_bytes_downloaded < self._size:
+            data = chunk[:self._size - self.num_bytes_downloaded]
+            self.num_bytes_downloaded += len(data)
+            # simulate waiting for the network
+            await asyncio.sleep(self._chunk_delay)
+            yield data
+
+
+class _SlowFile:
+    """File wrapper that delays every write."""
+
+    def __init__(self, fp, latency):
+        self._fp = fp
+        self._latency = latency
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._fp.close()
+
+    def write(self, data):
+        time.sleep(self._latency)
+        return self._fp.write(data)
+
+
+class _UnthreadedWriter:
+    """Writes directly from the event loop, for comparison."""
+
+    def __init__(self, fp):
+        self._fp = fp
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def write(self, data):
+        self._fp.write(data)
+
+
+async def _monitor(stalls):
+    while True:
+        start = time.monotonic()
+        await asyncio.sleep(0.001)
+        stalls.append(time.monotonic() - start - 0.001)
+
+
+async def _run(directory, files, size, chunk_delay):
+    stalls = []
+    monitor = asyncio.create_task(_monitor(stalls))
+    start = time.monotonic()
+    await asyncio.gather(*[
+        models.StreamingBody(_Response(size, chunk_delay)).write(
+            Path(directory, str(i)), progress_bar=False) for i in range(files)
+    ])
+    elapsed = time.monotonic() - start
+    monitor.cancel()
+    return elapsed, stalls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=50)
+    parser.add_argument('--size-mb', type=float, default=16)
+    parser.add_argument('--write-latency',
+                        type=float,
+                        default=0.01,
+                        help='Seconds each file write is delayed.')
+    parser.add_argument('--chunk-delay',
+                        type=float,
+                        default=0.001,
+                        help='Seconds to wait for each 64KiB chunk.')
+    parser.add_argument('--unthreaded', action='store_true')
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1024 * 1024)
+    builtin_open = open
+
+    def slow_open(*a, **kw):
+        return _SlowFile(builtin_open(*a, **kw), args.write_latency)
+
+    with tempfile.TemporaryDirectory() as directory, \
+            patch.object(models, 'open', slow_open, create=True):
+        if args.unthreaded:
+            with patch.object(models, '_FileWriter', _UnthreadedWriter):
+                elapsed, stalls = asyncio.run(
+                    _run(directory, args.files, size, args.chunk_delay))
+        else:
+            elapsed, stalls = asyncio.run(_run(directory, args.files, size, args.chunk_delay))
+
+    stalls.sort()
+    total = args.files * size
+    print(f'wrote {total / 1e6:.1f} MB in {elapsed:.2f}s '
+          f'({total / elapsed / 1e6:.1f} MB/s)')
+    print(f'event loop stalls: '
+          f'p50 {1000 * stalls[len(stalls) // 2]:.1f}ms, '
+          f'p99 {1000 * stalls[int(len(stalls) * 0.99)]:.1f}ms, '
+          f'max {1000 * stalls[-1]:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
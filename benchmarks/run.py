@@ -0,0 +1,372 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Run the SDK benchmarks against a local stand-in server.
+
+No network access or credentials are needed. Results are printed and can be
+saved as JSON and compared with the results of a previous run, failing if
+any metric regressed by more than the tolerance.
+
+Metrics ending in '_per_s' are better when higher, metrics ending in '_us'
+or '_ms' are better when lower. Other metrics are informational.
+
+Example:
+
+    python benchmarks/run.py --quick --json results.json
+    python benchmarks/run.py --baseline results.json --tolerance 0.5
+"""
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+from planet import Auth, Planet, Session, geojson, http, specs
+from planet.clients import DataClient, MosaicsClient, OrdersClient, SubscriptionsClient
+
+from server import BUNDLES_SPEC, ServerConfig, StandInServer, feature
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], dict]] = {}
+
+BBOX = (-100.0, 40.0, -99.0, 41.0)
+
+
+def benchmark(f):
+    BENCHMARKS[f.__name__] = f
+    return f
+
+
+def _session(limited=False):
+    sess = Session(auth=Auth.from_key('benchmark'))
+    if not limited:
+        # the default rate limit would dominate the measurements
+        sess._limiter = http._Limiter()
+    return sess
+
+
+async def _count(aiter):
+    count = 0
+    async for _ in aiter:
+        count += 1
+    return count
+
+
+def _pager(args, make_iter):
+
+    async def _run(url):
+        async with _session() as sess:
+            start = time.perf_counter()
+            count = await _count(make_iter(sess, url))
+            return count, time.perf_counter() - start
+
+    config = ServerConfig(items=args.items, page_size=args.page_size)
+    with StandInServer(config) as url:
+        count, elapsed = asyncio.run(_run(url))
+    assert count == args.items, count
+    return {'items_per_s': count / elapsed}
+
+
+@benchmark
+def pager_data(args):
+    """Items per second from a Data API search."""
+    return _pager(
+        args, lambda sess, url: DataClient(sess, base_url=f'{url}/data/v1/').
+        search(['PSScene'], limit=0))
+
+
+@benchmark
+def pager_orders(args):
+    """Orders per second from listing orders."""
+    return _pager(
+        args, lambda sess, url: OrdersClient(
+            sess, base_url=f'{url}/compute/ops').list_orders(limit=0))
+
+
+@benchmark
+def pager_mosaics(args):
+    """Quads per second from listing a mosaic's quads."""
+    return _pager(
+        args,
+        lambda sess, url: MosaicsClient(sess, base_url=f'{url}/basemaps/v1').
+        list_quads('stand-in', minimal=True, bbox=BBOX))
+
+
+@benchmark
+def pager_subscriptions(args):
+    """Results per second from listing subscription results."""
+    return _pager(
+        args, lambda sess, url: SubscriptionsClient(
+            sess, base_url=f'{url}/subscriptions/v1').get_results('s', limit=0)
+    )
+
+
+@benchmark
+def retries(args):
+    """Items per second from a search when every 5th request gets a 429."""
+
+    async def _run(url):
+        async with _session() as sess:
+            sess.max_retry_backoff = 0
+            cl = DataClient(sess, base_url=f'{url}/data/v1/')
+            start = time.perf_counter()
+            count = await _count(cl.search(['PSScene'], limit=0))
+            return count, time.perf_counter() - start, sess.outcomes
+
+    config = ServerConfig(items=args.items,
+                          page_size=args.page_size // 5 or 1,
+                          error_every=5)
+    with StandInServer(config) as url:
+        count, elapsed, outcomes = asyncio.run(_run(url))
+    assert count == args.items, count
+    return {
+        'items_per_s': count / elapsed,
+        'retried': sum(v for k, v in outcomes.items() if k != 'Successful')
+    }
+
+
+@benchmark
+def limiter(args):
+    """Cost of the Session's concurrency limit and rate of its rate limit."""
+
+    async def _run(url, sess, requests):
+        async with sess:
+            cl = DataClient(sess, base_url=f'{url}/data/v1/')
+            start = time.perf_counter()
+            await asyncio.gather(
+                *[cl.get_item('PSScene', str(i)) for i in range(requests)])
+            return time.perf_counter() - start
+
+    def _capped():
+        sess = _session()
+        sess._limiter = http._Limiter(max_workers=http.MAX_ACTIVE)
+        return sess
+
+    requests = args.requests
+    with StandInServer(ServerConfig()) as url:
+        # best of several alternating runs, the first of which warms up
+        # the server
+        unlimited = limited = float('inf')
+        for _ in range(3):
+            unlimited = min(unlimited,
+                            asyncio.run(_run(url, _session(), requests)))
+            limited = min(limited, asyncio.run(_run(url, _capped(), requests)))
+        # the rate limit is slow by design, so only a few requests
+        throttled = asyncio.run(_run(url, _session(limited=True), 20))
+    return {
+        'unlimited_requests_per_s': requests / unlimited,
+        'worker_cap_overhead_us': 1e6 * (limited - unlimited) / requests,
+        'throttled_rate': 20 / throttled
+    }
+
+
+@benchmark
+def download(args):
+    """Bytes per second downloading a mosaic's quads."""
+
+    async def _run(url, directory):
+        async with _session(limited=True) as sess:
+            cl = MosaicsClient(sess, base_url=f'{url}/basemaps/v1')
+            start = time.perf_counter()
+            await cl.download_quads('stand-in', bbox=BBOX, directory=directory)
+            return time.perf_counter() - start
+
+    size = args.download_mb * 1024 * 1024
+    config = ServerConfig(items=args.files, download_size=size)
+    with StandInServer(config) as url, \
+            tempfile.TemporaryDirectory() as directory:
+        elapsed = asyncio.run(_run(url, directory))
+    return {'bytes_per_s': args.files * size / elapsed}
+
+
+@benchmark
+def sync_bridge(args):
+    """Overhead of the synchronous client over the asynchronous client."""
+
+    async def _async(url):
+        async with _session() as sess:
+            cl = DataClient(sess, base_url=f'{url}/data/v1/')
+            start = time.perf_counter()
+            await _count(cl.search(['PSScene'], limit=0))
+            return time.perf_counter() - start
+
+    def _sync(url):
+        pl = Planet(session=_session(), base_url=url)
+        start = time.perf_counter()
+        for _ in pl.data.search(['PSScene'], limit=0):
+            pass
+        elapsed = time.perf_counter() - start
+
+        calls = 1000
+        start = time.perf_counter()
+        for _ in range(calls):
+            pl._session._call_sync(asyncio.sleep(0))
+        return elapsed, (time.perf_counter() - start) / calls
+
+    config = ServerConfig(items=args.items, page_size=args.page_size)
+    with StandInServer(config) as url:
+        async_elapsed = asyncio.run(_async(url))
+        sync_elapsed, call = _sync(url)
+    return {
+        'per_item_overhead_us': 1e6 * (sync_elapsed - async_elapsed) /
+        args.items,
+        'call_sync_us': 1e6 * call
+    }
+
+
+@benchmark
+def geojson_validation(args):
+    """Features per second validated when combining search results and
+    vertices per second validated and simplified in an area of interest."""
+    features = [feature(i) for i in range(args.items)]
+    start = time.perf_counter()
+    geojson.as_featurecollection(features)
+    elapsed = time.perf_counter() - start
+
+    # features that are not recognized by the fast path, here because
+    # of a bbox, are validated against the schema
+    for f in features:
+        f['bbox'] = [-100.0, 40.0, -99.9, 40.1]
+    count = min(args.items, 1000)
+    start = time.perf_counter()
+    geojson.as_featurecollection(features[:count])
+    schema_elapsed = time.perf_counter() - start
+
+    # a large area of interest, validated before it is sent
+    vertices = 10 * args.items
+    ring = [[
+        -100.0 + math.cos(2 * math.pi * i / vertices),
+        40.0 + math.sin(2 * math.pi * i / vertices)
+    ] for i in range(vertices)]
+    ring.append(ring[0])
+    aoi = {'type': 'Polygon', 'coordinates': [ring]}
+    aoi_elapsed = float('inf')
+    # best of several runs, the first of which imports NumPy if installed
+    for _ in range(3):
+        start = time.perf_counter()
+        geojson.as_geom_or_ref(aoi)
+        aoi_elapsed = min(aoi_elapsed, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    geojson.simplify_geom(aoi, max_vertices=1000)
+    simplify_elapsed = time.perf_counter() - start
+    return {
+        'features_per_s': args.items / elapsed,
+        'schema_features_per_s': count / schema_elapsed,
+        'aoi_vertices_per_s': vertices / aoi_elapsed,
+        'simplify_vertices_per_s': vertices / simplify_elapsed
+    }
+
+
+@benchmark
+def cli_startup(args):
+    """Time to run 'planet --help' and to import planet."""
+
+    def _median(code, *cli_args):
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code, *cli_args],
+                           check=True,
+                           stdout=subprocess.DEVNULL)
+            times.append(time.perf_counter() - start)
+        return 1000 * statistics.median(times)
+
+    return {
+        'help_ms': _median('from planet.cli.cli import main; main()',
+                           '--help'),
+        'import_ms': _median('import planet')
+    }
+
+
+def _regressions(results, baseline, tolerance):
+    found = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            previous = baseline.get(name, {}).get(metric)
+            if not previous:
+                continue
+            if metric.endswith('_per_s'):
+                change = (previous - value) / previous
+            elif metric.endswith(('_us', '_ms')):
+                change = (value - previous) / previous
+            else:
+                continue
+            if change > tolerance:
+                found.append(f'{name}.{metric}: {previous:.1f} -> '
+                             f'{value:.1f} ({100 * change:.0f}% worse)')
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('benchmarks',
+                        nargs='*',
+                        help=('Benchmarks to run, defaults to all: '
+                              f'{", ".join(BENCHMARKS)}.'))
+    parser.add_argument('--quick',
+                        action='store_true',
+                        help='Use small sizes, e.g. for CI.')
+    parser.add_argument('--items', type=int, default=10000)
+    parser.add_argument('--page-size', type=int, default=250)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--files', type=int, default=8)
+    parser.add_argument('--download-mb', type=int, default=64)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help='Save the results to a file.')
+    parser.add_argument('--baseline',
+                        help='Compare with results saved with --json.')
+    parser.add_argument('--tolerance',
+                        type=float,
+                        default=0.25,
+                        help='Fraction a metric may regress by.')
+    args = parser.parse_args()
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f'unknown benchmarks: {", ".join(sorted(unknown))}')
+    if args.quick:
+        args.items, args.page_size, args.requests = 1000, 100, 100
+        args.files, args.download_mb, args.repeat = 4, 4, 3
+
+    # avoid fetching the bundles spec, which the search benchmarks need
+    specs.PRODUCT_BUNDLES.cache = {
+        'bundles': BUNDLES_SPEC['bundles'],
+        'bundle_names': BUNDLES_SPEC['bundles'].keys(),
+        'item_types': {'PSScene'}
+    }
+
+    results = {}
+    for name in args.benchmarks or BENCHMARKS:
+        results[name] = BENCHMARKS[name](args)
+        for metric, value in results[name].items():
+            print(f'{name:<20} {metric:<28} {value:>14.1f}')
+
+    if args.json:
+        with open(args.json, 'w') as fp:
+            json.dump(results, fp, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            regressions = _regressions(results, json.load(fp), args.tolerance)
+        for regression in regressions:
+            print(f'regression: {regression}')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Local stand-in for the Planet APIs used by the benchmarks.
+
+The server runs in a separate process so that its work is not counted as
+client time. It serves the paged listings of the Data, Orders, Mosaics and
+Subscriptions APIs and binary downloads of any size, with configurable
+response latency, page size and injection of 429 (Too Many Requests)
+responses:
+
+    GET  /data/v1/item-types/PSScene/items/{id}
+    POST /data/v1/quick-search
+    GET  /data/v1/searches/{id}/results?_page={n}
+    GET  /compute/ops/orders/v2?_page={n}
+    GET  /basemaps/v1/mosaics?name__is={name}
+    GET  /basemaps/v1/mosaics/{id}/quads?_page={n}
+    GET  /subscriptions/v1/{id}/results?_page={n}
+    GET  /download/{size}
+
+Example:
+
+    with StandInServer(ServerConfig(items=1000, page_size=100)) as url:
+        ...  # point clients at url
+"""
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import multiprocessing
+import re
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+BLOCK = b'x' * 1024 * 1024
+
+# stand-in for the bundles spec fetched by planet.specs
+BUNDLES_SPEC = {
+    'bundles': {
+        'analytic_udm2': {
+            'assets': {
+                'PSScene': ['ortho_analytic_4b']
+            }
+        }
+    }
+}
+
+
+@dataclass
+class ServerConfig:
+    """Behavior of the stand-in server."""
+    # number of items in each listing
+    items: int = 1000
+    # number of items in each page of a listing
+    page_size: int = 250
+    # seconds to wait before responding
+    latency: float = 0.0
+    # respond to every nth request with 429, 0 to disable
+    error_every: int = 0
+    # size of quads in the mosaics listing in bytes
+    download_size: int = 1024 * 1024
+
+
+def feature(i: int) -> dict:
+    """A feature resembling a Data API search result."""
+    return {
+        'type': 'Feature',
+        'id': f'20250101_000000_{i:06d}',
+        'geometry': {
+            'type': 'Polygon',
+            'coordinates': [[[-100.0, 40.0], [-99.9, 40.0], [-99.9, 40.1],
+                             [-100.0, 40.1], [-100.0, 40.0]]]
+        },
+        'properties': {
+            'acquired': '2025-01-01T00:00:00.000000Z',
+            'cloud_cover': 0.1,
+            'item_type': 'PSScene',
+            'pixel_resolution': 3,
+            'published': '2025-01-01T01:00:00.000000Z',
+            'satellite_id': '24a1',
+            'sun_elevation': 45.2,
+            'view_angle': 3.1
+        },
+        '_links': {
+            '_self': f'/data/v1/item-types/PSScene/items/{i}',
+            'assets': f'/data/v1/item-types/PSScene/items/{i}/assets/'
+        },
+        '_permissions': ['assets.ortho_analytic_4b:download']
+    }
+
+
+def _order(i: int) -> dict:
+    return {
+        'id': f'00000000-0000-0000-0000-{i:012d}',
+        'name': f'order {i}',
+        'state': 'success',
+        'created_on': '2025-01-01T00:00:00.000Z',
+        'products': [{
+            'item_ids': [f'20250101_000000_{i:06d}'],
+            'item_type': 'PSScene',
+            'product_bundle': 'analytic_udm2'
+        }]
+    }
+
+
+def _result(i: int) -> dict:
+    return {
+        'id': f'00000000-0000-0000-0000-{i:012d}',
+        'status': 'success',
+        'created': '2025-01-01T00:00:00.000Z',
+        'updated': '2025-01-01T00:00:00.000Z',
+        'completed': '2025-01-01T00:00:00.000Z',
+        'properties': {
+            'item_id': f'20250101_000000_{i:06d}', 'item_types': ['PSScene']
+        }
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    config: ServerConfig
+    counter: dict
+    lock: threading.Lock
+    pages: dict
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        self.rfile.read(length)
+        self._handle()
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        if self.config.latency:
+            time.sleep(self.config.latency)
+
+        if self.config.error_every:
+            with self.lock:
+                self.counter['requests'] += 1
+                count = self.counter['requests']
+            if count % self.config.error_every == 0:
+                return self._send_json({'message': 'Too Many Requests'}, 429)
+
+        url = urlparse(self.path)
+        # clients join base urls ending in '/' with paths starting with '/'
+        path = re.sub('/+', '/', url.path)
+        query = parse_qs(url.query)
+        page = int(query.get('_page', ['0'])[0])
+        base = f'http://{self.headers["Host"]}'
+
+        if path.startswith('/download/'):
+            return self._send_bytes(int(path.rsplit('/', 1)[-1]))
+        if path == '/compute/ops/bundles/spec':
+            return self._send_json(BUNDLES_SPEC)
+        if path == '/data/v1/quick-search' or path.startswith(
+                '/data/v1/searches/'):
+            return self._send_page('features',
+                                   '_next',
+                                   feature,
+                                   f'{base}/data/v1/searches/s/results',
+                                   page)
+        if path.startswith('/data/v1/item-types/'):
+            return self._send_json(feature(0))
+        if path == '/compute/ops/orders/v2':
+            return self._send_page('orders',
+                                   'next',
+                                   _order,
+                                   f'{base}/compute/ops/orders/v2',
+                                   page)
+        if path == '/basemaps/v1/mosaics':
+            return self._send_json({'mosaics': [self._mosaic(base)]})
+        if path == '/basemaps/v1/mosaics/m':
+            return self._send_json(self._mosaic(base))
+        if path == '/basemaps/v1/mosaics/m/quads':
+            size = self.config.download_size
+
+            def _quad(i):
+                return {
+                    'id': f'{i}-0',
+                    'percent_covered': 100,
+                    '_links': {
+                        'download': f'{base}/download/{size}?q={i}'
+                    }
+                }
+
+            return self._send_page('items',
+                                   '_next',
+                                   _quad,
+                                   f'{base}/basemaps/v1/mosaics/m/quads',
+                                   page)
+        if re.fullmatch('/subscriptions/v1/[^/]+/results', path):
+            return self._send_page('results',
+                                   'next',
+                                   _result,
+                                   f'{base}{path}',
+                                   page)
+        self._send_json({'message': 'Not Found'}, 404)
+
+    def _mosaic(self, base):
+        return {
+            'id': 'm',
+            'name': 'stand-in',
+            '_links': {
+                'quads': f'{base}/basemaps/v1/mosaics/m/quads'
+                '?bbox={lx},{ly},{ux},{uy}'
+            }
+        }
+
+    def _send_page(self, items_key, next_key, make, url, page):
+        size = self.config.page_size
+        start = page * size
+        stop = min(start + size, self.config.items)
+        key = (items_key, page)
+        if key not in self.pages:
+            self.pages[key] = [make(i) for i in range(start, stop)]
+        body = {items_key: self.pages[key], '_links': {}}
+        if stop < self.config.items:
+            body['_links'][next_key] = f'{url}?_page={page + 1}'
+        self._send_json(body)
+
+    def _send_json(self, body, status=200):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _send_bytes(self, size):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(size))
+        self.end_headers()
+        while size > 0:
+            data = BLOCK[:size]
+            self.wfile.write(data)
+            size -= len(data)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # clients open many connections at once
+    request_queue_size = 256
+
+
+def _serve(config: dict, port_queue):
+    handler = type(
+        'Handler', (_Handler, ),
+        {
+            'config': ServerConfig(**config),
+            'counter': {
+                'requests': 0
+            },
+            'lock': threading.Lock(),
+            'pages': {}
+        })
+    server = _Server(('127.0.0.1', 0), handler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+class StandInServer:
+    """Context manager running the stand-in server in a separate process.
+
+    Entering the context starts the server and provides its base url.
+    """
+
+    def __init__(self, config: ServerConfig = ServerConfig()):
+        self.config = config
+        self._process = None
+
+    def __enter__(self) -> str:
+        ctx = multiprocessing.get_context('spawn')
+        port_queue = ctx.Queue()
+        self._process = ctx.Process(target=_serve,
+                                    args=(asdict(self.config), port_queue),
+                                    daemon=True)
+        self._process.start()
+        port = port_queue.get(timeout=30)
+        return f'http://127.0.0.1:{port}'
+
+    def __exit__(self, *args):
+        self._process.terminate()
+        self._process.join()
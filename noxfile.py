@@ -8,7 +8,12 @@ nox.options.reuse_existing_virtualenvs = False
 
 nox.options.sessions = ['lint', 'analyze', 'test', 'coverage', 'docs']
 
-source_files = ("planet", "examples", "tests", "setup.py", "noxfile.py")
+source_files = ("planet",
+                "examples",
+                "tests",
+                "benchmarks",
+                "setup.py",
+                "noxfile.py")
 
 BUILD_DIRS = ['build', 'dist']
 
@@ -114,6 +119,19 @@ def examples(session):
     session.run('pytest', '--no-cov', 'examples/', '-s', *options)
 
 
+@nox.session
+def benchmarks(session):
+    """Run the benchmarks against a local stand-in server
+
+    CI runs the quick suite to check that the benchmarks still run, compare
+    timings on one machine with --baseline instead.
+    """
+    session.install(".")
+
+    options = session.posargs or ['--quick']
+    session.run('python', 'benchmarks/run.py', *options)
+
+
 @nox.session
 def build(session):
     """Build package"""
@@ -0,0 +1,476 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Caching of HTTP responses, of resources looked up by name and of features.
+
+A cache is enabled by providing it to a Session. Only successful responses to
+GET requests are cached. Cached responses are served without contacting the
+server while they are fresh according to their `Cache-Control` header and are
+otherwise revalidated with a conditional request (`If-None-Match` or
+`If-Modified-Since`), which costs a round trip but not the response body.
+
+Example:
+    ```python
+    >>> import asyncio
+    >>> from planet import Session
+    >>> from planet.cache import MemoryCache
+    >>>
+    >>> async def main():
+    ...     async with Session(cache=MemoryCache()) as sess:
+    ...         cl = sess.client('orders')
+    ...         # use client here
+    ...         print(sess.cache.hit_ratio)
+    ...
+    >>> asyncio.run(main())
+
+    ```
+"""
+import base64
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import logging
+from pathlib import Path
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from planet.geojson import split_ref
+from planet.io import write_atomic
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_NAME_TTL = 3600  # seconds
+DEFAULT_FEATURE_TTL = 3600  # seconds
+
+# the cached content is stored decoded, so headers describing the encoding
+# of the original transfer do not apply to it
+_UNCACHED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+class CachedResponse:
+    """A cached response and the information needed to revalidate it."""
+
+    def __init__(self,
+                 url: str,
+                 status_code: int,
+                 headers: List[Tuple[str, str]],
+                 content: bytes,
+                 stored_at: float,
+                 max_age: float = 0):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.stored_at = stored_at
+        self.max_age = max_age
+
+    @classmethod
+    def from_response(cls,
+                      response: httpx.Response) -> Optional['CachedResponse']:
+        """Create an entry from a response, None if it cannot be cached."""
+        if response.status_code != 200:
+            return None
+
+        directives = _cache_control(response.headers)
+        if 'no-store' in directives:
+            return None
+
+        max_age = _max_age(directives)
+        validators = ('etag', 'last-modified')
+        if not max_age and not any(v in response.headers for v in validators):
+            # nothing would be gained by caching the response
+            return None
+
+        return cls(url=str(response.request.url),
+                   status_code=response.status_code,
+                   headers=[(k, v) for k, v in response.headers.items()
+                            if k.lower() not in _UNCACHED_HEADERS],
+                   content=response.content,
+                   stored_at=time.time(),
+                   max_age=max_age)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._header('etag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self._header('last-modified')
+
+    def _header(self, name: str) -> Optional[str]:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.stored_at + self.max_age
+
+    def refresh(self, response: httpx.Response):
+        """Update freshness from a 304 Not Modified response."""
+        self.stored_at = time.time()
+        self.max_age = _max_age(_cache_control(response.headers))
+        etag = response.headers.get('etag')
+        if etag:
+            self.headers = [
+                (k, v) for k, v in self.headers if k.lower() != 'etag'
+            ] + [('etag', etag)]
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers for revalidating this entry with the server."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(self.status_code,
+                              headers=self.headers,
+                              content=self.content,
+                              request=request)
+
+    def to_dict(self) -> dict:
+        return {
+            'url': self.url,
+            'status_code': self.status_code,
+            'headers': self.headers,
+            'content': base64.b64encode(self.content).decode('ascii'),
+            'stored_at': self.stored_at,
+            'max_age': self.max_age
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CachedResponse':
+        return cls(url=data['url'],
+                   status_code=data['status_code'],
+                   headers=[(k, v) for k, v in data['headers']],
+                   content=base64.b64decode(data['content']),
+                   stored_at=data['stored_at'],
+                   max_age=data['max_age'])
+
+
+def _cache_control(headers: httpx.Headers) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in headers.get('cache-control', '').split(','):
+        name, _, value = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _max_age(directives: Dict[str, Optional[str]]) -> float:
+    if 'no-cache' in directives:
+        return 0
+    try:
+        return max(float(directives.get('max-age') or 0), 0)
+    except ValueError:
+        return 0
+
+
+class ResponseCache:
+    """Base class for response caches.
+
+    Subclasses implement storage of entries. This class keeps statistics
+    describing how effective the cache has been.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        """Responses served from the cache without contacting the server."""
+        self.revalidations = 0
+        """Responses served from the cache after a 304 Not Modified."""
+        self.misses = 0
+        """Responses that were received in full from the server."""
+        self.bytes_saved = 0
+        """Bytes of response content that did not need to be received."""
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of cacheable requests served from the cache."""
+        total = self.hits + self.revalidations + self.misses
+        return (self.hits + self.revalidations) / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Summary of cache effectiveness."""
+        return {
+            'hits': self.hits,
+            'revalidations': self.revalidations,
+            'misses': self.misses,
+            'hit_ratio': self.hit_ratio,
+            'bytes_saved': self.bytes_saved
+        }
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CachedResponse):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """In-memory least-recently-used response cache."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Parameters:
+            max_entries: Maximum number of responses to keep.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return None
+        return self._entries[key]
+
+    def set(self, key: str, entry: CachedResponse):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class DiskCache(ResponseCache):
+    """Response cache persisted as files in a directory.
+
+    Entries persist across sessions and processes. The directory should not
+    be shared between users with different credentials.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Parameters:
+            directory: Directory to store responses in. Created if it does
+                not exist.
+        """
+        super().__init__()
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.directory / f'{name}.json'
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            data = json.loads(self._path(key).read_text())
+            return CachedResponse.from_dict(data)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            LOGGER.debug(f'ignoring corrupt cache entry for {key}: {e}')
+            return None
+
+    def set(self, key: str, entry: CachedResponse):
+        write_atomic(self._path(key), json.dumps(entry.to_dict()))
+
+    def delete(self, key: str):
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self):
+        for path in self.directory.glob('*.json'):
+            if re.fullmatch('[0-9a-f]{64}', path.stem):
+                path.unlink(missing_ok=True)
+
+
+class NameCache:
+    """Least-recently-used cache of API resources looked up by name.
+
+    Entries expire after a time to live. If a path is given, entries are
+    loaded from and saved to a JSON file so that they are shared across
+    sessions and processes. Resources may hold credentials, e.g. in the
+    query strings of their links, so the file is only readable by its owner.
+    """
+
+    def __init__(self,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: float = DEFAULT_NAME_TTL,
+                 path: Optional[Union[str, Path]] = None):
+        """
+        Parameters:
+            max_entries: Maximum number of resources to keep.
+            ttl: Seconds after which an entry is looked up again.
+            path: JSON file to persist entries to. Created if it does not
+                exist.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = Path(path).expanduser() if path else None
+        self._entries: OrderedDict[str, Tuple[float, dict]] = OrderedDict()
+        if self.path:
+            self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[dict]:
+        """Get a copy of a resource, None if missing or expired."""
+        try:
+            stored_at, value = self._entries[key]
+        except KeyError:
+            return None
+
+        if time.time() >= stored_at + self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        # callers may modify the resource, e.g. to strip links
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: dict):
+        self._entries[key] = (time.time(), copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        if self.path:
+            self._save()
+
+    def clear(self):
+        self._entries.clear()
+        if self.path:
+            self._save()
+
+    def _load(self):
+        assert self.path
+        try:
+            data = json.loads(self.path.read_text())
+            for key, stored_at, value in data:
+                self._entries[key] = (stored_at, value)
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError) as e:
+            LOGGER.debug(f'ignoring corrupt name cache {self.path}: {e}')
+            self._entries.clear()
+
+    def _save(self):
+        assert self.path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = [[k, t, v] for k, (t, v) in self._entries.items()]
+        write_atomic(self.path, json.dumps(data))
+
+
+class FeatureCache(DiskCache):
+    """Features API features persisted as files in a directory.
+
+    Features are keyed by their reference, e.g.
+    `pl:features/my/collection-id/feature-id`, and stored as responses to
+    requests for them. Cached features are served without contacting the
+    server for a time to live and are otherwise revalidated with their
+    `ETag`, which costs a round trip but not the feature. The cache can be
+    filled in bulk from a listing of a collection with
+    `FeaturesClient.warm_cache()`.
+
+    Entries persist across sessions and processes. The directory should not
+    be shared between users with different credentials.
+    """
+
+    def __init__(self,
+                 directory: Union[str, Path],
+                 ttl: float = DEFAULT_FEATURE_TTL):
+        """
+        Parameters:
+            directory: Directory to store features in. Created if it does
+                not exist.
+            ttl: Seconds for which a feature is served without revalidating
+                it with the server.
+        """
+        super().__init__(directory)
+        self.ttl = ttl
+
+    def _collection_path(self, collection_id: str) -> Path:
+        name = hashlib.sha256(collection_id.encode('utf-8')).hexdigest()
+        return self.directory / name
+
+    def _path(self, key: str) -> Path:
+        # features are grouped by collection so that they can be pruned
+        collection_id, feature_id = split_ref(key)
+        name = hashlib.sha256(feature_id.encode('utf-8')).hexdigest()
+        return self._collection_path(collection_id) / f'{name}.json'
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        # the time to live applies to entries stored with an earlier one
+        return time.time() < entry.stored_at + self.ttl
+
+    def set(self, key: str, entry: CachedResponse):
+        self._path(key).parent.mkdir(exist_ok=True)
+        super().set(key, entry)
+
+    def set_feature(self, ref: str, feature: dict, etag: Optional[str] = None):
+        """Cache a feature.
+
+        A feature without an `ETag`, e.g. from a listing, keeps the `ETag`
+        of the cached feature if it is unchanged.
+        """
+        if etag is None:
+            entry = self.get(ref)
+            if entry and json.loads(entry.content) == feature:
+                etag = entry.etag
+
+        self.set(
+            ref,
+            CachedResponse(url=ref,
+                           status_code=200,
+                           headers=[('etag', etag)] if etag else [],
+                           content=json.dumps(feature).encode('utf-8'),
+                           stored_at=time.time(),
+                           max_age=self.ttl))
+
+    def refresh(self, ref: str, entry: CachedResponse):
+        """Mark a feature as fresh after a 304 Not Modified response."""
+        entry.stored_at = time.time()
+        self.set(ref, entry)
+
+    def prune(self, collection_id: str, refs: Iterable[str] = ()) -> int:
+        """Remove the features of a collection other than those given.
+
+        Returns:
+            The number of features removed.
+        """
+        keep = {self._path(ref).name for ref in refs}
+        removed = 0
+        for path in self._collection_path(collection_id).glob('*.json'):
+            if path.name not in keep:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self):
+        for path in self.directory.glob('*/*.json'):
+            if re.fullmatch('[0-9a-f]{64}', path.parent.name):
+                path.unlink(missing_ok=True)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """CLI main entry point"""
+import json
 import logging
 import sys
 
@@ -21,6 +22,7 @@ import click
 import planet_auth_utils
 import planet
 from planet.cli import mosaics
+from planet.metrics import MetricsCollector
 
 from . import auth, cmds, collect, data, destinations, orders, subscriptions, features
 
@@ -38,6 +40,15 @@ LOGGER = logging.getLogger(__name__)
               default="warning",
               help=("Optional: set verbosity level to warning, info, or debug.\
                   Defaults to warning."))
+@click.option('--stats',
+              is_flag=True,
+              default=False,
+              help=('Report request counts, latency, limiter wait, retries '
+                    'and bytes downloaded to stderr on completion.'))
+@click.option('--stats-file',
+              type=click.Path(dir_okay=False, writable=True),
+              help=('Write the request statistics to a JSON file on '
+                    'completion.'))
 @planet_auth_utils.opt_profile()
 @planet_auth_utils.opt_client_id()
 @planet_auth_utils.opt_client_secret()
@@ -46,6 +57,8 @@ LOGGER = logging.getLogger(__name__)
 def main(ctx,
          verbosity,
          quiet,
+         stats,
+         stats_file,
          auth_profile,
          auth_client_id,
          auth_client_secret,
@@ -58,6 +71,11 @@ def main(ctx,
     ctx.ensure_object(dict)
     ctx.obj['QUIET'] = quiet
 
+    if stats or stats_file:
+        collector = MetricsCollector()
+        ctx.obj['STATS'] = collector
+        ctx.call_on_close(lambda: _report_stats(collector, stats, stats_file))
+
     _configure_cli_auth_ctx(ctx,
                             auth_profile,
                             auth_client_id,
@@ -87,6 +105,44 @@ def _configure_cli_auth_ctx(ctx,
         pl_authlib_context=ctx.obj['AUTH'])
 
 
+def _report_stats(collector, stats, stats_file):
+    """Report the statistics of the requests made by a command."""
+    summary = collector.summary()
+    if stats_file:
+        with open(stats_file, 'w') as fp:
+            json.dump(summary, fp, indent=2)
+
+    if not stats:
+        return
+
+    def _secs(value):
+        return '-' if value is None else f'{value:.3f}s'
+
+    click.echo(f'Requests: {summary["requests"]}', err=True)
+    for name, endpoint in summary['endpoints'].items():
+        outcomes = ', '.join(
+            f'{outcome}: {count}'
+            for outcome, count in endpoint['outcomes'].items())
+        click.echo(
+            f'  {name}\n'
+            f'    {endpoint["requests"]} requests ({outcomes}), '
+            f'p50 {_secs(endpoint["p50"])}, p95 {_secs(endpoint["p95"])}, '
+            f'p99 {_secs(endpoint["p99"])}, {endpoint["bytes"]} bytes',
+            err=True)
+    wait = summary['queue_wait']
+    click.echo(
+        f'Limiter wait: total {_secs(wait["total"])}, '
+        f'p50 {_secs(wait["p50"])}, p99 {_secs(wait["p99"])}',
+        err=True)
+    retries = ', '.join(f'{name}: {count}'
+                        for name, count in summary['retries'].items())
+    click.echo(
+        f'Retries: {retries or "none"}, '
+        f'waited {_secs(summary["retry_wait"])}',
+        err=True)
+    click.echo(f'Bytes downloaded: {summary["bytes"]}', err=True)
+
+
 def _configure_logging(verbosity):
     """configure logging via verbosity level, corresponding
     to log levels warning, info and debug respectfully.
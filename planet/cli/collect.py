@@ -18,12 +18,16 @@ import logging
 import click
 
 import planet
+from planet.io import iter_collect
 from .cmds import coro, translate_exceptions
 from .io import echo_json
 from .options import pretty
 
 LOGGER = logging.getLogger(__name__)
 
+# size of the output written at a time
+WRITE_SIZE = 64 * 1024
+
 
 @click.command()
 @click.pass_context
@@ -31,13 +35,22 @@ LOGGER = logging.getLogger(__name__)
 @coro
 @click.argument('input', type=click.File('r'))
 @pretty
-async def collect(ctx, input, pretty):
+@click.option('--stream',
+              is_flag=True,
+              help="""Write the output as the input is read. The first entry
+    decides whether the output is a FeatureCollection or a list.""")
+async def collect(ctx, input, pretty, stream):
     """Collect a sequence of JSON descriptions into a single JSON blob.
 
     If the descriptions represent GeoJSON features, a GeoJSON FeatureCollection
     is returned.
 
     Output can be pretty-printed with --pretty option.
+
+    With --stream, the output is written as the input is read, so the input
+    may be larger than the available memory. If the first entry is a GeoJSON
+    feature and a later one is not, the command fails after part of the
+    output has been written.
     """
 
     # make an AsyncGenerator from the input lines
@@ -45,6 +58,21 @@ async def collect(ctx, input, pretty):
         for line in input:
             yield json.loads(line)
 
-    entries = _entries_aiter()
-    collected = await planet.collect(entries)
-    echo_json(collected, pretty)
+    if not stream:
+        collected = await planet.collect(_entries_aiter())
+        echo_json(collected, pretty)
+        return
+
+    # the same output as echo_json(planet.collect(...), pretty)
+    pieces = []
+    size = 0
+    async for piece in iter_collect(_entries_aiter(),
+                                    indent=2 if pretty else None,
+                                    sort_keys=pretty):
+        pieces.append(piece)
+        size += len(piece)
+        if size >= WRITE_SIZE:
+            click.echo(''.join(pieces), nl=False)
+            pieces = []
+            size = 0
+    click.echo(''.join(pieces))
@@ -15,11 +15,13 @@
 from typing import List, Optional
 from contextlib import asynccontextmanager
 from pathlib import Path
+import sys
 import click
 
 from planet.reporting import AssetStatusBar
 from planet import data_filter, DataClient, exceptions
-from planet.clients.data import (SEARCH_SORT,
+from planet.clients.data import (COVERAGE_CONCURRENCY,
+                                 SEARCH_SORT,
                                  LIST_SEARCH_TYPE,
                                  LIST_SEARCH_TYPE_DEFAULT,
                                  LIST_SORT_ORDER,
@@ -34,8 +36,8 @@ from planet.specs import (FetchBundlesSpecError,
 
 from . import types
 from .cmds import coro, translate_exceptions
-from .io import echo_json
-from .options import limit, pretty
+from .io import echo_json, read_ids
+from .options import chunk_size, limit, pretty
 from .session import CliSession
 from .validators import check_geom
 
@@ -557,6 +559,12 @@ async def search_update(ctx,
               is_flag=True,
               default=None,
               help=('Verify that checksums match.'))
+@click.option('--preflight',
+              is_flag=True,
+              default=False,
+              help=('Without --filename, determine the file name with a HEAD '
+                    'request and skip the download if the file exists.'))
+@chunk_size
 async def asset_download(ctx,
                          item_type,
                          item_id,
@@ -564,7 +572,9 @@ async def asset_download(ctx,
                          directory,
                          filename,
                          overwrite,
-                         checksum):
+                         checksum,
+                         preflight,
+                         chunk_size):
     """Download an activated asset.
 
     This function will fail if the asset state is not activated. Consider
@@ -588,7 +598,9 @@ async def asset_download(ctx,
                                        filename=filename,
                                        directory=Path(directory),
                                        overwrite=overwrite,
-                                       progress_bar=not quiet)
+                                       progress_bar=not quiet,
+                                       preflight=preflight,
+                                       chunk_size=chunk_size)
         if checksum:
             cl.validate_checksum(asset, path)
 
@@ -704,15 +716,52 @@ async def item_get(ctx, item_type, item_id):
               help="""Specific band to extract from UDM2
               (e.g., 'clear', 'cloud', 'snow_ice').
               For full details, refer to the UDM2 product specifications.""")
-async def item_coverage(ctx, item_type, item_id, geom, mode, band):
-    """Get item clear coverage."""
+@click.option('--concurrency',
+              type=click.IntRange(min=1),
+              default=COVERAGE_CONCURRENCY,
+              show_default=True,
+              help="""Maximum number of coverage requests in flight when
+              reading item ids from stdin.""")
+@pretty
+async def item_coverage(ctx,
+                        item_type,
+                        item_id,
+                        geom,
+                        mode,
+                        band,
+                        concurrency,
+                        pretty):
+    """Get item clear coverage.
+
+    If ITEM_ID is '-', item ids are read from stdin, one per line. Lines may
+    also be item descriptions such as the output of `planet data search`.
+    Coverage is requested concurrently and one JSON description containing
+    the item_id, coverage and request latency (in seconds) is output per
+    item, in order of completion. Items whose coverage cannot be estimated
+    are reported on stderr and skipped.
+    """
+
+    def _report(failed_id, error):
+        click.echo(f'Error: coverage of {failed_id} failed: {error}', err=True)
+
     async with data_client(ctx) as cl:
-        item_assets = await cl.get_item_coverage(item_type,
-                                                 item_id,
-                                                 geom,
-                                                 mode,
-                                                 band)
-        echo_json(item_assets, pretty)
+        if item_id == '-':
+            item_ids = read_ids(sys.stdin)
+            async for result in cl.get_items_coverage(item_type,
+                                                      item_ids,
+                                                      geom,
+                                                      mode,
+                                                      band,
+                                                      concurrency,
+                                                      on_error=_report):
+                echo_json(result, pretty)
+        else:
+            item_assets = await cl.get_item_coverage(item_type,
+                                                     item_id,
+                                                     geom,
+                                                     mode,
+                                                     band)
+            echo_json(item_assets, pretty)
 
 
 @data.command()  # type: ignore
@@ -3,9 +3,14 @@ import json
 import click
 from click.exceptions import ClickException
 
-from planet.cli.io import echo_json
-from planet.clients.features import FeaturesClient
+from planet.cache import FeatureCache
+from planet.cli.io import echo_json, read_ids
+from planet.clients.features import (FeaturesClient,
+                                     MAX_CHUNK_BYTES,
+                                     MAX_CHUNK_FEATURES,
+                                     SYNC_MATCHES)
 from planet.geojson import split_ref
+from planet.io import read_features
 
 from .cmds import command
 from .options import compact, limit
@@ -15,7 +20,12 @@ from .session import CliSession
 @asynccontextmanager
 async def features_client(ctx):
     async with CliSession(ctx) as sess:
-        cl = FeaturesClient(sess, base_url=ctx.obj['BASE_URL'])
+        feature_cache = None
+        if ctx.obj.get('FEATURE_CACHE'):
+            feature_cache = FeatureCache(ctx.obj['FEATURE_CACHE'])
+        cl = FeaturesClient(sess,
+                            base_url=ctx.obj['BASE_URL'],
+                            feature_cache=feature_cache)
         yield cl
 
 
@@ -25,9 +35,17 @@ async def features_client(ctx):
               '--base-url',
               default=None,
               help='Assign custom base Features API URL.')
-def features(ctx, base_url):
+@click.option('--feature-cache',
+              type=click.Path(file_okay=False),
+              envvar='PL_FEATURES_CACHE',
+              default=None,
+              help=('Directory to cache features in, so that repeated '
+                    'commands skip fetching them. Can also be set with the '
+                    'PL_FEATURES_CACHE environment variable.'))
+def features(ctx, base_url, feature_cache):
     """Commands for interacting with the Features API"""
     ctx.obj['BASE_URL'] = base_url
+    ctx.obj['FEATURE_CACHE'] = feature_cache
 
 
 @features.group()  # type: ignore
@@ -111,6 +129,55 @@ async def collection_delete(ctx, collection_id, *args, **kwargs):
         await cl.delete_collection(collection_id)
 
 
+@command(collections, name="sync")
+@click.argument("collection_id", required=True)
+@click.argument("filename", type=click.File("r"), required=True)
+@click.option("--property-id",
+              help="Name of the property whose value is each feature's id.")
+@click.option("--match",
+              type=click.Choice(SYNC_MATCHES),
+              default="id",
+              show_default=True,
+              help="Match features by id or by a hash of their content.")
+@click.option("--dry-run",
+              is_flag=True,
+              help="Report the changes without making them.")
+@click.option("--concurrency",
+              type=click.IntRange(min=1),
+              default=4,
+              show_default=True,
+              help="Maximum number of requests in flight.")
+async def collection_sync(ctx,
+                          collection_id,
+                          filename,
+                          property_id,
+                          match,
+                          dry_run,
+                          concurrency,
+                          pretty):
+    """Make a collection contain the features of a file.
+
+    Features in FILENAME, a GeoJSON or newline-delimited GeoJSON file or '-'
+    to read from stdin, are compared with those of the collection. Features
+    that are new or changed are added and features that are not in the file
+    or changed are deleted. A report of the changes is output.
+
+    Example:
+
+    \b
+    planet features collections sync my-collection-123 ./aois.geojson \\
+      --dry-run
+    """
+    async with features_client(ctx) as cl:
+        report = await cl.sync_items(collection_id,
+                                     read_features(filename),
+                                     property_id=property_id,
+                                     match=match,
+                                     dry_run=dry_run,
+                                     concurrency=concurrency)
+        echo_json(report, pretty)
+
+
 @features.group()
 def items():
     """commands for interacting with Features API items (features
@@ -163,6 +230,34 @@ async def item_get(ctx, collection_id, feature_id, pretty):
         echo_json(feature, pretty)
 
 
+@command(items, name="warm-cache")
+@click.argument("collection_id", required=True)
+@click.option("--prune/--no-prune",
+              default=True,
+              show_default=True,
+              help="Remove cached features no longer in the collection.")
+async def items_warm_cache(ctx, collection_id, prune, pretty):
+    """Cache all features in a collection.
+
+    Requires a feature cache, see `planet features --help`. Features in
+    the cache are then got without fetching them.
+
+    Example:
+
+    \b
+    planet features --feature-cache ~/.cache/planet/features \\
+      items warm-cache my-collection-123
+    """
+    if not ctx.obj.get('FEATURE_CACHE'):
+        raise ClickException(
+            "Must supply a feature cache with --feature-cache or "
+            "PL_FEATURES_CACHE.")
+
+    async with features_client(ctx) as cl:
+        count = await cl.warm_cache(collection_id, prune=prune)
+        echo_json({'cached': count}, pretty)
+
+
 @command(items, name="delete")
 @click.argument("collection_id")
 @click.argument("feature_id", required=False)
@@ -213,3 +308,79 @@ async def item_add(ctx, collection_id, filename, pretty):
                 )
 
     echo_json(res, pretty)
+
+
+@command(items, name="bulk-add")
+@click.argument("collection_id", required=True)
+@click.argument("filename", type=click.File("r"), required=True)
+@click.option("--property-id",
+              help="""Name of a property whose value will become the id of
+              each feature.""")
+@click.option("--max-features",
+              type=click.IntRange(min=1),
+              default=MAX_CHUNK_FEATURES,
+              show_default=True,
+              help="Maximum number of features uploaded in one request.")
+@click.option("--max-bytes",
+              type=click.IntRange(min=1),
+              default=MAX_CHUNK_BYTES,
+              show_default=True,
+              help="Maximum size of a request in bytes.")
+@click.option("--concurrency",
+              type=click.IntRange(min=1),
+              default=4,
+              show_default=True,
+              help="Maximum number of requests in flight.")
+async def items_bulk_add(ctx,
+                         collection_id,
+                         filename,
+                         property_id,
+                         max_features,
+                         max_bytes,
+                         concurrency,
+                         pretty):
+    """Add many features from a file to a collection.
+
+    FILENAME may be a GeoJSON or newline-delimited GeoJSON file, or '-' to
+    read from stdin. The file is read as features are uploaded, in
+    concurrent requests of up to --max-features features each, and one
+    feature reference is output per feature as requests complete.
+
+    Example:
+
+    planet features items bulk-add my-collection-123 ./parcels.geojson
+    """
+    async with features_client(ctx) as cl:
+        async for ref in cl.bulk_add_items(collection_id,
+                                           read_features(filename),
+                                           property_id=property_id,
+                                           max_features=max_features,
+                                           max_bytes=max_bytes,
+                                           concurrency=concurrency):
+            echo_json(ref, pretty)
+
+
+@command(items, name="bulk-delete")
+@click.argument("collection_id", required=True)
+@click.argument("filename", type=click.File("r"), required=True)
+@click.option("--concurrency",
+              type=click.IntRange(min=1),
+              default=8,
+              show_default=True,
+              help="Maximum number of requests in flight.")
+async def items_bulk_delete(ctx, collection_id, filename, concurrency, pretty):
+    """Delete many features from a collection.
+
+    FILENAME contains one feature id, reference or GeoJSON feature per
+    line, or is '-' to read from stdin. Features are deleted concurrently
+    and their ids are output as they are deleted.
+
+    Example:
+
+    planet features items bulk-delete my-collection-123 ./ids.txt
+    """
+    async with features_client(ctx) as cl:
+        async for feature_id in cl.delete_items(collection_id,
+                                                read_ids(filename),
+                                                concurrency=concurrency):
+            echo_json(feature_id, pretty)
@@ -32,3 +32,19 @@ def echo_json(obj: object, pretty: bool = False) -> None:
         click.echo(json_str)
     else:
         click.echo(json.dumps(obj))
+
+
+def read_ids(lines):
+    """Get ids from lines of ids, references or JSON descriptions.
+
+    Blank lines are skipped. Lines starting with '{' are JSON objects whose
+    'id' is taken, other lines are ids or references as given.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('{'):
+            yield json.loads(line)['id']
+        else:
+            yield line
@@ -3,8 +3,12 @@ from contextlib import asynccontextmanager
 
 import click
 
+from planet.cache import NameCache
+from planet.reporting import TransferProgress
+
 from planet.cli.cmds import command
 from planet.cli.io import echo_json
+from planet.cli.options import chunk_size
 from planet.cli.session import CliSession
 from planet.cli.types import BoundingBox, DateTime, Geometry
 from planet.cli.validators import check_geom
@@ -12,9 +16,15 @@ from planet.clients.mosaics import MosaicsClient
 
 
 @asynccontextmanager
-async def client(ctx):
+async def client(ctx, progress=None):
     async with CliSession(ctx) as sess:
-        cl = MosaicsClient(sess, base_url=ctx.obj['BASE_URL'])
+        sess.progress = progress
+        name_cache = None
+        if ctx.obj.get('NAME_CACHE'):
+            name_cache = NameCache(path=ctx.obj['NAME_CACHE'])
+        cl = MosaicsClient(sess,
+                           base_url=ctx.obj['BASE_URL'],
+                           name_cache=name_cache)
         yield cl
 
 
@@ -74,9 +84,17 @@ async def _output(result, pretty, include_links=False):
               '--base-url',
               default=None,
               help='Assign custom base Mosaics API URL.')
-def mosaics(ctx, base_url):
+@click.option('--name-cache',
+              type=click.Path(dir_okay=False),
+              envvar='PL_MOSAICS_NAME_CACHE',
+              default=None,
+              help=('File to cache mosaic and series name lookups in, so '
+                    'that repeated commands skip them. Can also be set with '
+                    'the PL_MOSAICS_NAME_CACHE environment variable.'))
+def mosaics(ctx, base_url, name_cache):
     """Commands for interacting with the Mosaics API"""
     ctx.obj['BASE_URL'] = base_url
+    ctx.obj['NAME_CACHE'] = name_cache
 
 
 @mosaics.group()  # type: ignore
@@ -256,7 +274,31 @@ async def list_quads(ctx, name_or_id, bbox, geometry, summary, pretty, links):
                               file_okay=False))
 @bbox
 @geometry
-async def download(ctx, name_or_id, output_dir, bbox, geometry, **kwargs):
+@click.option('--incremental',
+              is_flag=True,
+              help=('Record downloads in a manifest in the output directory '
+                    'and only download quads that are new or changed.'))
+@click.option('--verify',
+              is_flag=True,
+              help=('With --incremental, verify checksums of existing files '
+                    'rather than only their size.'))
+@click.option('--progress',
+              type=click.Choice(['bar', 'ndjson']),
+              default='bar',
+              show_default=True,
+              help=('Report the combined progress of all quads as a '
+                    'progress bar or as newline-delimited JSON.'))
+@chunk_size
+async def download(ctx,
+                   name_or_id,
+                   output_dir,
+                   bbox,
+                   geometry,
+                   incremental,
+                   verify,
+                   progress,
+                   chunk_size,
+                   **kwargs):
     """Download quads from a mosaic by name or ID
 
     Example:
@@ -264,9 +306,14 @@ async def download(ctx, name_or_id, output_dir, bbox, geometry, **kwargs):
     planet mosaics search global_monthly_2025_04_mosaic --bbox -100,40,-100,41
     """
     quiet = ctx.obj['QUIET']
-    async with client(ctx) as cl:
-        await cl.download_quads(name_or_id,
-                                bbox=bbox,
-                                geometry=geometry,
-                                directory=output_dir,
-                                progress_bar=not quiet)
+    with TransferProgress(disable=quiet,
+                          ndjson=progress == 'ndjson') as reporter:
+        async with client(ctx, progress=reporter) as cl:
+            await cl.download_quads(name_or_id,
+                                    bbox=bbox,
+                                    geometry=geometry,
+                                    directory=output_dir,
+                                    progress_bar=not quiet,
+                                    incremental=incremental,
+                                    verify=verify,
+                                    chunk_size=chunk_size)
@@ -26,3 +26,10 @@ pretty = click.option('--pretty', is_flag=True,
                       help='Format JSON output.')  # type: ignore
 
 compact = click.option('--compact', is_flag=True, help='Use compact output.')
+
+chunk_size = click.option(
+    '--chunk-size',
+    type=click.IntRange(min=1),
+    default=None,
+    help="""Size in bytes of the chunks to read downloads in. Defaults to the
+        size of the chunks received from the network.""")  # type: ignore
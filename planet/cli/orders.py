@@ -25,7 +25,7 @@ from . import types
 from .cmds import coro, translate_exceptions
 from ..order_request import sentinel_hub
 from .io import echo_json
-from .options import limit, pretty
+from .options import chunk_size, limit, pretty
 from .session import CliSession
 from ..specs import (FetchBundlesSpecError,
                      get_bundle_names,
@@ -281,7 +281,25 @@ async def wait(ctx, order_id, delay, max_attempts, state):
               is_flag=True,
               default=False,
               help=('Overwrite files if they already exist.'))
-async def download(ctx, order_id, overwrite, directory, checksum):
+@click.option('--incremental',
+              is_flag=True,
+              default=False,
+              help=('Record downloads in the base directory and only '
+                    'download files that are missing or invalid.'))
+@click.option('--verify',
+              is_flag=True,
+              default=False,
+              help=('With --incremental, verify checksums of existing files '
+                    'rather than only their size.'))
+@chunk_size
+async def download(ctx,
+                   order_id,
+                   overwrite,
+                   directory,
+                   checksum,
+                   incremental,
+                   verify,
+                   chunk_size):
     """Download order by order ID.
 
     If --checksum is provided, the associated checksums given in the manifest
@@ -290,6 +308,10 @@ async def download(ctx, order_id, overwrite, directory, checksum):
     If --checksum is provided, files are already downloaded, and --overwrite is
     not specified, this will simply validate the checksums of the files against
     the manifest.
+
+    If --incremental is provided, downloaded files are recorded in the base
+    directory and files that were recorded and are still valid are not
+    requested again when the command is rerun.
     """
     quiet = ctx.obj['QUIET']
     async with orders_client(ctx) as cl:
@@ -298,6 +320,9 @@ async def download(ctx, order_id, overwrite, directory, checksum):
             directory=Path(directory),
             overwrite=overwrite,
             progress_bar=not quiet,
+            incremental=incremental,
+            verify=verify,
+            chunk_size=chunk_size,
         )
         if checksum:
             cl.validate_checksum(Path(directory, str(order_id)), checksum)
@@ -9,7 +9,7 @@ from .cmds import coro, translate_exceptions
 from .io import echo_json
 from .options import limit, pretty
 from .session import CliSession
-from planet.clients.subscriptions import SubscriptionsClient
+from planet.clients.subscriptions import SubscriptionsClient, WINDOW_FILTERS
 from .. import subscription_request
 from ..subscription_request import sentinel_hub
 from ..specs import FetchBundlesSpecError, get_item_types, SpecificationException, validate_item_type
@@ -448,6 +448,24 @@ async def get_subscription_cmd(ctx, subscription_id, pretty):
 @click.option('--item-datetime',
               help="""Filter results by item datetime or interval (RFC 3339).
     See documentation for examples.""")
+@click.option('--windows',
+              type=click.IntRange(min=1),
+              default=1,
+              show_default=True,
+              help="""Split the results into this many time windows and get
+    them concurrently. Results from different windows are interleaved.""")
+@click.option('--window-by',
+              type=click.Choice(WINDOW_FILTERS),
+              default='created',
+              show_default=True,
+              help="""Filter to split into time windows. completed requires a
+    --completed filter.""")
+@click.option('--checkpoint',
+              type=click.Path(dir_okay=False),
+              help="""File recording the results already printed. Only results
+    updated since the previous run are printed and the file is updated if all
+    results were printed, so use with --limit 0. Cannot be used with --csv or
+    --updated.""")
 @limit
 @click.pass_context
 @translate_exceptions
@@ -461,6 +479,9 @@ async def list_subscription_results_cmd(ctx,
                                         updated,
                                         completed,
                                         item_datetime,
+                                        windows,
+                                        window_by,
+                                        checkpoint,
                                         limit):
     """Print the results of a subscription to stdout.
 
@@ -481,7 +502,24 @@ async def list_subscription_results_cmd(ctx,
         planet subscriptions results SUBSCRIPTION_ID --limit 0 --csv > results.csv
 
     Prints all results for a subscription and saves them to a CSV file.
+
+    \b
+        planet subscriptions results SUBSCRIPTION_ID --limit 0 --csv \\
+            --windows 8 --window-by item_datetime > results.csv
+
+    Gets the results of 8 windows of item datetime concurrently, which is
+    faster for subscriptions with many results.
+
+    \b
+        planet subscriptions results SUBSCRIPTION_ID --limit 0 \\
+            --checkpoint results-checkpoint.json
+
+    Prints only the results that are new or updated since the last time this
+    was run.
     """
+    if checkpoint and csv_flag:
+        raise click.UsageError('--checkpoint cannot be used with --csv')
+
     async with subscriptions_client(ctx) as client:
         if csv_flag:
             async for result in client.get_results_csv(
@@ -490,17 +528,21 @@ async def list_subscription_results_cmd(ctx,
                     created=created,
                     updated=updated,
                     completed=completed,
-                    item_datetime=item_datetime):
+                    item_datetime=item_datetime,
+                    windows=windows,
+                    window_by=window_by):
                 click.echo(result)
         else:
-            async for result in client.get_results(
-                    subscription_id,
-                    status=status,
-                    limit=limit,
-                    created=created,
-                    updated=updated,
-                    completed=completed,
-                    item_datetime=item_datetime):
+            async for result in client.get_results(subscription_id,
+                                                   status=status,
+                                                   limit=limit,
+                                                   created=created,
+                                                   updated=updated,
+                                                   completed=completed,
+                                                   item_datetime=item_datetime,
+                                                   windows=windows,
+                                                   window_by=window_by,
+                                                   checkpoint=checkpoint):
                 echo_json(result, pretty)
 
 
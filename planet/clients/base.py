@@ -1,5 +1,22 @@
-from typing import Any, AsyncIterator, Coroutine, Iterator, TypeVar
+import asyncio
+import logging
+from pathlib import Path
+from typing import (Any,
+                    AsyncIterable,
+                    AsyncIterator,
+                    Awaitable,
+                    Coroutine,
+                    Iterable,
+                    Iterator,
+                    Optional,
+                    Set,
+                    TypeVar,
+                    Union)
+from planet.exceptions import APIError
 from planet.http import Session
+from planet.models import _get_filename
+
+LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
@@ -25,3 +42,78 @@ class _BaseClient:
 
     def _aiter_to_iter(self, aiter: AsyncIterator[T]) -> Iterator[T]:
         return self._session._aiter_to_iter(aiter)
+
+    async def _existing_download(self,
+                                 location: str,
+                                 filename: Optional[str],
+                                 directory: Path,
+                                 preflight: bool) -> Optional[Path]:
+        """Find a previously downloaded file without downloading it again.
+
+        The file name is the given filename or, with preflight, the name
+        the server assigns to the resource as reported in response to a HEAD
+        request. Servers that refuse HEAD requests, e.g. with 403 or 405 for
+        signed URLs, are treated as if the name is unknown.
+
+        Returns:
+            Path to the existing file, None if the file does not exist or its
+            name cannot be determined.
+        """
+        if filename is None:
+            if not preflight:
+                return None
+            try:
+                async with self._session.stream(method='HEAD',
+                                                url=location) as resp:
+                    filename = _get_filename(resp)
+            except APIError as e:
+                LOGGER.debug(f'HEAD request failed, downloading: {e}')
+                return None
+            if not filename:
+                return None
+
+        path = Path(directory, filename)
+        if not path.exists():
+            return None
+
+        LOGGER.info(f'File {path} exists, not downloading')
+        return path
+
+
+async def _as_completed(jobs: Union[Iterable[Awaitable[T]],
+                                    AsyncIterable[Awaitable[T]]],
+                        concurrency: int) -> AsyncIterator[T]:
+    """Run jobs concurrently, yielding their results as they complete.
+
+    Jobs are taken from `jobs` only when fewer than `concurrency` are
+    running. Running jobs are cancelled if iteration stops early.
+    """
+    pending: Set[asyncio.Future] = set()
+    try:
+        async for job in _aiter(jobs):
+            pending.add(asyncio.ensure_future(job))
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _aiter(
+        values: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    """Iterate over a sync or async iterable."""
+    if isinstance(values, AsyncIterable):
+        async for value in values:
+            yield value
+    else:
+        for value in values:
+            yield value
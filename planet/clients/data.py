@@ -17,12 +17,12 @@ import hashlib
 import logging
 from pathlib import Path
 import time
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 import uuid
 
-from planet.clients.base import _BaseClient
+from planet.clients.base import _BaseClient, _as_completed
 
-from ..data_filter import empty_filter
+from ..data_filter import empty_filter, string_in_filter
 from .. import exceptions
 from ..constants import PLANET_BASE_URL
 from ..http import Session
@@ -49,6 +49,18 @@ SEARCH_SORT = ('published desc',
 SEARCH_SORT_DEFAULT = 'published desc'
 STATS_INTERVAL = ('hour', 'day', 'week', 'month', 'year')
 
+# maximum page size supported by the quick search endpoint, used as the
+# number of ids packed into each get_items() query
+GET_ITEMS_CHUNK_SIZE = 250
+
+# maximum number of items not returned by a search in get_items() that are
+# requested individually at a time
+GET_ITEMS_CONCURRENCY = 10
+
+# default maximum number of coverage requests in flight in
+# get_items_coverage(), the session limiter still applies
+COVERAGE_CONCURRENCY = 50
+
 WAIT_DELAY = 5
 WAIT_MAX_ATTEMPTS = 200
 
@@ -446,6 +458,96 @@ class DataClient(_BaseClient):
         response = await self._session.request(method="GET", url=url)
         return response.json()
 
+    async def get_items(
+        self,
+        item_type_id: str,
+        item_ids: Iterable[str],
+        chunk_size: int = GET_ITEMS_CHUNK_SIZE,
+        on_missing: Optional[Callable[[str],
+                                      None]] = None) -> AsyncIterator[dict]:
+        """Iterate over many items of one item type, fetched in bulk.
+
+        Item ids are packed into quick searches filtered on item id, so
+        fetching N items costs about N / chunk_size requests instead of N.
+        Ids that are not returned by a search are requested individually and
+        concurrently before being reported as missing.
+
+        Items are yielded in the order of item_ids. Missing items are skipped
+        and their ids are passed to on_missing.
+
+        Parameters:
+            item_type_id: Item type identifier.
+            item_ids: Item identifiers.
+            chunk_size: Maximum number of ids to include in each search.
+            on_missing: Function called with the id of each item that could
+                not be found.
+
+        Yields:
+            Description of an item.
+
+        Raises:
+            planet.exceptions.APIError: On API error.
+            planet.exceptions.ClientError: If chunk_size is not positive.
+        """
+        if chunk_size < 1:
+            raise exceptions.ClientError(
+                f'chunk_size ({chunk_size}) must be a positive integer.')
+
+        item_type_id = validate_data_item_type(item_type_id)
+
+        ids = list(item_ids)
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            found = await self._get_items_chunk(item_type_id, chunk)
+
+            for item_id in chunk:
+                try:
+                    yield found[item_id]
+                except KeyError:
+                    LOGGER.warning(f'Item {item_type_id}/{item_id} not found.')
+                    if on_missing:
+                        on_missing(item_id)
+
+    async def _get_items_chunk(self, item_type_id: str,
+                               item_ids: List[str]) -> Dict[str, dict]:
+        """Get a mapping of item id to description for a chunk of ids."""
+        unique_ids = list(dict.fromkeys(item_ids))
+        url = f'{self._base_url}/quick-search'
+        request_json = {
+            'filter': string_in_filter('id', unique_ids),
+            'item_types': [item_type_id]
+        }
+        response = await self._session.request(
+            method='POST',
+            url=url,
+            json=request_json,
+            params={'_page_size': len(unique_ids)})
+
+        found = {
+            i['id']: i
+            async for i in Items(response, self._session.request, limit=0)
+        }
+
+        # fall back to getting items that the search did not return
+        # individually, an item may be missing from search results while
+        # still being available by id
+        async def _get(item_id):
+            try:
+                return item_id, await self.get_item(item_type_id, item_id)
+            except exceptions.MissingResource:
+                return item_id, None
+
+        remaining = [i for i in unique_ids if i not in found]
+        if remaining:
+            LOGGER.debug(f'getting {len(remaining)} items individually')
+            jobs = (_get(i) for i in remaining)
+            async for item_id, item in _as_completed(jobs,
+                                                     GET_ITEMS_CONCURRENCY):
+                if item:
+                    found[item_id] = item
+
+        return found
+
     async def get_item_coverage(
         self,
         item_type_id: str,
@@ -469,16 +571,106 @@ class DataClient(_BaseClient):
         Raises:
             planet.exceptions.APIError: On API error.
         """
-        url = f"{self._item_url(item_type_id, item_id)}/coverage"
+        params = self._coverage_params(mode, band)
+        request_json = {'geometry': as_geom_or_ref(geometry)}
+        return await self._get_item_coverage(item_type_id,
+                                             item_id,
+                                             request_json,
+                                             params)
 
+    async def get_items_coverage(
+        self,
+        item_type_id: str,
+        item_ids: Iterable[str],
+        geometry: GeojsonLike,
+        mode: Optional[str] = None,
+        band: Optional[str] = None,
+        concurrency: int = COVERAGE_CONCURRENCY,
+        on_error: Optional[Callable[[str, exceptions.APIError], None]] = None
+    ) -> AsyncIterator[dict]:
+        """Estimate the clear coverage of many items within a custom AOI
+
+        Coverage requests are submitted concurrently, subject to the limits of
+        the session, and results are yielded as they complete. Item ids are
+        consumed lazily so that no more than `concurrency` requests are in
+        flight at a time.
+
+        Items whose coverage request fails, e.g. because the item does not
+        exist, are skipped and their ids and errors are passed to on_error.
+
+        Example:
+            ```python
+            async for result in cl.get_items_coverage('PSScene', ids, aoi):
+                print(result['item_id'], result['coverage']['clear_percent'])
+            ```
+
+        Parameters:
+            item_type_id: Item type identifier.
+            item_ids: Item identifiers.
+            geometry: A feature reference or a GeoJSON
+            mode: Method used for coverage calculation
+            band: Specific band to extract from UDM2
+            concurrency: Maximum number of coverage requests in flight.
+            on_error: Function called with the id and the error of each item
+                whose coverage could not be estimated.
+
+        Yields:
+            A dict with the `item_id`, the `coverage` description for the AOI
+            within the scene and the `latency` (in seconds) of the request.
+
+        Raises:
+            planet.exceptions.InvalidAPIKey: If the API key is not valid.
+            planet.exceptions.ClientError: If concurrency is not positive.
+        """
+        if concurrency < 1:
+            raise exceptions.ClientError(
+                f'concurrency ({concurrency}) must be a positive integer.')
+
+        # the geometry is the same for every item, only validate it once
+        params = self._coverage_params(mode, band)
+        request_json = {'geometry': as_geom_or_ref(geometry)}
+
+        async def _coverage(item_id):
+            start = time.monotonic()
+            try:
+                coverage = await self._get_item_coverage(
+                    item_type_id, item_id, request_json, params)
+            except exceptions.InvalidAPIKey:
+                # fails every item
+                raise
+            except exceptions.APIError as e:
+                LOGGER.warning(f'Coverage of {item_type_id}/{item_id} '
+                               f'failed: {e}')
+                if on_error:
+                    on_error(item_id, e)
+                return None
+            return {
+                'item_id': item_id,
+                'coverage': coverage,
+                'latency': time.monotonic() - start
+            }
+
+        jobs = (_coverage(item_id) for item_id in item_ids)
+        async for result in _as_completed(jobs, concurrency):
+            if result is not None:
+                yield result
+
+    @staticmethod
+    def _coverage_params(mode: Optional[str],
+                         band: Optional[str]) -> Dict[str, str]:
         params = {}
         if mode is not None:
             params["mode"] = mode
         if band is not None:
             params["band"] = band
+        return params
 
-        request_json = {'geometry': as_geom_or_ref(geometry)}
-
+    async def _get_item_coverage(self,
+                                 item_type_id: str,
+                                 item_id: str,
+                                 request_json: dict,
+                                 params: dict) -> dict:
+        url = f"{self._item_url(item_type_id, item_id)}/coverage"
         response = await self._session.request(method="POST",
                                                url=url,
                                                json=request_json,
@@ -627,7 +819,10 @@ class DataClient(_BaseClient):
                 raise exceptions.ClientError(
                     'asset missing ["_links"]["_self"] entry.')
 
-            response = await self._session.request(method='GET', url=asset_url)
+            # polling needs the current state, not a cached response
+            with self._session.bypass_cache():
+                response = await self._session.request(method='GET',
+                                                       url=asset_url)
             asset = response.json()
 
         if max_attempts and num_attempts >= max_attempts:
@@ -641,7 +836,9 @@ class DataClient(_BaseClient):
                              filename: Optional[str] = None,
                              directory: Path = Path('.'),
                              overwrite: bool = False,
-                             progress_bar: bool = True) -> Path:
+                             progress_bar: bool = True,
+                             preflight: bool = False,
+                             chunk_size: Optional[int] = None) -> Path:
         """Download an asset.
 
         The asset must be active before it can be downloaded. This can be
@@ -657,6 +854,12 @@ class DataClient(_BaseClient):
             directory: Base directory for file download.
             overwrite: Overwrite any existing files.
             progress_bar: Show progress bar during download.
+            preflight: If no filename is given, determine the name the
+                server assigns to the file with a HEAD request so that an
+                existing file is found without requesting the download.
+            chunk_size: Size in bytes of the chunks to read the download
+                in. Defaults to the size of the chunks received from the
+                network.
 
         Returns:
             Path to downloaded file.
@@ -672,13 +875,25 @@ class DataClient(_BaseClient):
             raise exceptions.ClientError(
                 'asset missing ["location"] entry. Is asset active?')
 
+        # an existing file is found before the download is requested, which
+        # saves the request and the transfer
+        if not overwrite:
+            existing = await self._existing_download(location,
+                                                     filename,
+                                                     directory,
+                                                     preflight)
+            if existing:
+                return existing
+
         async with self._session.stream(method='GET', url=location) as resp:
             body = StreamingBody(resp)
             dl_path = Path(directory, filename or body.name)
             dl_path.parent.mkdir(exist_ok=True, parents=True)
             await body.write(dl_path,
                              overwrite=overwrite,
-                             progress_bar=progress_bar)
+                             progress_bar=progress_bar,
+                             chunk_size=chunk_size,
+                             reporter=self._session.progress)
         return dl_path
 
     @staticmethod
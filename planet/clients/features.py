@@ -12,19 +12,50 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 
+import asyncio
+import hashlib
+from http import HTTPStatus
+import json
 import logging
-from typing import Any, AsyncIterator, Optional, Union, TypeVar
-
-from planet.clients.base import _BaseClient
+from typing import (Any,
+                    AsyncIterable,
+                    AsyncIterator,
+                    Iterable,
+                    List,
+                    Optional,
+                    Union,
+                    TypeVar)
+
+import httpx
+
+from planet import exceptions
+from planet.cache import FeatureCache
+from planet.clients.base import _BaseClient, _aiter, _as_completed
 from planet.exceptions import ClientError
 from planet.http import Session
 from planet.models import Feature, GeoInterface, Paged
 from planet.constants import PLANET_BASE_URL
+from planet.geojson import split_ref
 
 T = TypeVar("T")
 
 BASE_URL = f'{PLANET_BASE_URL}/features/v1/ogc/my/'
 
+# limits of the chunks uploaded by bulk_add_items
+MAX_CHUNK_FEATURES = 1000
+MAX_CHUNK_BYTES = 4 * 1024 * 1024
+
+# property storing the hash of a feature's content, see sync_items
+SYNC_HASH_PROPERTY = 'sync_hash'
+SYNC_MATCHES = ('id', 'hash')
+
+# errors after which a chunk is uploaded again, in addition to the retries
+# of each request by the session
+CHUNK_RETRY_EXCEPTIONS = (exceptions.ServerError,
+                          exceptions.BadGateway,
+                          exceptions.TooManyRequests,
+                          httpx.TransportError)
+
 LOGGER = logging.getLogger()
 
 
@@ -50,14 +81,19 @@ class FeaturesClient(_BaseClient):
 
     def __init__(self,
                  session: Session,
-                 base_url: Optional[str] = None) -> None:
+                 base_url: Optional[str] = None,
+                 feature_cache: Optional[FeatureCache] = None) -> None:
         """
         Parameters:
             session: Open session connected to server.
             base_url: The base URL to use. Defaults to the Features
                 API base url at api.planet.com.
+            feature_cache: Cache of features got with `get_item()`. Not
+                cached by default. Features the client deletes or adds are
+                removed from it.
         """
         super().__init__(session, base_url or BASE_URL)
+        self._feature_cache = feature_cache
 
     async def list_collections(self, limit: int = 0) -> AsyncIterator[dict]:
         """
@@ -163,10 +199,92 @@ class FeaturesClient(_BaseClient):
     async def get_item(self, collection_id: str, feature_id: str) -> Feature:
         """
         Return metadata for a single feature in a collection
+
+        If the client has a feature cache, a cached feature is returned
+        without contacting the server while it is fresh and is otherwise
+        revalidated with the server. To get the feature of a reference, use
+        `get_item(*split_ref(ref))`.
         """
         url = f'{self._base_url}/collections/{collection_id}/items/{feature_id}'
-        response = await self._session.request(method='GET', url=url)
-        return Feature(**response.json())
+        cache = self._feature_cache
+        if cache is None:
+            response = await self._session.request(method='GET', url=url)
+            return Feature(**response.json())
+
+        ref = _ref(collection_id, feature_id)
+        entry = cache.get(ref)
+        headers = None
+        if entry:
+            if cache.is_fresh(entry):
+                cache.hits += 1
+                cache.bytes_saved += len(entry.content)
+                return Feature(**json.loads(entry.content))
+            headers = entry.conditional_headers() or None
+
+        try:
+            response = await self._session.request(method='GET',
+                                                   url=url,
+                                                   headers=headers)
+        except exceptions.MissingResource:
+            cache.delete(ref)
+            raise
+
+        if entry and response.status_code == HTTPStatus.NOT_MODIFIED:
+            cache.revalidations += 1
+            cache.bytes_saved += len(entry.content)
+            cache.refresh(ref, entry)
+            return Feature(**json.loads(entry.content))
+
+        cache.misses += 1
+        feature = response.json()
+        cache.set_feature(ref, feature, etag=response.headers.get('etag'))
+        return Feature(**feature)
+
+    async def warm_cache(self, collection_id: str, prune: bool = True) -> int:
+        """
+        Fill the client's feature cache with the features of a collection.
+
+        The collection is listed in pages, which is much faster than getting
+        its features one at a time. Features that are unchanged keep their
+        `ETag`.
+
+        Parameters:
+            collection_id: The ID of the collection.
+            prune: Remove cached features that are no longer in the
+                collection.
+
+        Returns:
+            The number of features cached.
+
+        Raises:
+            planet.exceptions.ClientError: If the client has no feature
+                cache.
+
+        Example:
+
+        ```
+        cache = FeatureCache('~/.cache/planet/features')
+        cl = FeaturesClient(sess, feature_cache=cache)
+        await cl.warm_cache("my-collection-123")
+        for ref in refs:
+            # served from the cache
+            feature = await cl.get_item(*split_ref(ref))
+        ```
+        """
+        cache = self._feature_cache
+        if cache is None:
+            raise ClientError('The client has no feature cache')
+
+        refs = []
+        async for feature in self.list_items(collection_id, limit=0):
+            ref = _ref(collection_id, feature['id'])
+            cache.set_feature(ref, feature)
+            refs.append(ref)
+
+        if prune:
+            removed = cache.prune(collection_id, refs)
+            LOGGER.debug(f'pruned {removed} features from the cache')
+        return len(refs)
 
     async def delete_item(self, collection_id: str, feature_id: str) -> None:
         """
@@ -191,7 +309,11 @@ class FeaturesClient(_BaseClient):
             raise ClientError("Must provide a feature id")
 
         url = f'{self._base_url}/collections/{collection_id}/items/{feature_id}'
-        await self._session.request(method='DELETE', url=url)
+        try:
+            await self._session.request(method='DELETE', url=url)
+        finally:
+            if self._feature_cache is not None:
+                self._feature_cache.delete(_ref(collection_id, feature_id))
 
     async def create_collection(self,
                                 title: str,
@@ -239,7 +361,11 @@ class FeaturesClient(_BaseClient):
             raise ClientError("Must provide a collection id")
 
         url = f'{self._base_url}/collections/{collection_id}'
-        await self._session.request(method='DELETE', url=url)
+        try:
+            await self._session.request(method='DELETE', url=url)
+        finally:
+            if self._feature_cache is not None:
+                self._feature_cache.prune(collection_id)
 
     async def add_items(self,
                         collection_id: str,
@@ -279,17 +405,13 @@ class FeaturesClient(_BaseClient):
         The return value is always an iterator, even if you only upload one
         feature.
         """
-        if isinstance(feature, GeoInterface):
-            # we expect __geo_interface__ to return a Geometry (not a Feature), so
-            # we're using the name `feature` liberally. We'll convert to a feature
-            # at the next step.
-            feature = feature.__geo_interface__
-
-        # convert a geojson geometry into geojson feature
-        if feature.get("type",
-                       "").lower() not in ["feature", "featurecollection"]:
-            feature = {"type": "Feature", "geometry": feature}
+        feature = _as_feature(feature)
+        return await self._post_items(collection_id, feature, property_id)
 
+    async def _post_items(self,
+                          collection_id: str,
+                          feature: dict,
+                          property_id: Optional[str] = None) -> List[str]:
         url = f'{self._base_url}/collections/{collection_id}/items'
         params: dict[str, Any] = {}
         if property_id:
@@ -299,4 +421,326 @@ class FeaturesClient(_BaseClient):
                                            url=url,
                                            json=feature,
                                            params=params)
-        return list(resp.json())
+        refs = list(resp.json())
+        if self._feature_cache is not None:
+            # an added feature may replace a cached one with the same id
+            for ref in refs:
+                self._feature_cache.delete(ref)
+        return refs
+
+    async def bulk_add_items(self,
+                             collection_id: str,
+                             features: Union[
+                                 Iterable[Union[dict, GeoInterface]],
+                                 AsyncIterable[Union[dict, GeoInterface]]],
+                             property_id: Optional[str] = None,
+                             max_features: int = MAX_CHUNK_FEATURES,
+                             max_bytes: int = MAX_CHUNK_BYTES,
+                             concurrency: int = 4,
+                             retries: int = 2) -> AsyncIterator[str]:
+        """
+        Add many features to the collection given by `collection_id`.
+
+        Features are taken from `features` as they are needed and packed into
+        FeatureCollections of at most `max_features` features and
+        `max_bytes` bytes of JSON, which are uploaded `concurrency` at a
+        time. A feature larger than `max_bytes` is uploaded on its own.
+        Feature references are yielded as each upload completes, so they
+        are not in the order of `features`.
+
+        Requests are retried by the session as usual. If the upload of a
+        chunk still fails with a server, network or rate limit error, the
+        chunk is uploaded again up to `retries` times. An upload that failed
+        after reaching the server may have added some of its features, so
+        provide `property_id` to give features stable ids.
+
+        Example:
+
+        ```
+        with open("parcels.geojson") as f:
+            async for ref in features_client.bulk_add_items(
+                    "my-collection", planet.io.read_features(f)):
+                print(ref)
+        ```
+
+        Parameters:
+            collection_id: The collection to add the features to.
+            features: GeoJSON Features or geometries, or objects that
+                implement __geo_interface__, see `add_items()`.
+            property_id: The name of a property whose value will become the
+                id of each feature.
+            max_features: Maximum number of features in a chunk.
+            max_bytes: Maximum size of a chunk's JSON in bytes.
+            concurrency: Maximum number of chunks uploaded at a time.
+            retries: Number of times a failed chunk is uploaded again.
+
+        Raises:
+            planet.exceptions.APIError: On API error.
+            planet.exceptions.ClientError: If a limit is not positive.
+        """
+        if min(max_features, max_bytes, concurrency) < 1:
+            raise ClientError(
+                'max_features, max_bytes and concurrency must be positive.')
+
+        async def _upload(chunk):
+            collection = {"type": "FeatureCollection", "features": chunk}
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    return await self._post_items(collection_id,
+                                                  collection,
+                                                  property_id)
+                except CHUNK_RETRY_EXCEPTIONS as e:
+                    if attempt > retries:
+                        raise
+                    wait = self._session._calculate_wait(
+                        attempt, self._session.max_retry_backoff)
+                    LOGGER.info(f'Retrying chunk of {len(chunk)} features '
+                                f'in {wait}s: caught {type(e)}: {e}')
+                    await asyncio.sleep(wait)
+
+        async def _chunks():
+            chunk: List[dict] = []
+            size = 0
+            async for feature in _aiter(features):
+                feature = _as_feature(feature)
+                # separators and the FeatureCollection add a little more
+                feature_size = len(json.dumps(feature).encode()) + 2
+                if chunk and (len(chunk) == max_features
+                              or size + feature_size > max_bytes):
+                    yield chunk
+                    chunk, size = [], 0
+                chunk.append(feature)
+                size += feature_size
+            if chunk:
+                yield chunk
+
+        uploads = (_upload(chunk) async for chunk in _chunks())
+        async for refs in _as_completed(uploads, concurrency):
+            for ref in refs:
+                yield ref
+
+    async def delete_items(self,
+                           collection_id: str,
+                           feature_ids: Union[Iterable[str],
+                                              AsyncIterable[str]],
+                           concurrency: int = 8) -> AsyncIterator[str]:
+        """
+        Delete many features from a collection.
+
+        Features are deleted `concurrency` at a time and their ids are
+        yielded as each is deleted, so they are not in the order of
+        `feature_ids`.
+
+        Parameters:
+            collection_id: The ID of the collection containing the features.
+            feature_ids: The IDs or references of the features to delete.
+            concurrency: Maximum number of features deleted at a time.
+
+        Example:
+
+        ```
+        ids = [f["id"] async for f in features_client.list_items(
+            "my-collection", limit=0)]
+        async for feature_id in features_client.delete_items(
+                "my-collection", ids):
+            print(feature_id)
+        ```
+
+        Raises:
+            planet.exceptions.APIError: On API error.
+            planet.exceptions.ClientError: If concurrency is not positive.
+        """
+        if concurrency < 1:
+            raise ClientError(
+                f'concurrency ({concurrency}) must be a positive integer.')
+
+        async def _delete(feature_id):
+            await self.delete_item(collection_id, feature_id)
+            return feature_id
+
+        async def _ids():
+            async for feature_id in _aiter(feature_ids):
+                if feature_id.startswith("pl:features"):
+                    _, feature_id = split_ref(feature_id)
+                yield feature_id
+
+        deletes = (_delete(feature_id) async for feature_id in _ids())
+        async for feature_id in _as_completed(deletes, concurrency):
+            yield feature_id
+
+    async def sync_items(self,
+                         collection_id: str,
+                         features: Union[Iterable[Union[dict, GeoInterface]],
+                                         AsyncIterable[Union[dict,
+                                                             GeoInterface]]],
+                         property_id: Optional[str] = None,
+                         match: str = 'id',
+                         dry_run: bool = False,
+                         concurrency: int = 4) -> dict:
+        """
+        Make a collection contain the given features.
+
+        The features are compared with those in the collection and only the
+        differences are applied: features that are not in the collection
+        are added, features that changed are deleted and added again and
+        features that are not among the given features are deleted.
+        Deletes are made first, then additions, `concurrency` at a time.
+
+        Features are matched by id when `match` is 'id'. The id of a feature
+        is the value of its `property_id` property, or of its `id` property
+        or member if `property_id` is not given, and is used as the feature's
+        id in the collection. When `match` is 'hash', features are matched by
+        their content and a changed feature is deleted and added as a new
+        feature.
+
+        Features are compared using a hash of their geometry and properties,
+        which is stored in their `sync_hash` property when they are added.
+        Features in the collection without this property are considered
+        changed.
+
+        Example:
+
+        ```
+        with open("aois.geojson") as f:
+            report = await features_client.sync_items(
+                "my-collection", planet.io.read_features(f), dry_run=True)
+        print(report)
+        ```
+
+        Parameters:
+            collection_id: The collection to synchronize.
+            features: GeoJSON Features or geometries, or objects that
+                implement __geo_interface__.
+            property_id: The name of a property whose value is the id of
+                each feature.
+            match: 'id' or 'hash'.
+            dry_run: Report the changes without making them.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            A report of the ids of the features that were `added`, `updated`
+            and `deleted` (those of the collection) and the number that were
+            `unchanged`. With `match` 'hash', features are identified by
+            their hash.
+
+        Raises:
+            planet.exceptions.APIError: On API error.
+            planet.exceptions.ClientError: If match is not valid or a
+                feature has no id.
+        """
+        if match not in SYNC_MATCHES:
+            raise ClientError(f'match must be one of {SYNC_MATCHES}.')
+
+        local: dict[str, tuple[str, dict]] = {}
+        async for value in _aiter(features):
+            feature = _as_feature(value)
+            if feature.get("type", "").lower() == "featurecollection":
+                members = feature["features"]
+            else:
+                members = [feature]
+            for member in members:
+                properties = dict(member.get("properties") or {})
+                digest = _feature_hash(member)
+                properties[SYNC_HASH_PROPERTY] = digest
+                if match == 'hash':
+                    key = digest
+                else:
+                    key = _feature_key(member, property_id)
+                    if not property_id:
+                        # make the id of the feature in the collection the
+                        # same as its id here
+                        properties["id"] = key
+                local[key] = (digest, dict(member, properties=properties))
+
+        remote: dict[str, tuple[str, Optional[str]]] = {}
+        duplicates = []
+        async for item in self.list_items(collection_id, limit=0):
+            properties = item.get("properties") or {}
+            remote_digest = properties.get(SYNC_HASH_PROPERTY)
+            remote_key = remote_digest if match == 'hash' else item["id"]
+            if remote_key is None or remote_key in remote:
+                duplicates.append(item["id"])
+            else:
+                remote[remote_key] = (item["id"], remote_digest)
+
+        added = [k for k in local if k not in remote]
+        updated = [
+            k for k in local if k in remote and remote[k][1] != local[k][0]
+        ]
+        deleted = duplicates + [
+            feature_id
+            for k, (feature_id, _) in remote.items() if k not in local
+        ]
+        report = {
+            "added": added,
+            "updated": updated,
+            "deleted": deleted,
+            "unchanged": len(local) - len(added) - len(updated)
+        }
+        if dry_run:
+            return report
+
+        to_delete = deleted + [remote[k][0] for k in updated]
+        async for _ in self.delete_items(collection_id,
+                                         to_delete,
+                                         concurrency=concurrency):
+            pass
+        async for _ in self.bulk_add_items(
+                collection_id, [local[k][1] for k in added + updated],
+                property_id=property_id,
+                concurrency=concurrency):
+            pass
+        return report
+
+
+def _ref(collection_id: str, feature_id: str) -> str:
+    return f'pl:features/my/{collection_id}/{feature_id}'
+
+
+def _as_feature(feature: Union[dict, GeoInterface]) -> dict:
+    """Convert a geometry or __geo_interface__ to a Feature.
+
+    Features and FeatureCollections are returned as they are.
+    """
+    if isinstance(feature, GeoInterface):
+        # we expect __geo_interface__ to return a Geometry (not a Feature), so
+        # we're using the name `feature` liberally. We'll convert to a feature
+        # at the next step.
+        feature = feature.__geo_interface__
+
+    # convert a geojson geometry into geojson feature
+    if feature.get("type", "").lower() not in ["feature", "featurecollection"]:
+        feature = {"type": "Feature", "geometry": feature}
+    return feature
+
+
+def _feature_key(feature: dict, property_id: Optional[str]) -> str:
+    """The id of a feature for synchronization."""
+    properties = feature.get("properties") or {}
+    if property_id:
+        key = properties.get(property_id)
+    else:
+        key = properties.get("id", feature.get("id"))
+    if key is None:
+        name = f"property {property_id}" if property_id else "id"
+        raise ClientError(f"Feature has no {name}, use match='hash' to "
+                          "match features by their content.")
+    return str(key)
+
+
+def _feature_hash(feature: dict) -> str:
+    """Hash of the geometry and properties of a feature."""
+    properties = {
+        k: v
+        for k, v in (feature.get("properties") or {}).items()
+        if k != SYNC_HASH_PROPERTY
+    }
+    content = json.dumps(
+        {
+            "geometry": feature.get("geometry"), "properties": properties
+        },
+        sort_keys=True,
+        separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()
@@ -15,11 +15,14 @@
 import asyncio
 from pathlib import Path
 from typing import AsyncIterator, Optional, Sequence, Type, TypeVar, Union, cast
+from planet.cache import NameCache
 from planet.clients.base import _BaseClient
 from planet.constants import PLANET_BASE_URL
 from planet.exceptions import ClientError, MissingResource
 from planet.http import Session
+from planet.manifest import Manifest
 from planet.models import GeoInterface, Mosaic, Paged, Quad, Response, Series, StreamingBody
+from urllib.parse import urlparse
 from uuid import UUID
 
 BASE_URL = f'{PLANET_BASE_URL}/basemaps/v1'
@@ -75,20 +78,33 @@ class MosaicsClient(_BaseClient):
         ```
     """
 
-    def __init__(self, session: Session, base_url: Optional[str] = None):
+    def __init__(self,
+                 session: Session,
+                 base_url: Optional[str] = None,
+                 name_cache: Optional[NameCache] = None):
         """
         Parameters:
             session: Open session connected to server.
             base_url: The base URL to use. Defaults to production Mosaics
                 base url.
+            name_cache: Cache of mosaics and series looked up by name.
+                Defaults to an in-memory cache for this client, provide a
+                `planet.cache.NameCache` with a path to share lookups
+                between processes.
         """
         super().__init__(session, base_url or BASE_URL)
+        self._name_cache = NameCache() if name_cache is None else name_cache
 
     def _url(self, path: str) -> str:
         return f"{self._base_url}/{path}"
 
     async def _get_by_name(self, path: str, pager: Type[Paged],
                            name: str) -> dict:
+        key = f"{self._url(path)}?name__is={name}"
+        cached = self._name_cache.get(key)
+        if cached is not None:
+            return cached
+
         response = await self._session.request(
             method='GET',
             url=self._url(path),
@@ -98,6 +114,7 @@ class MosaicsClient(_BaseClient):
         )
         listing = response.json()[pager.ITEMS_KEY]
         if len(listing):
+            self._name_cache.set(key, listing[0])
             return listing[0]
         # mimic the response for 404 when search is empty
         resource = "Mosaic"
@@ -436,10 +453,28 @@ class MosaicsClient(_BaseClient):
                             *,
                             directory: str = ".",
                             overwrite: bool = False,
-                            progress_bar: bool = False):
+                            progress_bar: bool = False,
+                            manifest: Optional[Manifest] = None,
+                            chunk_size: Optional[int] = None):
         """
         Download a quad to a directory.
 
+        Parameters:
+            quad: The quad to download.
+            directory: Directory to download the quad to.
+            overwrite: Overwrite an existing file.
+            progress_bar: Show a progress bar.
+            manifest: Record of previously downloaded quads. If provided, an
+                existing file is skipped only if it matches the record and
+                the quad has not changed since, otherwise it is downloaded
+                again and recorded. A quad has changed if its download path
+                or percent_covered has. The API does not report when a quad
+                was published, so a republished quad with the same path and
+                coverage is not detected.
+            chunk_size: Size in bytes of the chunks to read the download
+                in. Defaults to the size of the chunks received from the
+                network.
+
         Example:
 
         ```python
@@ -454,14 +489,25 @@ class MosaicsClient(_BaseClient):
         # get counted as a download even if only the headers were read
         # and the response content is ignored (like if when the file
         # exists and overwrite is False)
-        if dest.exists() and not overwrite:
+        if manifest is not None:
+            source = _quad_source(quad)
+            if not overwrite and await manifest.is_current(
+                    quad["id"], dest, source):
+                return
+            # an unrecorded or stale file is replaced
+            overwrite = True
+        elif dest.exists() and not overwrite:
             return
         async with self._session.stream(method='GET', url=url) as resp:
             await StreamingBody(resp).write(
                 dest,
                 # pass along despite our manual handling
                 overwrite=overwrite,
-                progress_bar=progress_bar)
+                progress_bar=progress_bar,
+                chunk_size=chunk_size,
+                reporter=self._session.progress)
+        if manifest is not None:
+            await manifest.record(quad["id"], dest, source)
 
     async def download_quads(self,
                              /,
@@ -473,10 +519,37 @@ class MosaicsClient(_BaseClient):
                              geometry: Optional[Union[dict,
                                                       GeoInterface]] = None,
                              progress_bar: bool = False,
-                             concurrency: int = 4):
+                             concurrency: int = 4,
+                             incremental: bool = False,
+                             verify: bool = False,
+                             chunk_size: Optional[int] = None):
         """
         Download a mosaics' quads to a directory.
 
+        With `incremental`, downloads are recorded in a manifest in the
+        directory (see `planet.manifest`) and reruns only download quads
+        that are new, changed or whose file does not match the record.
+        Existing files that were not recorded are downloaded again. Quads
+        republished without a change to their download path or coverage
+        are not detected (see `download_quad`), so use `overwrite` to
+        refresh a mosaic that was republished in place.
+
+        Parameters:
+            mosaic: The mosaic or its name or id.
+            directory: Directory to download quads to. Defaults to the
+                mosaic name.
+            overwrite: Overwrite existing files.
+            bbox: Region to download quads for.
+            geometry: Region to download quads for.
+            progress_bar: Show progress bars.
+            concurrency: Number of quads to download at a time.
+            incremental: Use a manifest to skip unchanged quads.
+            verify: With `incremental`, verify the checksums of existing
+                files rather than only their size.
+            chunk_size: Size in bytes of the chunks to read the download
+                in. Defaults to the size of the chunks received from the
+                network.
+
         Raises:
             ClientError: if `geometry` or `bbox` is not specified.
 
@@ -492,6 +565,7 @@ class MosaicsClient(_BaseClient):
         jobs = []
         mosaic = await self._resolve_mosaic(mosaic)
         directory = directory or mosaic["name"]
+        manifest = Manifest(directory, verify=verify) if incremental else None
         async for q in self.list_quads(mosaic,
                                        minimal=True,
                                        bbox=bbox,
@@ -500,8 +574,24 @@ class MosaicsClient(_BaseClient):
                 self.download_quad(q,
                                    directory=directory,
                                    overwrite=overwrite,
-                                   progress_bar=progress_bar))
+                                   progress_bar=progress_bar,
+                                   manifest=manifest,
+                                   chunk_size=chunk_size))
             if len(jobs) == concurrency:
                 await asyncio.gather(*jobs)
                 jobs = []
         await asyncio.gather(*jobs)
+
+
+def _quad_source(quad: Quad) -> dict:
+    """Information identifying the published version of a quad.
+
+    Quads have no publication time or version, so a republished quad is
+    only told apart by its download path and percent_covered.
+    """
+    # the query string of the download link may hold credentials
+    download = urlparse(quad["_links"]["download"])._replace(query="")
+    return {
+        "download": download.geturl(),
+        "percent_covered": quad.get("percent_covered"),
+    }
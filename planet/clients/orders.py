@@ -27,12 +27,14 @@ from planet.clients.base import _BaseClient
 from .. import exceptions
 from ..constants import PLANET_BASE_URL
 from ..http import Session
+from ..manifest import Manifest
 from ..models import Paged, StreamingBody
 
 BASE_URL = f'{PLANET_BASE_URL}/compute/ops'
 STATS_PATH = '/stats/orders/v2'
 ORDERS_PATH = '/orders/v2'
 BULK_PATH = '/bulk/orders/v2'
+ORDER_MANIFEST = 'manifest.json'
 
 # Order states https://docs.planet.com/develop/apis/orders/#states
 # this is in order of state progression except for final states
@@ -235,7 +237,10 @@ class OrdersClient(_BaseClient):
                              filename: Optional[str] = None,
                              directory: Path = Path('.'),
                              overwrite: bool = False,
-                             progress_bar: bool = True) -> Path:
+                             progress_bar: bool = True,
+                             preflight: bool = False,
+                             chunk_size: Optional[int] = None,
+                             digest: Optional[str] = None) -> Path:
         """Download ordered asset.
 
         Parameters:
@@ -245,35 +250,71 @@ class OrdersClient(_BaseClient):
                 created if it does not already exist.
             overwrite: Overwrite any existing files.
             progress_bar: Show progress bar during download.
+            preflight: If no filename is given, determine the name the
+                server assigns to the file with a HEAD request so that an
+                existing file is found without requesting the download.
+            chunk_size: Size in bytes of the chunks to read the download
+                in. Defaults to the size of the chunks received from the
+                network.
+            digest: Expected md5 hex digest of the asset.
 
         Returns:
             Path to downloaded file.
 
         Raises:
             planet.exceptions.APIError: On API error.
+            planet.exceptions.DownloadError: If the download is incomplete or
+                does not match the digest.
         """
+        # an existing file is found before the download is requested, which
+        # saves the request and the transfer
+        if not overwrite:
+            existing = await self._existing_download(location,
+                                                     filename,
+                                                     directory,
+                                                     preflight)
+            if existing:
+                return existing
+
         async with self._session.stream(method='GET', url=location) as resp:
             body = StreamingBody(resp)
             dl_path = Path(directory, filename or body.name)
             dl_path.parent.mkdir(exist_ok=True, parents=True)
             await body.write(dl_path,
                              overwrite=overwrite,
-                             progress_bar=progress_bar)
+                             progress_bar=progress_bar,
+                             chunk_size=chunk_size,
+                             digest=digest,
+                             reporter=self._session.progress)
         return dl_path
 
     async def download_order(self,
                              order_id: str,
                              directory: Path = Path('.'),
                              overwrite: bool = False,
-                             progress_bar: bool = False) -> List[Path]:
+                             progress_bar: bool = False,
+                             incremental: bool = False,
+                             verify: bool = False,
+                             chunk_size: Optional[int] = None) -> List[Path]:
         """Download all assets in an order.
 
+        With `incremental`, downloads are recorded in a manifest in the base
+        directory (see `planet.manifest`) and reruns only request assets
+        that are missing or whose file does not match the record. Existing
+        files that were not recorded are downloaded again.
+
         Parameters:
             order_id: The ID of the order.
             directory: Base directory for file download. This directory must
                 already exist.
             overwrite: Overwrite files if they already exist.
             progress_bar: Show progress bar during download.
+            incremental: Use a manifest to skip assets already downloaded.
+            verify: With `incremental`, verify the checksums of existing
+                files rather than only their size.
+            chunk_size: Size in bytes of the chunks to read the download
+                in. Defaults to the size of the chunks received from the
+                network.
 
         Returns:
             Paths to downloaded files.
@@ -295,15 +336,67 @@ class OrdersClient(_BaseClient):
         info = self._get_download_info(order)
         LOGGER.info(f'downloading {len(info)} assets from order {order_id}')
 
-        filenames = [
-            await self.download_asset(i['location'],
-                                      filename=i['filename'],
-                                      directory=directory / i['directory'],
-                                      overwrite=overwrite,
-                                      progress_bar=progress_bar) for i in info
-        ]
+        manifest = Manifest(directory, verify=verify) if incremental else None
+
+        async def _download(i, digest=None):
+            if manifest is None:
+                return await self.download_asset(i['location'],
+                                                 filename=i['filename'],
+                                                 directory=directory /
+                                                 i['directory'],
+                                                 overwrite=overwrite,
+                                                 progress_bar=progress_bar,
+                                                 chunk_size=chunk_size,
+                                                 digest=digest)
+
+            # the asset is checked before a download is requested
+            path = Path(directory, i['directory'], i['filename'])
+            key = Path(i['directory'], i['filename']).as_posix()
+            if not overwrite and await manifest.is_current(key, path):
+                LOGGER.info(f'{path} already downloaded, skipping')
+                return path
+
+            # an unrecorded or invalid file is replaced
+            path = await self.download_asset(i['location'],
+                                             filename=i['filename'],
+                                             directory=path.parent,
+                                             overwrite=True,
+                                             progress_bar=progress_bar,
+                                             chunk_size=chunk_size,
+                                             digest=digest)
+            await manifest.record(key, path)
+            return path
+
+        # the order manifest is downloaded first so that the other assets
+        # are checked against its digests as they are written
+        filenames = {}
+        digests: Dict[str, str] = {}
+        for n, i in enumerate(info):
+            if i['filename'] == ORDER_MANIFEST:
+                filenames[n] = await _download(i)
+                digests.update(
+                    self._manifest_digests(filenames[n], i['directory']))
+
+        for n, i in enumerate(info):
+            if n not in filenames:
+                key = Path(i['directory'], i['filename']).as_posix()
+                filenames[n] = await _download(i, digests.get(key))
+
+        return [filenames[n] for n in range(len(info))]
 
-        return filenames
+    @staticmethod
+    def _manifest_digests(path: Path, directory: Path) -> Dict[str, str]:
+        """md5 digests of the files listed in an order manifest, by path."""
+        try:
+            files = json.loads(Path(path).read_text())['files']
+            return {
+                Path(directory, f['path']).as_posix(): f['digests']['md5']
+                for f in files
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            LOGGER.warning(f'Order manifest {path} cannot be read, '
+                           'downloads are not checked against it.')
+            return {}
 
     @staticmethod
     def _get_download_info(order):
@@ -343,7 +436,7 @@ class OrdersClient(_BaseClient):
             planet.exceptions.ClientError: If a file is missing or if checksums
                 do not match.
         """
-        manifest_path = directory / 'manifest.json'
+        manifest_path = directory / ORDER_MANIFEST
 
         try:
             manifest_data = json.loads(manifest_path.read_text())
@@ -439,7 +532,9 @@ class OrdersClient(_BaseClient):
         while not max_attempts or num_attempts < max_attempts:
             t = time.time()
 
-            order = await self.get_order(order_id)
+            # polling needs the current state, not a cached response
+            with self._session.bypass_cache():
+                order = await self.get_order(order_id)
             current_state = order['state']
 
             LOGGER.debug(current_state)
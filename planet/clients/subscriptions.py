@@ -1,18 +1,33 @@
 """Planet Subscriptions API Python client."""
 
+import asyncio
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+import json
 import logging
-from typing import Any, AsyncIterator, Dict, Optional, Sequence, TypeVar, List, Union
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Sequence, Set, TypeVar, List, Union
 
+import httpx
 from typing_extensions import Literal
 
 from planet.clients.base import _BaseClient
 from planet.exceptions import APIError, ClientError
 from planet.http import Session
+from planet.io import RFC3339_FORMAT, write_atomic
 from planet.models import Paged
 from ..constants import PLANET_BASE_URL
 
 BASE_URL = f'{PLANET_BASE_URL}/subscriptions/v1/'
 
+# errors while receiving a results CSV after which it is resumed
+STREAM_RETRY_EXCEPTIONS = (httpx.ReadError,
+                           httpx.ReadTimeout,
+                           httpx.RemoteProtocolError)
+
+# results filters that get_results can split into time windows
+WINDOW_FILTERS = ('created', 'completed', 'item_datetime')
+
 LOGGER = logging.getLogger()
 
 T = TypeVar("T")
@@ -526,7 +541,12 @@ class SubscriptionsClient(_BaseClient):
             created: Optional[str] = None,
             updated: Optional[str] = None,
             completed: Optional[str] = None,
-            item_datetime: Optional[str] = None) -> AsyncIterator[dict]:
+            item_datetime: Optional[str] = None,
+            windows: int = 1,
+            window_by: Literal["created", "completed",
+                               "item_datetime"] = "created",
+            checkpoint: Optional[Union[str,
+                                       Path]] = None) -> AsyncIterator[dict]:
         """Iterate over results of a Subscription.
 
         Notes:
@@ -544,6 +564,16 @@ class SubscriptionsClient(_BaseClient):
             updated (str): filter by updated time or interval.
             completed (str): filter by completed time or interval.
             item_datetime (str): filter by item datetime or interval.
+            windows (int): number of time windows to split the results
+                into and get concurrently. Results from different windows
+                are interleaved.
+            window_by (str): the filter to split into windows, "created",
+                "completed" or "item_datetime". "completed" requires a
+                completed filter.
+            checkpoint (str or Path): JSON file recording the results
+                already iterated over. Only results updated since are
+                yielded and the file is updated once all results have
+                been iterated over. Cannot be used with `updated`.
 
         Datetime args (created, updated, completed, item_datetime) can either be a
         date-time or an interval, open or closed. Date and time expressions adhere
@@ -554,6 +584,19 @@ class SubscriptionsClient(_BaseClient):
             * A closed interval: "2018-02-12T00:00:00Z/2018-03-18T12:31:12Z"
             * Open intervals: "2018-02-12T00:00:00Z/.." or "../2018-03-18T12:31:12Z"
 
+        Open ends of the `window_by` interval are kept open in the first and
+        last windows. The windows are spaced between the ends of the
+        interval or, for open ends, the creation of the subscription (or
+        the start and end times of its source for "item_datetime") and now.
+
+        With a checkpoint, each call only requests results updated since
+        the latest update time recorded by the previous call and skips the
+        results updated at that time that were already yielded. The file
+        is updated only if iteration completes and fewer than `limit`
+        results were received, so use `limit=0`. A file can record the
+        results of several subscriptions, but must be used with the same
+        filters each time.
+
         Yields:
             dict: description of a subscription results.
 
@@ -578,35 +621,142 @@ class SubscriptionsClient(_BaseClient):
         if item_datetime is not None:
             params['item_datetime'] = item_datetime
 
+        cursor = None
+        if checkpoint is not None:
+            if updated is not None:
+                raise ClientError('updated cannot be used with a checkpoint')
+            cursor = _Checkpoint(checkpoint, subscription_id)
+            if cursor.updated:
+                params['updated'] = f'{cursor.updated}/..'
+
         url = f'{self._base_url}/{subscription_id}/results'
 
-        try:
-            resp = await self._session.request(method='GET',
-                                               url=url,
-                                               params=params)
-            async for sub in _ResultsPager(resp,
-                                           self._session.request,
-                                           limit=limit):
+        async def _results(window_params):
+            try:
+                resp = await self._session.request(method='GET',
+                                                   url=url,
+                                                   params=window_params)
+                async for sub in _ResultsPager(resp,
+                                               self._session.request,
+                                               limit=limit):
+                    yield sub
+            # Forward APIError. We don't strictly need this clause, but it
+            # makes our intent clear.
+            except APIError:
+                raise
+            except ClientError:  # pragma: no cover
+                raise
+
+        async def _all():
+            windowed = await self._windows(subscription_id,
+                                           params,
+                                           windows,
+                                           window_by)
+            if len(windowed) == 1:
+                async for sub in _results(windowed[0]):
+                    yield sub
+                return
+
+            count = 0
+            async for sub in _merge([_results(p) for p in windowed]):
                 yield sub
-        # Forward APIError. We don't strictly need this clause, but it
-        # makes our intent clear.
-        except APIError:
-            raise
-        except ClientError:  # pragma: no cover
-            raise
+                count += 1
+                if count == limit:
+                    break
+
+        if cursor is None:
+            async for sub in _all():
+                yield sub
+            return
+
+        received = 0
+        async for sub in _all():
+            received += 1
+            if cursor.is_new(sub):
+                yield sub
+
+        # results are not ordered by update time, so the checkpoint can
+        # only be advanced once all of them have been received
+        if limit and received >= limit:
+            LOGGER.warning(f'Not updating checkpoint {cursor.path}: '
+                           f'the limit of {limit} results was reached')
+        else:
+            cursor.save()
+
+    async def _windows(self,
+                       subscription_id: str,
+                       params: Dict[str, Any],
+                       windows: int,
+                       window_by: str) -> List[Dict[str, Any]]:
+        """Split request parameters into consecutive time windows."""
+        if windows < 1:
+            raise ClientError(f'windows must be at least 1, got {windows}')
+        if window_by not in WINDOW_FILTERS:
+            raise ClientError(f'window_by must be one of {WINDOW_FILTERS}, '
+                              f'got {window_by}')
+        if windows == 1:
+            return [params]
+        if window_by == 'completed' and 'completed' not in params:
+            # every window filters by completion, which would leave out
+            # results that have not completed
+            raise ClientError('window_by "completed" requires a completed '
+                              'filter')
+
+        interval = params.get(window_by) or '../..'
+        if '/' not in interval:
+            # a single date-time cannot be split
+            return [params]
+        start_text, end_text = interval.split('/', 1)
+        start = None if start_text in ('', '..') else _utc(start_text)
+        end = None if end_text in ('', '..') else _utc(end_text)
+
+        lower, upper = start, end
+        if lower is None or (upper is None and window_by == 'item_datetime'):
+            sub = await self.get_subscription(subscription_id)
+            if window_by == 'item_datetime':
+                source = sub.get('source', {}).get('parameters', {})
+                first, last = source.get('start_time'), source.get('end_time')
+            else:
+                first, last = sub.get('created'), None
+            if lower is None and first:
+                lower = _utc(first)
+            if upper is None and last:
+                upper = _utc(last)
+        if upper is None:
+            upper = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        if lower is None or upper - lower < timedelta(seconds=windows):
+            LOGGER.debug(f'not splitting {window_by} interval {interval}')
+            return [params]
+
+        step = (upper - lower) / windows
+        bounds = [lower + i * step for i in range(1, windows)]
+        starts = [_rfc3339(start) if start else '..'
+                  ] + [_rfc3339(b) for b in bounds]
+        # windows end just before the next starts, so that a result is in
+        # exactly one of them
+        ends = [_rfc3339(b - timedelta(microseconds=1))
+                for b in bounds] + [_rfc3339(end) if end else '..']
+        return [
+            dict(params, **{window_by: f'{s}/{e}'})
+            for s, e in zip(starts, ends)
+        ]
 
     async def get_results_csv(
-            self,
-            subscription_id: str,
-            status: Optional[Sequence[Literal["created",
-                                              "queued",
-                                              "processing",
-                                              "failed",
-                                              "success"]]] = None,
-            created: Optional[str] = None,
-            updated: Optional[str] = None,
-            completed: Optional[str] = None,
-            item_datetime: Optional[str] = None) -> AsyncIterator[str]:
+        self,
+        subscription_id: str,
+        status: Optional[Sequence[Literal["created",
+                                          "queued",
+                                          "processing",
+                                          "failed",
+                                          "success"]]] = None,
+        created: Optional[str] = None,
+        updated: Optional[str] = None,
+        completed: Optional[str] = None,
+        item_datetime: Optional[str] = None,
+        windows: int = 1,
+        window_by: Literal["created", "completed", "item_datetime"] = "created"
+    ) -> AsyncIterator[str]:
         """Iterate over rows of results CSV for a Subscription.
 
         Parameters:
@@ -617,6 +767,13 @@ class SubscriptionsClient(_BaseClient):
             updated (str): filter by updated time or interval.
             completed (str): filter by completed time or interval.
             item_datetime (str): filter by item datetime or interval.
+            windows (int): number of time windows to split the results
+                into and get concurrently, see `get_results()`. The header
+                row is yielded once and rows from different windows are
+                interleaved.
+            window_by (str): the filter to split into windows, "created",
+                "completed" or "item_datetime". "completed" requires a
+                completed filter.
 
         Datetime args (created, updated, completed, item_datetime) can either be a
         date-time or an interval, open or closed. Date and time expressions adhere
@@ -627,6 +784,10 @@ class SubscriptionsClient(_BaseClient):
             * A closed interval: "2018-02-12T00:00:00Z/2018-03-18T12:31:12Z"
             * Open intervals: "2018-02-12T00:00:00Z/.." or "../2018-03-18T12:31:12Z"
 
+        If the CSV is interrupted by a network error, the request is
+        reissued and rows continue from where they stopped, without
+        repeating rows.
+
         Yields:
             str: a row from a CSV file.
 
@@ -647,14 +808,92 @@ class SubscriptionsClient(_BaseClient):
         if item_datetime is not None:
             params['item_datetime'] = item_datetime
 
-        # Note: retries are not implemented yet. This project has
-        # retry logic for HTTP requests, but does not handle errors
-        # during streaming. We may want to consider a retry decorator
-        # for this entire method a la stamina:
-        # https://github.com/hynek/stamina.
-        async with self._session.stream('GET', url, params=params) as response:
-            async for line in response.aiter_lines():
+        windowed = await self._windows(subscription_id,
+                                       params,
+                                       windows,
+                                       window_by)
+        if len(windowed) == 1:
+            async for line in self._stream_lines(url, windowed[0]):
                 yield line
+            return
+
+        async def _tagged(window_params):
+            is_header = True
+            async for line in self._stream_lines(url, window_params):
+                yield is_header, line
+                is_header = False
+
+        # every window starts with the same header row
+        header_sent = False
+        async for is_header, line in _merge([_tagged(p) for p in windowed]):
+            if is_header:
+                if header_sent:
+                    continue
+                header_sent = True
+            yield line
+
+    async def _stream_lines(self, url: str,
+                            params: Dict[str, Any]) -> AsyncIterator[str]:
+        """Stream the lines of a response, resuming after interruptions.
+
+        If the response is interrupted, the request is reissued and lines
+        that were already yielded are not yielded again. The rest of the
+        response is requested with a Range header if the server accepts
+        ranges and otherwise the lines already yielded are skipped, which
+        requires the server to respond with the same lines in the same
+        order.
+        """
+        lines = 0  # number of lines yielded
+        offset = 0  # bytes of the lines yielded
+        length = None  # bytes of the whole response, if known
+        ranges = False
+        num_tries = 0
+        while True:
+            headers = None
+            if ranges and offset:
+                if length is not None and offset >= length:
+                    return
+                headers = {'Range': f'bytes={offset}-'}
+
+            try:
+                async with self._session.stream('GET',
+                                                url,
+                                                params=params,
+                                                headers=headers) as response:
+                    resumed = (headers is not None and response.status_code
+                               == HTTPStatus.PARTIAL_CONTENT)
+                    if resumed:
+                        index, position = lines, offset
+                    else:
+                        # the response starts from the beginning
+                        index, position = 0, 0
+                        ranges = _accepts_ranges(response.headers)
+                        if 'content-length' in response.headers:
+                            length = int(response.headers['content-length'])
+
+                    buffer = b''
+                    async for chunk in response.aiter_bytes():
+                        buffer += chunk
+                        *complete, buffer = buffer.split(b'\n')
+                        for line in complete:
+                            index += 1
+                            position += len(line) + 1
+                            if index > lines:
+                                lines, offset = index, position
+                                yield _decode_line(line)
+                    if buffer and index + 1 > lines:
+                        lines, offset = index + 1, position + len(buffer)
+                        yield _decode_line(buffer)
+                return
+            except STREAM_RETRY_EXCEPTIONS as e:
+                num_tries += 1
+                if num_tries > self._session.max_retries:
+                    raise
+                wait_time = self._session._calculate_wait(
+                    num_tries, self._session.max_retry_backoff)
+                LOGGER.info(f'Resuming after {lines} lines in {wait_time}s: '
+                            f'caught {type(e)}: {e}')
+                await asyncio.sleep(wait_time)
 
     async def get_summary(self) -> dict:
         """Summarize the status of all subscriptions via GET.
@@ -709,3 +948,110 @@ class SubscriptionsClient(_BaseClient):
         else:
             summary = resp.json()
             return summary
+
+
+def _utc(text: str) -> datetime:
+    """Parse an RFC 3339 date-time as a naive UTC datetime."""
+    # datetime.fromisoformat only accepts a 'Z' suffix from Python 3.11
+    value = text[:-1] + '+00:00' if text.endswith(('Z', 'z')) else text
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        # before Python 3.11, fractions must have 3 or 6 digits
+        try:
+            dt = datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f%z')
+        except ValueError:
+            raise ClientError(f'{text} is not an RFC 3339 date-time')
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _rfc3339(dt: datetime) -> str:
+    return dt.strftime(RFC3339_FORMAT)
+
+
+def _accepts_ranges(headers: httpx.Headers) -> bool:
+    # ranges of an encoded response are ranges of the encoded bytes, not of
+    # the decoded bytes that are counted
+    return (headers.get('accept-ranges') == 'bytes'
+            and headers.get('content-encoding', 'identity') == 'identity')
+
+
+def _decode_line(line: bytes) -> str:
+    return line.rstrip(b'\r').decode('utf-8', errors='replace')
+
+
+async def _merge(iterators: Sequence[AsyncIterator[T]]) -> AsyncIterator[T]:
+    """Yield the items of async iterators, concurrently, as they arrive."""
+    pending = {asyncio.ensure_future(it.__anext__()): it for it in iterators}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                it = pending.pop(task)
+                try:
+                    item = task.result()
+                except StopAsyncIteration:
+                    continue
+                pending[asyncio.ensure_future(it.__anext__())] = it
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+class _Checkpoint:
+    """Latest update time of the results of a subscription, kept in a file.
+
+    The ids of the results updated at that time are kept as well, as results
+    updated at that time are received again by the next request.
+    """
+
+    def __init__(self, path: Union[str, Path], subscription_id: str):
+        self.path = Path(path).expanduser()
+        self.subscription_id = subscription_id
+        state = self._load().get(subscription_id) or {}
+        self.updated: Optional[str] = state.get('updated')
+        self.ids: Set[str] = set(state.get('ids', []))
+        self._since = _utc(self.updated) if self.updated else None
+        self._since_ids = set(self.ids)
+        self._latest = self._since
+
+    def is_new(self, result: dict) -> bool:
+        """Whether a result is new since the checkpoint, recording it."""
+        text, result_id = result.get('updated'), result.get('id')
+        if not text or result_id is None:
+            return True
+        updated = _utc(text)
+        if self._since and (updated < self._since or
+                            (updated == self._since
+                             and result_id in self._since_ids)):
+            return False
+
+        if self._latest is None or updated > self._latest:
+            self._latest, self.updated = updated, text
+            self.ids = {result_id}
+        elif updated == self._latest:
+            self.ids.add(result_id)
+        return True
+
+    def save(self):
+        if not self.updated:
+            return
+        state = self._load()
+        state[self.subscription_id] = {
+            'updated': self.updated, 'ids': sorted(self.ids)
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path, json.dumps(state, indent=2))
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            raise ClientError(f'Invalid checkpoint file {self.path}: {e}')
@@ -218,7 +218,9 @@ def update_filter(field_name: str,
                          callback=_datetime_to_rfc3339)
 
 
-def geometry_filter(geom: dict, relation: Optional[str] = None) -> dict:
+def geometry_filter(geom: dict,
+                    relation: Optional[str] = None,
+                    max_vertices: Optional[int] = None) -> dict:
     """Create a GeometryFilter
 
     The GeometryFilter can be used to search for items with a footprint
@@ -239,10 +241,16 @@ def geometry_filter(geom: dict, relation: Optional[str] = None) -> dict:
             collection.
         relation: Optional geometry search refinement, defaults to intersects.
             May also be contains, within, or disjoint.
+        max_vertices: Simplify the geometry to at most this many vertices,
+            see `planet.geojson.simplify_geom()`.
     """
+    if max_vertices is not None:
+        config = geojson.simplify_geom(geom, max_vertices=max_vertices)
+    else:
+        config = geojson.validate_geom_as_geojson(geom)
     geom_filter = _field_filter('GeometryFilter',
                                 field_name='geometry',
-                                config=geojson.validate_geom_as_geojson(geom))
+                                config=config)
     if relation:
         allowed = {"intersects", "contains", "disjoint", "within"}
         if relation not in allowed:
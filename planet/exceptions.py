@@ -83,6 +83,10 @@ class PagingError(ClientError):
     pass
 
 
+class DownloadError(ClientError):
+    """Errors that occur due to an incomplete or corrupt download"""
+
+
 class GeoJSONError(ClientError):
     """Errors that occur due to invalid GeoJSON"""
 
@@ -13,8 +13,11 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 """Functionality for interacting with GeoJSON and planet references."""
+from functools import lru_cache
+import heapq
 import json
 import logging
+import math
 import typing
 
 import geojson as gj
@@ -22,10 +25,23 @@ from jsonschema import Draft7Validator
 
 from .models import Feature
 from .constants import DATA_DIR
-from .exceptions import GeoJSONError, FeatureError
+from .exceptions import ClientError, GeoJSONError, FeatureError
 
 GEOJSON_TYPES = ["Feature"]
 
+SIMPLIFY_METHODS = ('douglas-peucker', 'visvalingam')
+
+# for each geometry type, the depth at which positions are nested in its
+# coordinates and the minimum number of positions in the innermost arrays
+_COORDINATE_NESTING = {
+    'Point': (0, 0),
+    'MultiPoint': (1, 0),
+    'LineString': (1, 2),
+    'MultiLineString': (2, 2),
+    'Polygon': (2, 4),
+    'MultiPolygon': (3, 4)
+}
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -176,6 +192,12 @@ def validate_geom_as_geojson(data: dict):
     if 'coordinates' not in data:
         raise GeoJSONError('Missing "coordinates" key.')
 
+    # large polygons are checked much faster with NumPy
+    np = _numpy()
+    if np is not None and data['type'] in ('Polygon', 'MultiPolygon'):
+        if _validate_polygons(np, data):
+            return data
+
     try:
         cls = getattr(gj, data['type'])
         obj = cls(data['coordinates'])
@@ -189,6 +211,258 @@ def validate_geom_as_geojson(data: dict):
     return data
 
 
+def inspect_geom(data: dict) -> dict:
+    """Describe the coordinates of a GeoJSON geometry.
+
+    NumPy is used to examine the coordinates if it is installed, which is
+    much faster for geometries with many vertices.
+
+    Parameters:
+        data: GeoJSON geometry, Feature, or FeatureCollection.
+
+    Returns:
+        Description of the geometry with the keys `bbox` (west, south,
+        east, north), `positions` (number of positions), `in_range`
+        (longitudes and latitudes are within [-180, 180] and [-90, 90]),
+        `closed` (all rings end where they start) and `rfc7946_winding`
+        (exterior rings are counterclockwise and holes are clockwise, as
+        recommended by RFC 7946).
+
+    Raises:
+        planet.exceptions.GeoJSONError: If data is not a valid GeoJSON
+        geometry.
+    """
+    geom = validate_geom_as_geojson(data)
+    np = _numpy()
+
+    west = south = float('inf')
+    east = north = float('-inf')
+    positions = 0
+    for block in _position_blocks(geom):
+        if not block:
+            continue
+        if np is not None:
+            array = np.asarray(block, dtype=float)[:, :2]
+            low, high = array.min(axis=0), array.max(axis=0)
+            xmin, ymin, xmax, ymax = (float(low[0]),
+                                      float(low[1]),
+                                      float(high[0]),
+                                      float(high[1]))
+        else:
+            xs = [p[0] for p in block]
+            ys = [p[1] for p in block]
+            xmin, ymin, xmax, ymax = min(xs), min(ys), max(xs), max(ys)
+        west, south = min(west, xmin), min(south, ymin)
+        east, north = max(east, xmax), max(north, ymax)
+        positions += len(block)
+
+    closed = True
+    winding = True
+    for polygon in _polygons(geom):
+        for i, ring in enumerate(polygon):
+            closed = closed and _is_closed(ring)
+            # exterior rings have positive area, holes negative
+            winding = winding and (_signed_area(np, ring) > 0) == (i == 0)
+
+    in_range = not positions or (-180 <= west and east <= 180 and -90 <= south
+                                 and north <= 90)
+    return {
+        'bbox': [west, south, east, north] if positions else None,
+        'positions': positions,
+        'in_range': in_range,
+        'closed': closed,
+        'rfc7946_winding': winding
+    }
+
+
+def normalize_geom(data: dict) -> dict:
+    """Close the rings of a GeoJSON geometry and orient them per RFC 7946.
+
+    Open rings are closed by repeating their first position and rings are
+    reversed where needed so that exterior rings are counterclockwise and
+    holes are clockwise. Positions are not otherwise changed.
+
+    Parameters:
+        data: GeoJSON geometry, Feature, or FeatureCollection.
+
+    Returns:
+        A new GeoJSON geometry.
+
+    Raises:
+        planet.exceptions.GeoJSONError: If data is not a GeoJSON geometry.
+    """
+    geom = geom_from_geojson(data)
+    if 'type' not in geom:
+        raise GeoJSONError('Missing "type" key.')
+    np = _numpy()
+
+    def _normalize_polygon(polygon):
+        rings = []
+        for i, ring in enumerate(polygon):
+            ring = [list(p) for p in ring]
+            if ring and not _is_closed(ring):
+                ring.append(list(ring[0]))
+            if len(ring) >= 4 and (_signed_area(np, ring) > 0) != (i == 0):
+                ring.reverse()
+            rings.append(ring)
+        return rings
+
+    ret = dict(geom)
+    if geom['type'] == 'Polygon':
+        ret['coordinates'] = _normalize_polygon(geom['coordinates'])
+    elif geom['type'] == 'MultiPolygon':
+        ret['coordinates'] = [
+            _normalize_polygon(p) for p in geom['coordinates']
+        ]
+    elif geom['type'] == 'GeometryCollection':
+        ret['geometries'] = [normalize_geom(g) for g in geom['geometries']]
+    return validate_geom_as_geojson(ret)
+
+
+def simplify_geom(data: dict,
+                  tolerance: typing.Optional[float] = None,
+                  max_vertices: typing.Optional[int] = None,
+                  method: str = 'douglas-peucker') -> dict:
+    """Simplify a GeoJSON geometry by removing its least significant vertices.
+
+    Large areas of interest make for large requests, which are slow to
+    process and may exceed the size limits of the APIs. Simplifying them
+    before they are used in a request, e.g. in a geometry filter or a clip
+    tool, avoids this.
+
+    The significance of a vertex is its distance from the simplified line
+    for the Douglas-Peucker method and the area of the triangle it forms with
+    its neighbors for the Visvalingam-Whyatt method. Vertices are removed
+    until all that remain are more significant than the tolerance and their
+    number is within the budget.
+
+    Rings keep at least four positions and their topology is preserved:
+    vertices are restored to rings that would otherwise intersect themselves
+    or each other. Intersections that are in the original geometry are not
+    repaired, so rings taking part in them may keep all of their vertices.
+    Points are not changed.
+
+    NumPy is used to simplify large geometries if it is installed.
+
+    Parameters:
+        data: GeoJSON geometry, Feature, or FeatureCollection.
+        tolerance: Significance of the vertices to remove, a distance in
+            degrees for 'douglas-peucker' and an area in square degrees for
+            'visvalingam'.
+        max_vertices: Maximum number of positions in the simplified
+            geometry. Rings and lines may keep more positions than this if
+            needed to remain valid.
+        method: 'douglas-peucker' or 'visvalingam'.
+
+    Returns:
+        Simplified GeoJSON geometry. Use `area_error()` to determine how much
+        its area differs from the original.
+
+    Raises:
+        planet.exceptions.GeoJSONError: If data is not a valid GeoJSON
+            geometry.
+        planet.exceptions.ClientError: If neither tolerance nor max_vertices
+            is given or method is not known.
+    """
+    if tolerance is None and max_vertices is None:
+        raise ClientError('One of tolerance or max_vertices is required.')
+    if method not in SIMPLIFY_METHODS:
+        raise ClientError(
+            f'Invalid method: {method} is not in {SIMPLIFY_METHODS}.')
+
+    geom = validate_geom_as_geojson(data)
+    np = _numpy()
+    significance = (_dp_significance
+                    if method == 'douglas-peucker' else _vw_significance)
+
+    def _significance(line, ring, complete=False):
+        if complete:
+            sig = significance(np, line, ring)
+        else:
+            sig = significance(np, line, ring, tolerance, max_vertices)
+        if ring:
+            # rings need at least four positions, the first and last of
+            # which are the same
+            finite = sorted((i for i, s in enumerate(sig) if s < math.inf),
+                            key=lambda i: sig[i],
+                            reverse=True)
+            missing = 4 - (len(sig) - len(finite))
+            for i in finite[:max(missing, 0)]:
+                sig[i] = math.inf
+        return sig
+
+    lines = list(_lines(geom))
+    sigs = [_significance(line, ring) for line, ring in lines]
+    # whether the significance of all vertices was determined
+    complete = [method == 'visvalingam'] * len(lines)
+
+    threshold = -math.inf if tolerance is None else tolerance
+    if max_vertices is not None:
+        finite = sorted((s for sig in sigs for s in sig if s < math.inf),
+                        reverse=True)
+        budget = max_vertices - sum(len(sig) for sig in sigs) + len(finite)
+        if budget <= 0:
+            threshold = math.inf
+        elif budget < len(finite):
+            threshold = max(threshold, finite[budget])
+    thresholds = [threshold] * len(lines)
+
+    # restore vertices to rings that intersect or are no longer nested in
+    # the same rings until there are none. Intersections that are in the
+    # geometry already cannot be removed and are ignored.
+    keep = [_keep(sig, t) for sig, t in zip(sigs, thresholds)]
+    ids = [i for i, (_, ring) in enumerate(lines) if ring]
+    original = [lines[i][0] for i in ids]
+    crossings = _crossing_pairs(original)
+    nesting = _nested_rings(original)
+    while True:
+        rings = [[lines[i][0][k] for k in keep[i]] for i in ids]
+        # only segments that replace removed vertices can add intersections
+        new = [[k1 - k0 > 1 for k0, k1 in zip(keep[i], keep[i][1:])]
+               for i in ids]
+        changed = set().union(*_crossing_pairs(rings, crossings, new),
+                              *(nesting ^ _nested_rings(rings)))
+        if all(thresholds[ids[r]] == -math.inf for r in changed):
+            # every vertex of these rings is kept
+            break
+        for r in changed:
+            i = ids[r]
+            if not complete[i]:
+                sigs[i] = _significance(*lines[i], complete=True)
+                complete[i] = True
+            thresholds[i] = _lower_threshold(sigs[i], thresholds[i])
+            keep[i] = _keep(sigs[i], thresholds[i])
+
+    simplified = _replace_lines(
+        geom,
+        iter([[line[i] for i in kept]
+              for kept, (line, _) in zip(keep, lines)]))
+    LOGGER.debug(
+        f'Simplified geometry from {sum(len(line) for line, _ in lines)} to '
+        f'{sum(len(kept) for kept in keep)} line and ring positions, '
+        f'changing its area by {area_error(geom, simplified):.2%}.')
+    return simplified
+
+
+def area_error(original: dict, simplified: dict) -> float:
+    """Relative change in area of a simplified geometry.
+
+    Areas are planar, in square degrees, which is adequate for comparing a
+    geometry with a simplification of it.
+
+    Parameters:
+        original: GeoJSON geometry, Feature, or FeatureCollection.
+        simplified: Simplification of the original geometry.
+
+    Returns:
+        The difference in area as a fraction of the original area, 0 for
+        geometries without area.
+    """
+    before = _area(geom_from_geojson(original))
+    after = _area(geom_from_geojson(simplified))
+    return abs(after - before) / before if before else 0.0
+
+
 def as_featurecollection(features: typing.List[dict]) -> dict:
     """Combine the features in a FeatureCollection.
 
@@ -229,6 +503,19 @@ def _is_instance_of(obj: dict, geojson_type: str) -> bool:
         planet.exceptions.GeoJSONError: If geojson_type does not match a
         supported GeoJSON type.
     """
+    validator = _validator(geojson_type)
+
+    # well-formed features, such as those returned by the APIs, are
+    # recognized without the cost of evaluating the schema
+    if geojson_type.lower() == 'feature' and _is_well_formed_feature(obj):
+        return True
+
+    return validator.is_valid(obj)
+
+
+@lru_cache(maxsize=None)
+def _validator(geojson_type: str) -> Draft7Validator:
+    """Get the schema validator of a GeoJSON type."""
     try:
         schema_name = next(t + '.json' for t in GEOJSON_TYPES
                            if t.lower() == geojson_type.lower())
@@ -240,4 +527,446 @@ def _is_instance_of(obj: dict, geojson_type: str) -> bool:
     with open(filename, 'r') as src:
         schema = json.load(src)
 
-    return Draft7Validator(schema).is_valid(obj)
+    return Draft7Validator(schema)
+
+
+def _is_well_formed_feature(obj) -> bool:
+    """Determine if an object is a Feature with a common structure.
+
+    This is a sufficient but not a necessary condition for the object to be
+    valid according to the Feature schema. Objects that are not recognized,
+    for instance those with a bbox or a GeometryCollection, may still be
+    valid.
+    """
+    if not isinstance(obj, dict) or obj.get('type') != 'Feature' \
+            or 'bbox' in obj:
+        return False
+    if 'properties' not in obj or not (obj['properties'] is None
+                                       or isinstance(obj['properties'], dict)):
+        return False
+    if 'id' in obj and type(obj['id']) not in (str, int, float):
+        return False
+    if 'geometry' not in obj:
+        return False
+
+    geometry = obj['geometry']
+    if geometry is None:
+        return True
+    if not isinstance(geometry, dict) or 'bbox' in geometry \
+            or 'coordinates' not in geometry:
+        return False
+    try:
+        depth, min_positions = _COORDINATE_NESTING[geometry['type']]
+    except (KeyError, TypeError):
+        return False
+    return _is_coordinates(geometry['coordinates'], depth, min_positions)
+
+
+def _is_coordinates(coordinates, depth: int, min_positions: int) -> bool:
+    if type(coordinates) is not list:
+        return False
+    if depth == 0:
+        # a position, booleans are not numbers according to the schema
+        return len(coordinates) >= 2 and all(
+            type(c) in (int, float) for c in coordinates)
+    if depth == 1 and len(coordinates) < min_positions:
+        return False
+    return all(
+        _is_coordinates(c, depth - 1, min_positions) for c in coordinates)
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Get NumPy if it is installed, None otherwise."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _validate_polygons(np, geom: dict) -> bool:
+    """Validate the rings of a Polygon or MultiPolygon with NumPy.
+
+    Applies the same checks as the geojson library.
+
+    Returns:
+        False if the coordinates do not have the usual structure and must
+        be validated by the geojson library.
+
+    Raises:
+        planet.exceptions.GeoJSONError: If a ring is not valid.
+    """
+    coordinates = geom['coordinates']
+    polygons = [coordinates] if geom['type'] == 'Polygon' else coordinates
+    if not isinstance(polygons, (list, tuple)):
+        return False
+    for polygon in polygons:
+        if not isinstance(polygon, (list, tuple)) or not polygon:
+            return False
+        for ring in polygon:
+            try:
+                array = np.asarray(ring)
+            except (ValueError, TypeError):
+                return False
+            # the geojson library accepts any real numbers, booleans too
+            if array.ndim != 2 or array.dtype.kind not in 'biuf':
+                return False
+
+    for polygon in polygons:
+        for ring in polygon:
+            if len(ring) < 4:
+                raise GeoJSONError(
+                    'Each linear ring must contain at least 4 positions')
+            if not _is_closed(ring):
+                raise GeoJSONError(
+                    'Each linear ring must end where it started')
+    return True
+
+
+def _is_closed(ring) -> bool:
+    """Determine if a ring ends where it started."""
+    # positions are compared at the precision used by the geojson library
+    precision = gj.geometry.DEFAULT_PRECISION
+    return bool(ring) and [round(c, precision) for c in ring[0]
+                           ] == [round(c, precision) for c in ring[-1]]
+
+
+def _signed_area(np, ring) -> float:
+    """Twice the signed area of a ring, positive if counterclockwise."""
+    if np is not None:
+        array = np.asarray(ring, dtype=float)
+        x, y = array[:, 0], array[:, 1]
+        return float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+    return sum(x0 * y1 - x1 * y0
+               for (x0, y0, *_), (x1, y1, *_) in zip(ring, ring[1:]))
+
+
+def _polygons(geom: dict) -> typing.List[list]:
+    """The polygons of a geometry, as lists of rings."""
+    if geom['type'] == 'Polygon':
+        return [geom['coordinates']]
+    if geom['type'] == 'MultiPolygon':
+        return list(geom['coordinates'])
+    if geom['type'] == 'GeometryCollection':
+        return [p for g in geom['geometries'] for p in _polygons(g)]
+    return []
+
+
+def _position_blocks(geom: dict) -> typing.Iterator[list]:
+    """The positions of a geometry, in lists such as rings."""
+    if geom['type'] == 'GeometryCollection':
+        for g in geom['geometries']:
+            yield from _position_blocks(g)
+        return
+
+    def _blocks(coordinates, depth):
+        if depth <= 1:
+            yield coordinates if depth == 1 else [coordinates]
+        else:
+            for c in coordinates:
+                yield from _blocks(c, depth - 1)
+
+    depth, _ = _COORDINATE_NESTING[geom['type']]
+    yield from _blocks(geom['coordinates'], depth)
+
+
+def _area(geom: dict) -> float:
+    """Planar area of a geometry."""
+    np = _numpy()
+    return sum(
+        abs(_signed_area(np, ring)) * (1 if i == 0 else -1)
+        for polygon in _polygons(geom)
+        for i, ring in enumerate(polygon) if len(ring) >= 4) / 2
+
+
+def _lines(geom: dict) -> typing.Iterator[typing.Tuple[list, bool]]:
+    """The lines and rings of a geometry, with whether each is a ring."""
+    if geom['type'] == 'LineString':
+        yield geom['coordinates'], False
+    elif geom['type'] == 'MultiLineString':
+        for line in geom['coordinates']:
+            yield line, False
+    elif geom['type'] == 'Polygon':
+        for ring in geom['coordinates']:
+            yield ring, True
+    elif geom['type'] == 'MultiPolygon':
+        for polygon in geom['coordinates']:
+            for ring in polygon:
+                yield ring, True
+    elif geom['type'] == 'GeometryCollection':
+        for g in geom['geometries']:
+            yield from _lines(g)
+
+
+def _replace_lines(geom: dict, lines: typing.Iterator[list]) -> dict:
+    """Copy a geometry, replacing its lines and rings in `_lines()` order."""
+    ret = dict(geom)
+    if geom['type'] == 'LineString':
+        ret['coordinates'] = next(lines)
+    elif geom['type'] in ('MultiLineString', 'Polygon'):
+        ret['coordinates'] = [next(lines) for _ in geom['coordinates']]
+    elif geom['type'] == 'MultiPolygon':
+        ret['coordinates'] = [[next(lines) for _ in polygon]
+                              for polygon in geom['coordinates']]
+    elif geom['type'] == 'GeometryCollection':
+        ret['geometries'] = [
+            _replace_lines(g, lines) for g in geom['geometries']
+        ]
+    return ret
+
+
+def _keep(sig: typing.List[float], threshold: float) -> typing.List[int]:
+    """Indices of the vertices more significant than the threshold and
+    those that are required."""
+    return [i for i, s in enumerate(sig) if s > threshold or s == math.inf]
+
+
+def _lower_threshold(sig: typing.List[float], threshold: float) -> float:
+    """A threshold keeping about twice as many of a ring's vertices."""
+    finite = sorted((s for s in sig if s < math.inf), reverse=True)
+    kept = sum(1 for s in finite if s > threshold)
+    target = max(2 * kept, 4)
+    lower = finite[target] if target < len(finite) else -math.inf
+    return lower if lower < threshold else -math.inf
+
+
+def _dp_significance(np,
+                     line: list,
+                     ring: bool,
+                     tolerance: typing.Optional[float] = None,
+                     limit: typing.Optional[int] = None) -> typing.List[float]:
+    """Significance of each vertex of a line according to Douglas-Peucker.
+
+    Significance is the distance of a vertex from the segment it was
+    selected to split, capped by the significance of the vertex that
+    split its parent segment so that vertices more significant than a
+    tolerance are those Douglas-Peucker would keep for that tolerance.
+
+    Segments are split in order of decreasing distance, stopping once the
+    distance is within the tolerance or the limit of vertices have been
+    selected. The significance of the remaining vertices is 0.
+    """
+    n = len(line)
+    sig = [0.0] * n
+    sig[0] = sig[-1] = math.inf
+    if n < 3:
+        return sig
+
+    xy = np.asarray(line, dtype=float)[:, :2] if np is not None else None
+
+    def _farthest(i, j):
+        ax, ay = line[i][0], line[i][1]
+        dx, dy = line[j][0] - ax, line[j][1] - ay
+        length = dx * dx + dy * dy
+        # NumPy has too much overhead for short segments
+        if xy is not None and j - i > 64:
+            px, py = xy[i + 1:j, 0] - ax, xy[i + 1:j, 1] - ay
+            t = ((px * dx + py * dy) /
+                 length).clip(0, 1) if length else np.zeros(j - i - 1)
+            dist = np.hypot(px - t * dx, py - t * dy)
+            k = int(dist.argmax())
+            return i + 1 + k, float(dist[k])
+        best, farthest = -1.0, i + 1
+        for k in range(i + 1, j):
+            px, py = line[k][0] - ax, line[k][1] - ay
+            t = min(max((px * dx + py * dy) / length, 0), 1) if length else 0
+            d = math.hypot(px - t * dx, py - t * dy)
+            if d > best:
+                best, farthest = d, k
+        return farthest, best
+
+    heap: typing.List[tuple] = []
+
+    def _push(i, j, parent):
+        if j - i >= 2:
+            k, d = _farthest(i, j)
+            heapq.heappush(heap, (-d, i, j, k, parent))
+
+    if ring:
+        # the first and last positions of a ring are the same, so split it
+        # at the vertex farthest from them
+        k, _ = _farthest(0, n - 1)
+        sig[k] = math.inf
+        _push(0, k, math.inf)
+        _push(k, n - 1, math.inf)
+    else:
+        _push(0, n - 1, math.inf)
+
+    selected = 0
+    while heap and (limit is None or selected < limit):
+        d, i, j, k, parent = heapq.heappop(heap)
+        if tolerance is not None and -d <= tolerance:
+            break
+        sig[k] = min(-d, parent)
+        selected += 1
+        _push(i, k, sig[k])
+        _push(k, j, sig[k])
+    return sig
+
+
+def _vw_significance(np,
+                     line: list,
+                     ring: bool,
+                     tolerance: typing.Optional[float] = None,
+                     limit: typing.Optional[int] = None) -> typing.List[float]:
+    """Significance of each vertex of a line according to Visvalingam-Whyatt.
+
+    Significance is the area of the triangle a vertex forms with its
+    neighbors when it is removed, or the significance of the previously
+    removed vertex if larger.
+    """
+    n = len(line)
+    sig = [math.inf] * n
+    prev = list(range(-1, n - 1))
+    next_ = list(range(1, n + 1))
+
+    def _triangle(i):
+        a, b, c = line[prev[i]], line[i], line[next_[i]]
+        return abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) *
+                   (b[1] - a[1])) / 2
+
+    areas = [math.inf] * n
+    for i in range(1, n - 1):
+        areas[i] = _triangle(i)
+    heap = [(areas[i], i) for i in range(1, n - 1)]
+    heapq.heapify(heap)
+    largest = 0.0
+    while heap:
+        area, i = heapq.heappop(heap)
+        if sig[i] < math.inf or area != areas[i]:
+            # removed or outdated
+            continue
+        largest = max(largest, area)
+        sig[i] = largest
+        p, q = prev[i], next_[i]
+        next_[p], prev[q] = q, p
+        for k in (p, q):
+            if 0 < k < n - 1:
+                areas[k] = _triangle(k)
+                heapq.heappush(heap, (areas[k], k))
+    return sig
+
+
+def _crossing_rings(rings: typing.List[list]) -> typing.Set[int]:
+    """Indices of the rings that intersect themselves or another ring.
+
+    Rings touching at a shared vertex are not considered to intersect.
+    """
+    return set().union(*_crossing_pairs(rings))
+
+
+def _crossing_pairs(
+    rings: typing.List[list],
+    known: typing.AbstractSet[typing.Tuple[int, int]] = frozenset(),
+    new: typing.Optional[typing.List[typing.List[bool]]] = None
+) -> typing.Set[typing.Tuple[int, int]]:
+    """Pairs of indices of rings that intersect, in ascending order.
+
+    A ring that intersects itself is paired with itself. Pairs in known are
+    not tested again. If new flags the segments of each ring that were
+    changed, only pairs of segments of which one is new are tested.
+    """
+    pairs = len(rings) * (len(rings) + 1) // 2
+    segments = []
+    for r, ring in enumerate(rings):
+        for i in range(len(ring) - 1):
+            a, b = tuple(ring[i][:2]), tuple(ring[i + 1][:2])
+            segments.append((min(a[0], b[0]),
+                             max(a[0], b[0]),
+                             min(a[1], b[1]),
+                             max(a[1], b[1]),
+                             r,
+                             i,
+                             a,
+                             b,
+                             new is None or new[r][i]))
+    # sweep along x, comparing segments whose x ranges overlap. Unchanged
+    # segments are only compared with new ones.
+    segments.sort(key=lambda s: s[0])
+    crossing: typing.Set[typing.Tuple[int, int]] = set()
+    active: typing.List[tuple] = []
+    active_new: typing.List[tuple] = []
+    for seg in segments:
+        if len(crossing) + len(known) >= pairs:
+            # every pair of rings is known to intersect
+            break
+        xmin, _, ymin, ymax, r, i, a, b, is_new = seg
+        active = [s for s in active if s[1] >= xmin]
+        active_new = [s for s in active_new if s[1] >= xmin]
+        for _, _, ymin2, ymax2, r2, i2, c, d, _ in (active
+                                                    if is_new else active_new):
+            if ymin2 > ymax or ymax2 < ymin:
+                continue
+            pair = (min(r, r2), max(r, r2))
+            if pair in crossing or pair in known:
+                continue
+            if r == r2 and (abs(i - i2) == 1
+                            or abs(i - i2) == len(rings[r]) - 2):
+                # consecutive segments
+                continue
+            if _intersects(a, b, c, d):
+                crossing.add(pair)
+        active.append(seg)
+        if is_new:
+            active_new.append(seg)
+    return crossing
+
+
+def _nested_rings(
+        rings: typing.List[list]) -> typing.Set[typing.Tuple[int, int]]:
+    """Pairs of ring indices where the first ring starts inside the second.
+    """
+    boxes = [(min(p[0] for p in ring),
+              min(p[1] for p in ring),
+              max(p[0] for p in ring),
+              max(p[1] for p in ring)) for ring in rings]
+    nested = set()
+    for r, ring in enumerate(rings):
+        x, y = ring[0][0], ring[0][1]
+        for q, (west, south, east, north) in enumerate(boxes):
+            if (q != r and west <= x <= east and south <= y <= north
+                    and _inside(x, y, rings[q])):
+                nested.add((r, q))
+    return nested
+
+
+def _inside(x: float, y: float, ring: list) -> bool:
+    """Determine if a point is inside a ring, by ray casting."""
+    inside = False
+    for (x0, y0, *_), (x1, y1, *_) in zip(ring, ring[1:]):
+        if (y0 > y) != (y1 > y) and x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+            inside = not inside
+    return inside
+
+
+def _intersects(a: tuple, b: tuple, c: tuple, d: tuple) -> bool:
+    """Determine if segments ab and cd intersect other than at an endpoint
+    they share."""
+
+    def _orient(p, q, r):
+        return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+
+    d1, d2 = _orient(c, d, a), _orient(c, d, b)
+    d3, d4 = _orient(a, b, c), _orient(a, b, d)
+    if d1 * d2 < 0 and d3 * d4 < 0:
+        return True
+
+    shared = a in (c, d) or b in (c, d)
+    if d1 == d2 == d3 == d4 == 0:
+        # collinear, compare extents along x unless vertical
+        axis = 0 if abs(b[0] - a[0]) + abs(d[0] - c[0]) else 1
+        overlap = (min(max(a[axis], b[axis]), max(c[axis], d[axis])) -
+                   max(min(a[axis], b[axis]), min(c[axis], d[axis])))
+        return overlap > 0 or (overlap == 0 and not shared)
+    if shared:
+        # the shared endpoint is the only intersection
+        return False
+
+    def _between(p, q, r):
+        return (min(p[0], q[0]) <= r[0] <= max(p[0], q[0])
+                and min(p[1], q[1]) <= r[1] <= max(p[1], q[1]))
+
+    return ((d1 == 0 and _between(c, d, a)) or (d2 == 0 and _between(c, d, b))
+            or (d3 == 0 and _between(a, b, c))
+            or (d4 == 0 and _between(a, b, d)))
@@ -16,19 +16,23 @@
 from __future__ import annotations  # https://stackoverflow.com/a/33533514
 import asyncio
 from collections import Counter
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from http import HTTPStatus
 import logging
 import random
 import threading
 import time
-from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Coroutine, Iterator, Optional, TypeVar
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Coroutine, Dict, Generator, Iterator, Optional, Sequence, Tuple, TypeVar
 
 import httpx
 from typing_extensions import Literal
 
 from .auth import Auth, AuthType
 from . import exceptions, models
+from .cache import CachedResponse, ResponseCache
+from .metrics import MetricsHook
+from .reporting import TransferProgress
 from .__version__ import __version__
 
 T = TypeVar("T")
@@ -56,6 +60,9 @@ MAX_ACTIVE = 50
 
 LOGGER = logging.getLogger(__name__)
 
+# set within Session.bypass_cache() to require fresh responses
+_BYPASS_CACHE: ContextVar[bool] = ContextVar('bypass_cache', default=False)
+
 
 class BaseSession:
 
@@ -233,12 +240,27 @@ class Session(BaseSession):
         self,
         auth: Optional[AuthType] = None,
         read_timeout_secs: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
+        progress: Optional[TransferProgress] = None,
+        metrics: Optional[Sequence[MetricsHook]] = None,
     ):
         """Initialize a Session.
 
         Parameters:
             auth: Planet server authentication.
             read_timeout_secs: Maximum time to wait for data to be received.
+            cache: Cache for responses to GET requests, see `planet.cache`.
+                Responses are not cached by default.
+            coalesce_requests: Share a single request and its response among
+                concurrent identical GET requests. Each request that joins
+                one already in flight is counted as 'Coalesced' in
+                `outcomes`.
+            progress: Reporter of the combined progress of all downloads
+                made with the session, see `planet.reporting`. Downloads
+                do not show their own progress bars when given.
+            metrics: Hooks notified of the events of every request, see
+                `planet.metrics`.
         """
         if auth is None:
             auth = Auth.from_user_default_session()
@@ -275,6 +297,12 @@ class Session(BaseSession):
 
         self._limiter = _Limiter(rate_limit=RATE_LIMIT, max_workers=MAX_ACTIVE)
         self.outcomes: Counter[str] = Counter()
+        self.cache = cache
+        self.coalesce_requests = coalesce_requests
+        self._in_flight: Dict[Tuple[str, bool, Tuple[Tuple[str, str], ...]],
+                              asyncio.Task] = {}
+        self.progress = progress
+        self.metrics = list(metrics or [])
 
         self._loop: asyncio.AbstractEventLoop = None  # type: ignore
 
@@ -366,6 +394,8 @@ class Session(BaseSession):
                         wait_time = self._calculate_wait(
                             num_tries, self.max_retry_backoff)
                         LOGGER.info(f'Retrying: sleeping {wait_time}s')
+                        if self.metrics and a:
+                            self._emit('retry', a[0], e, num_tries, wait_time)
                         await asyncio.sleep(wait_time)
                 else:
                     raise e
@@ -398,7 +428,8 @@ class Session(BaseSession):
                       method: str,
                       url: str,
                       json: Optional[dict] = None,
-                      params: Optional[dict] = None) -> models.Response:
+                      params: Optional[dict] = None,
+                      headers: Optional[dict] = None) -> models.Response:
         """Build a request and submit it with retry and limiting.
 
         Parameters:
@@ -406,6 +437,7 @@ class Session(BaseSession):
             url: Location of the API endpoint.
             json: JSON to send.
             params: Values to send in the query string.
+            headers: Additional headers to send.
 
         Returns:
             Server response.
@@ -414,10 +446,9 @@ class Session(BaseSession):
             planet.exceptions.APIException: On API error.
             planet.exceptions.ClientError: When retry limit is exceeded.
         """
+        headers = dict(headers or {})
         if json:
-            headers = {'Content-Type': 'application/json'}
-        else:
-            headers = None
+            headers['Content-Type'] = 'application/json'
 
         request = self._client.build_request(method=method,
                                              url=url,
@@ -425,41 +456,168 @@ class Session(BaseSession):
                                              params=params,
                                              headers=headers)
 
-        http_response = await self._retry(self._send, request, stream=False)
+        if self.coalesce_requests and method.upper() == 'GET':
+            return await self._send_coalesced(request)
+        return await self._send_request(request)
+
+    async def _send_request(self, request: httpx.Request) -> models.Response:
+        if self.cache is not None and request.method == 'GET':
+            http_response = await self._send_cached(request)
+        else:
+            http_response = await self._retry(self._send,
+                                              request,
+                                              stream=False)
         return models.Response(http_response)
 
+    async def _send_coalesced(self, request: httpx.Request) -> models.Response:
+        """Send request or join an identical request already in flight."""
+        # requests that bypass the cache must not join one that may not and
+        # requests with different headers, e.g. conditional requests, may
+        # get different responses
+        key = (str(request.url),
+               _BYPASS_CACHE.get(),
+               tuple(sorted(request.headers.multi_items())))
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(request))
+            self._in_flight[key] = task
+
+            def _done(t: asyncio.Task):
+                self._in_flight.pop(key, None)
+                # retrieve the exception so that it is not reported as
+                # unhandled if every waiter was cancelled
+                if not t.cancelled():
+                    t.exception()
+
+            task.add_done_callback(_done)
+        else:
+            LOGGER.info(f'{request.method} {request.url} - Coalesced')
+            self.outcomes.update(['Coalesced'])
+
+        # shielded so that cancelling one waiter does not cancel the request
+        # for the others
+        return await asyncio.shield(task)
+
+    async def _send_cached(self, request: httpx.Request) -> httpx.Response:
+        """Send request, using and updating the response cache."""
+        assert self.cache is not None
+        key = str(request.url)
+        entry = self.cache.get(key)
+        if entry:
+            if entry.is_fresh() and not _BYPASS_CACHE.get():
+                LOGGER.info(f'{request.method} {request.url} - Cached')
+                self.cache.hits += 1
+                self.cache.bytes_saved += len(entry.content)
+                return entry.to_response(request)
+            request.headers.update(entry.conditional_headers())
+
+        http_response = await self._retry(self._send, request, stream=False)
+
+        if entry and http_response.status_code == HTTPStatus.NOT_MODIFIED:
+            self.cache.revalidations += 1
+            self.cache.bytes_saved += len(entry.content)
+            entry.refresh(http_response)
+            self.cache.set(key, entry)
+            return entry.to_response(request)
+
+        self.cache.misses += 1
+        new_entry = CachedResponse.from_response(http_response)
+        if new_entry:
+            self.cache.set(key, new_entry)
+        elif entry:
+            self.cache.delete(key)
+        return http_response
+
+    @staticmethod
+    @contextmanager
+    def bypass_cache() -> Generator[None, None, None]:
+        """Context manager requiring fresh responses from the server.
+
+        Within the context, cached responses are never served without first
+        being revalidated with the server. This is intended for polling loops
+        that need the current state of a resource. It applies to requests
+        made by the current asyncio task and tasks it creates.
+
+        Example:
+            ```python
+            with sess.bypass_cache():
+                order = await cl.get_order(order_id)
+            ```
+        """
+        token = _BYPASS_CACHE.set(True)
+        try:
+            yield
+        finally:
+            _BYPASS_CACHE.reset(token)
+
     async def _send(self, request, stream=False) -> httpx.Response:
         """Send request with with rate/worker limiting."""
-        async with self._limiter:
-            http_resp = await self._client.send(request, stream=stream)
+        if not self.metrics:
+            async with self._limiter:
+                return await self._client.send(request, stream=stream)
 
+        queued = time.monotonic()
+        async with self._limiter:
+            start = time.monotonic()
+            self._emit('queue_wait', request, start - queued)
+            self._emit('request_start', request)
+            try:
+                http_resp = await self._client.send(request, stream=stream)
+            except Exception as e:
+                self._emit('request_end',
+                           request,
+                           None,
+                           time.monotonic() - start,
+                           e)
+                raise
+
+        self._emit('request_end', request, http_resp, time.monotonic() - start)
+        if not stream:
+            self._emit('stream_bytes', request, http_resp.num_bytes_downloaded)
         return http_resp
 
+    def _emit(self, event: str, *args):
+        """Notify metrics hooks of an event."""
+        for hook in self.metrics:
+            try:
+                getattr(hook, event)(*args)
+            except Exception as e:
+                # instrumentation must not interfere with requests
+                LOGGER.warning(f'Metrics hook {hook!r} failed: {e}')
+
     @asynccontextmanager
     async def stream(
         self,
         method: str,
         url: str,
-        params: Optional[dict] = None
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None
     ) -> AsyncGenerator[models.StreamingResponse, None]:
         """Submit a request and get the response as a stream context manager.
 
         Parameters:
             method: HTTP request method.
             url: Location of the API endpoint.
+            params: Values to send in the query string.
+            headers: Additional headers to send.
 
         Returns:
             Context manager providing the streaming response.
         """
         request = self._client.build_request(method=method,
                                              url=url,
-                                             params=params)
+                                             params=params,
+                                             headers=headers)
         http_response = await self._retry(self._send, request, stream=True)
         response = models.StreamingResponse(http_response)
         try:
             yield response
         finally:
             await response.aclose()
+            if self.metrics:
+                self._emit('stream_bytes',
+                           request,
+                           http_response.num_bytes_downloaded)
 
     def client(self,
                name: Literal['data', 'orders', 'subscriptions'],
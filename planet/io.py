@@ -13,7 +13,11 @@
 # the License.
 """Functionality for processing inputs and outputs."""
 from datetime import datetime
+import json
 import logging
+import os
+from pathlib import Path
+import tempfile
 import typing
 
 from . import exceptions, geojson
@@ -22,6 +26,34 @@ LOGGER = logging.getLogger(__name__)
 
 RFC3339_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
+# number of characters read at a time by read_features
+READ_SIZE = 64 * 1024
+
+
+def write_atomic(path: typing.Union[str, Path], text: str):
+    """Replace the contents of a file with text.
+
+    The text is written to a uniquely named temporary file in the same
+    directory, which then replaces the file, so readers and concurrent
+    writers never see a partially written file. The file is only readable
+    and writable by its owner.
+    """
+    path = Path(path)
+    tmp = None
+    try:
+        with tempfile.NamedTemporaryFile('w',
+                                         dir=path.parent,
+                                         prefix=f'.{path.name}.',
+                                         suffix='.tmp',
+                                         delete=False) as fp:
+            tmp = Path(fp.name)
+            fp.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+        raise
+
 
 async def collect(
     values: typing.AsyncIterator[dict]
@@ -45,6 +77,195 @@ async def collect(
     return ret
 
 
+async def iter_collect(values: typing.AsyncIterator[dict],
+                       indent: typing.Optional[int] = None,
+                       sort_keys: bool = False) -> typing.AsyncIterator[str]:
+    """Collect a sequence into JSON incrementally.
+
+    Like `collect()`, but the JSON text is produced piece by piece as values
+    arrive, so it can be written out without holding the sequence in
+    memory. The text is the same as `json.dumps()` of the result of
+    `collect()` with the same `indent` and `sort_keys`.
+
+    Whether the JSON blob is a GeoJSON FeatureCollection or a list is
+    decided by the first item. An empty sequence is an empty
+    FeatureCollection.
+
+    Parameters:
+        values: Items to collect.
+        indent: Indentation of the JSON text, as for `json.dumps()`.
+        sort_keys: Sort the keys of objects, as for `json.dumps()`.
+
+    Yields:
+        Consecutive pieces of the JSON text.
+
+    Raises:
+        planet.exceptions.GeoJSONError: If the first item is a GeoJSON
+            Feature and a later item is not.
+    """
+    values = aiter(values)
+    first: typing.List[dict] = []
+    async for item in values:
+        first.append(item)
+        break
+    is_features = not first or geojson._is_instance_of(first[0], 'Feature')
+
+    # the array is nested in the FeatureCollection object
+    level = 1 if is_features else 0
+    pad = '' if indent is None else ' ' * indent
+    item_sep = ', ' if indent is None else ',\n' + pad * (level + 1)
+    first_sep = '' if indent is None else '\n' + pad * (level + 1)
+    close = ']' if indent is None else '\n' + pad * level + ']'
+    member_sep = ', ' if indent is None else ',\n' + pad
+    if indent is None:
+        open_object, close_object = '{', '}'
+    else:
+        open_object, close_object = '{\n' + pad, '\n}'
+
+    def _dumps(item):
+        text = json.dumps(item, indent=indent, sort_keys=sort_keys)
+        if indent is not None:
+            text = text.replace('\n', '\n' + pad * (level + 1))
+        return text
+
+    type_member = '"type": "FeatureCollection"'
+    if is_features:
+        yield open_object
+        if not sort_keys:
+            yield type_member + member_sep
+        yield '"features": ['
+    else:
+        yield '['
+
+    if not first:
+        yield ']'
+    else:
+        yield first_sep + _dumps(first[0])
+        async for item in values:
+            if is_features and not geojson._is_instance_of(item, 'Feature'):
+                raise exceptions.GeoJSONError(
+                    f'{item} is not a valid GeoJSON Feature object.')
+            yield item_sep + _dumps(item)
+        yield close
+
+    if is_features:
+        if sort_keys:
+            yield member_sep + type_member
+        yield close_object
+
+
+def read_features(fp: typing.TextIO) -> typing.Iterator[dict]:
+    """Read GeoJSON objects from a file without loading it into memory.
+
+    The file may contain a single GeoJSON object, as in a .geojson file, or
+    a sequence of them separated by whitespace, as in a newline-delimited
+    GeoJSON file. The features of FeatureCollections are read one at a time
+    and yielded individually, other objects are yielded as they are.
+
+    Parameters:
+        fp: File opened for reading text.
+
+    Raises:
+        planet.exceptions.GeoJSONError: If the file is not valid JSON.
+    """
+    reader = _JSONReader(fp)
+    while reader.skip_whitespace():
+        if reader.peek() != '{':
+            yield reader.value()
+            continue
+
+        # read the members of the object one at a time so that the features
+        # of a FeatureCollection do not need to be held in memory
+        reader.expect('{')
+        members: dict = {}
+        streamed = False
+        while reader.skip_whitespace() and reader.peek() != '}':
+            if members or streamed:
+                reader.expect(',')
+            key = reader.value()
+            reader.expect(':')
+            reader.skip_whitespace()
+            if key == 'features' and reader.peek() == '[':
+                reader.expect('[')
+                first = True
+                while reader.skip_whitespace() and reader.peek() != ']':
+                    if not first:
+                        reader.expect(',')
+                    yield reader.value()
+                    first = False
+                reader.expect(']')
+                streamed = True
+            else:
+                members[key] = reader.value()
+        reader.expect('}')
+        if not streamed:
+            yield members
+
+
+class _JSONReader:
+    """Incremental reader of JSON values from a text file."""
+
+    def __init__(self, fp: typing.TextIO):
+        self._fp = fp
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read more of the file, returning False at the end of the file."""
+        if self._eof:
+            return False
+        # read at least as much as is buffered so that values spanning
+        # many reads are decoded a small number of times
+        data = self._fp.read(max(READ_SIZE, len(self._buffer) - self._pos))
+        if not data:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def skip_whitespace(self) -> bool:
+        """Skip whitespace, returning False at the end of the file."""
+        while True:
+            while (self._pos < len(self._buffer)
+                   and self._buffer[self._pos] in ' \t\r\n'):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return True
+            if not self._fill():
+                return False
+
+    def peek(self) -> str:
+        return self._buffer[self._pos]
+
+    def expect(self, char: str):
+        """Consume a character, after any whitespace."""
+        if not self.skip_whitespace() or self.peek() != char:
+            found = self.peek() if self._pos < len(self._buffer) else 'EOF'
+            raise exceptions.GeoJSONError(
+                f'Invalid JSON: expected "{char}", found "{found}".')
+        self._pos += 1
+
+    def value(self):
+        """Decode the next value."""
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise exceptions.GeoJSONError(f'Invalid JSON: {e}')
+            # a value at the end of the buffer, such as a number, may
+            # continue in the rest of the file
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
 def str_to_datetime(string: str) -> datetime:
     """Convert a string to a datetime.
 
@@ -0,0 +1,201 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Records of files downloaded to a directory.
+
+A manifest is stored as a JSON-lines file in the download directory. Each
+line records a downloaded file's path relative to the directory, size and
+checksum along with information about the source it was downloaded from.
+Reruns of a download use the manifest to fetch only files that are missing,
+incomplete or whose source has changed.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Dict, Optional, Union
+
+from planet.io import write_atomic
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_NAME = '.planet-manifest.jsonl'
+
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+
+def file_checksum(path: Union[str, Path]) -> str:
+    """Calculate the sha256 checksum of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fp:
+        for chunk in iter(lambda: fp.read(CHECKSUM_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def _file_checksum(path: Path) -> str:
+    """Calculate the sha256 checksum of a file without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, file_checksum, path)
+
+
+class Manifest:
+    """Record of files downloaded to a directory.
+
+    Example:
+        ```python
+        >>> from planet.manifest import Manifest
+        >>>
+        >>> manifest = Manifest('downloads')
+        >>> path = 'downloads/a-quad.tif'
+        >>> if not await manifest.is_current('a-quad', path):
+        ...     # download the file here, then
+        ...     await manifest.record('a-quad', path)
+
+        ```
+    """
+
+    def __init__(self, directory: Union[str, Path], verify: bool = False):
+        """
+        Parameters:
+            directory: Directory the files are downloaded to. The manifest
+                file is created in this directory.
+            verify: Check the checksum of recorded files in addition to
+                their size when determining whether they are current.
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / MANIFEST_NAME
+        self.verify = verify
+        self._entries: Dict[str, dict] = {}
+        self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _load(self):
+        lines = 0
+        try:
+            with open(self.path) as fp:
+                for line in fp:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry['key']] = entry
+                    except (ValueError, KeyError, TypeError):
+                        # e.g. a line truncated by an interrupted write
+                        LOGGER.debug(f'ignoring manifest line {lines}')
+        except FileNotFoundError:
+            return
+
+        # entries are appended as they are recorded, so rewrite the file once
+        # it is mostly made up of superseded entries
+        if lines > 2 * len(self._entries):
+            self._compact()
+
+    def _compact(self):
+        write_atomic(
+            self.path,
+            ''.join(
+                json.dumps(entry) + '\n' for entry in self._entries.values()))
+
+    def get(self, key: str) -> Optional[dict]:
+        """Get the recorded entry for a key, None if not recorded."""
+        return self._entries.get(key)
+
+    async def is_current(self,
+                         key: str,
+                         path: Union[str, Path],
+                         source: Optional[dict] = None) -> bool:
+        """Determine whether a file matches its recorded entry.
+
+        Checksums are calculated in a worker thread.
+
+        Parameters:
+            key: Identifier of the downloaded resource.
+            path: Location of the downloaded file.
+            source: Information about the resource to compare with the
+                recorded information, e.g. to detect republished resources.
+
+        Returns:
+            True if the file exists, matches the recorded size (and
+            checksum, if verifying) and the source has not changed.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+
+        path = Path(path)
+        if entry['path'] != self._relative(path):
+            return False
+
+        if source is not None and entry.get('source') != source:
+            LOGGER.debug(f'{key} source has changed')
+            return False
+
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return False
+
+        if size != entry['size']:
+            LOGGER.debug(f'{key} size does not match manifest')
+            return False
+
+        if self.verify and await _file_checksum(path) != entry['sha256']:
+            LOGGER.debug(f'{key} checksum does not match manifest')
+            return False
+
+        return True
+
+    async def record(self,
+                     key: str,
+                     path: Union[str, Path],
+                     source: Optional[dict] = None) -> dict:
+        """Record a downloaded file.
+
+        The checksum is calculated in a worker thread.
+
+        Parameters:
+            key: Identifier of the downloaded resource.
+            path: Location of the downloaded file.
+            source: Information about the resource to record.
+
+        Returns:
+            The recorded entry.
+        """
+        path = Path(path)
+        entry = {
+            'key': key,
+            'path': self._relative(path),
+            'size': path.stat().st_size,
+            'sha256': await _file_checksum(path),
+            'source': source,
+            'recorded': time.time()
+        }
+        self._entries[key] = entry
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a') as fp:
+            fp.write(json.dumps(entry) + '\n')
+        return entry
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(
+                self.directory.resolve()).as_posix()
+        except ValueError:
+            return str(path.resolve())
@@ -0,0 +1,313 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Instrumentation of the requests made by a Session.
+
+Hooks provided to a Session are notified of the events of every request it
+sends: the time spent waiting for the rate and concurrency limits, the start
+and end of the request, retries and the number of bytes received.
+`MetricsCollector` is a hook that aggregates these events into histograms and
+counters which can be summarized or exported in the Prometheus text format.
+
+Example:
+    ```python
+    >>> import asyncio
+    >>> from planet import Session
+    >>> from planet.metrics import MetricsCollector
+    >>>
+    >>> async def main():
+    ...     collector = MetricsCollector()
+    ...     async with Session(metrics=[collector]) as sess:
+    ...         cl = sess.client('data')
+    ...         # use client here
+    ...     print(collector.prometheus())
+    ...
+    >>> asyncio.run(main())
+
+    ```
+"""
+from collections import Counter
+import logging
+import math
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+LOGGER = logging.getLogger(__name__)
+
+# upper bounds of the histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.005,
+                   0.01,
+                   0.025,
+                   0.05,
+                   0.1,
+                   0.25,
+                   0.5,
+                   1.0,
+                   2.5,
+                   5.0,
+                   10.0,
+                   30.0,
+                   60.0,
+                   120.0)
+
+_VERSION = re.compile(r'v\d+')
+
+
+def endpoint(request: httpx.Request) -> str:
+    """Name of the endpoint of a request.
+
+    Path segments that identify a resource (those containing a digit, other
+    than version segments such as 'v1') are replaced with '{id}' so that
+    requests for different resources are counted together.
+    """
+    url = urlparse(str(request.url))
+    segments = [
+        s if not any(c.isdigit()
+                     for c in s) or _VERSION.fullmatch(s) else '{id}'
+        for s in url.path.split('/')
+    ]
+    return f'{request.method} {url.netloc}{"/".join(segments)}'
+
+
+class MetricsHook:
+    """Receiver of the events of the requests made by a Session.
+
+    The methods do nothing, subclasses override the events they are
+    interested in. Methods are called from the Session's event loop and
+    should return quickly.
+    """
+
+    def queue_wait(self, request: httpx.Request, seconds: float):
+        """Request waited for the rate and concurrency limits."""
+
+    def request_start(self, request: httpx.Request):
+        """Request is being sent."""
+
+    def request_end(self,
+                    request: httpx.Request,
+                    response: Optional[httpx.Response],
+                    seconds: float,
+                    error: Optional[Exception] = None):
+        """Response headers were received or the request failed.
+
+        Parameters:
+            request: The request.
+            response: The response, None if the request failed.
+            seconds: Time from sending the request to receiving the response
+                headers or failing.
+            error: The exception raised if the request failed, including
+                exceptions raised for error responses.
+        """
+
+    def retry(self,
+              request: httpx.Request,
+              error: Exception,
+              attempt: int,
+              wait: float):
+        """Request failed and will be retried.
+
+        Parameters:
+            request: The request.
+            error: The exception that is being retried.
+            attempt: Number of the attempt that failed, starting at 1.
+            wait: Seconds to wait before retrying.
+        """
+
+    def stream_bytes(self, request: httpx.Request, num_bytes: int):
+        """Body of a response was received.
+
+        This is called for both streamed and non-streamed responses, for a
+        streamed response once it is closed.
+        """
+
+
+class Histogram:
+    """Counts of observations in cumulative buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets)) + (math.inf, )
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """Record an observation."""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile, None if there are no observations.
+
+        The estimate is interpolated linearly within the bucket containing
+        the quantile, as done by Prometheus' histogram_quantile. A quantile
+        in the last bucket is reported as that bucket's lower bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and cumulative + count >= rank:
+                if math.isinf(bound):
+                    return lower
+                return lower + (bound - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = bound
+        return lower
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Bucket upper bounds and the number of observations within them."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsCollector(MetricsHook):
+    """In-memory aggregation of request metrics.
+
+    Latency is recorded per endpoint, see `endpoint()`, along with the
+    number of requests by outcome and the bytes received. Time waiting for
+    the Session's limits and retries are recorded for the Session as a
+    whole.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Parameters:
+            buckets: Upper bounds of the histogram buckets, in seconds.
+        """
+        self._buckets = buckets
+        self.latency: Dict[str, Histogram] = {}
+        self.requests: Counter[Tuple[str, str]] = Counter()
+        self.bytes: Counter[str] = Counter()
+        self.queue_wait_time = Histogram(buckets)
+        self.retries: Counter[str] = Counter()
+        self.retry_wait_time = 0.0
+
+    def queue_wait(self, request, seconds):
+        self.queue_wait_time.observe(seconds)
+
+    def request_end(self, request, response, seconds, error=None):
+        name = endpoint(request)
+        if name not in self.latency:
+            self.latency[name] = Histogram(self._buckets)
+        self.latency[name].observe(seconds)
+        outcome = type(error).__name__ if error is not None else str(
+            response.status_code)
+        self.requests.update([(name, outcome)])
+
+    def retry(self, request, error, attempt, wait):
+        self.retries.update([type(error).__name__])
+        self.retry_wait_time += wait
+
+    def stream_bytes(self, request, num_bytes):
+        self.bytes.update({endpoint(request): num_bytes})
+
+    def summary(self) -> dict:
+        """Summary of the collected metrics.
+
+        Latencies are in seconds and estimated from the histograms.
+        """
+        endpoints: Dict[str, dict] = {}
+        for name, hist in sorted(self.latency.items()):
+            endpoints[name] = {
+                'requests': hist.count,
+                'outcomes': {
+                    outcome: count
+                    for (n, outcome), count in sorted(self.requests.items())
+                    if n == name
+                },
+                'p50': hist.quantile(0.5),
+                'p95': hist.quantile(0.95),
+                'p99': hist.quantile(0.99),
+                'bytes': self.bytes[name]
+            }
+        return {
+            'requests': sum(self.requests.values()),
+            'endpoints': endpoints,
+            'queue_wait': {
+                'total': self.queue_wait_time.sum,
+                'p50': self.queue_wait_time.quantile(0.5),
+                'p99': self.queue_wait_time.quantile(0.99)
+            },
+            'retries': dict(self.retries),
+            'retry_wait': self.retry_wait_time,
+            'bytes': sum(self.bytes.values())
+        }
+
+    def prometheus(self, prefix: str = 'planet_http') -> str:
+        """Export the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def _histogram(name, help, hists):
+            lines.append(f'# HELP {prefix}_{name} {help}')
+            lines.append(f'# TYPE {prefix}_{name} histogram')
+            for labels, hist in hists:
+                for bound, count in hist.cumulative():
+                    le = '+Inf' if math.isinf(bound) else repr(bound)
+                    bucket_labels = _labels(labels + [('le', le)])
+                    lines.append(f'{prefix}_{name}_bucket{bucket_labels} '
+                                 f'{count}')
+                lines.append(
+                    f'{prefix}_{name}_sum{_labels(labels)} {hist.sum}')
+                lines.append(
+                    f'{prefix}_{name}_count{_labels(labels)} {hist.count}')
+
+        def _counter(name, help, values):
+            lines.append(f'# HELP {prefix}_{name} {help}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            for labels, value in values:
+                lines.append(f'{prefix}_{name}{_labels(labels)} {value}')
+
+        _counter('requests_total',
+                 'Requests by endpoint and outcome.',
+                 [([('endpoint', n), ('outcome', o)], count)
+                  for (n, o), count in sorted(self.requests.items())])
+        _histogram('request_duration_seconds',
+                   'Time to receive response headers.',
+                   [([('endpoint', n)], h)
+                    for n, h in sorted(self.latency.items())])
+        _histogram('queue_wait_seconds',
+                   'Time waiting for rate and concurrency limits.',
+                   [([], self.queue_wait_time)])
+        _counter('retries_total',
+                 'Retried requests by exception.',
+                 [([('exception', e)], count)
+                  for e, count in sorted(self.retries.items())])
+        _counter('retry_wait_seconds_total',
+                 'Time waiting to retry requests.',
+                 [([], self.retry_wait_time)])
+        _counter('received_bytes_total',
+                 'Bytes of response bodies received.',
+                 [([('endpoint', n)], count)
+                  for n, count in sorted(self.bytes.items())])
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ''
+    escaped = [(k, v.replace('\\', '\\\\').replace('"', '\\"'))
+               for k, v in labels]
+    return '{' + ','.join(f'{k}="{v}"' for k, v in escaped) + '}'
@@ -13,8 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Manage data for requests and responses."""
+import asyncio
+import contextlib
+import hashlib
 import logging
 import mimetypes
+import os
 from pathlib import Path
 import random
 import re
@@ -25,10 +29,19 @@ from urllib.parse import urlparse
 import httpx
 from tqdm.asyncio import tqdm
 
-from .exceptions import PagingError
+from .exceptions import DownloadError, PagingError
+from .reporting import TransferProgress
 
 LOGGER = logging.getLogger(__name__)
 
+# data is written to disk in blocks of this size, each download holds up to
+# two blocks, so 50 concurrent downloads hold up to 100 MiB
+WRITE_BUFFER_SIZE = 1024 * 1024
+# download progress is reported at most once per this many bytes
+PROGRESS_INTERVAL = 1024 * 1024
+# suffix of the temporary files downloads are written to
+PARTIAL_SUFFIX = '.part'
+
 
 class Response:
     """Handles the Planet server's response to a HTTP request."""
@@ -49,6 +62,11 @@ class Response:
         """HTTP status code"""
         return self._http_response.status_code
 
+    @property
+    def headers(self) -> httpx.Headers:
+        """HTTP response headers"""
+        return self._http_response.headers
+
     def json(self) -> dict:
         """Response json"""
         return self._http_response.json()
@@ -56,10 +74,6 @@ class Response:
 
 class StreamingResponse(Response):
 
-    @property
-    def headers(self) -> httpx.Headers:
-        return self._http_response.headers
-
     @property
     def url(self) -> str:
         return str(self._http_response.url)
@@ -68,9 +82,8 @@ class StreamingResponse(Response):
     def num_bytes_downloaded(self) -> int:
         return self._http_response.num_bytes_downloaded
 
-    async def aiter_bytes(self):
-        async for c in self._http_response.aiter_bytes():
-            yield c
+    def aiter_bytes(self, chunk_size: Optional[int] = None):
+        return self._http_response.aiter_bytes(chunk_size)
 
     def aiter_lines(self):
         return self._http_response.aiter_lines()
@@ -98,10 +111,8 @@ class StreamingBody:
         response. If not found, falls back to resolving the name from the url
         or generating a random name with the type from the response.
         """
-        name = (_get_filename_from_headers(self._response.headers)
-                or _get_filename_from_url(self._response.url)
-                or _get_random_filename(
-                    self._response.headers.get('content-type')))
+        name = (_get_filename(self._response) or _get_random_filename(
+            self._response.headers.get('content-type')))
         return name
 
     @property
@@ -112,12 +123,31 @@ class StreamingBody:
     async def write(self,
                     filename: Path,
                     overwrite: bool = True,
-                    progress_bar: bool = True):
+                    progress_bar: bool = True,
+                    chunk_size: Optional[int] = None,
+                    digest: Optional[str] = None,
+                    digest_type: str = 'md5',
+                    reporter: Optional[TransferProgress] = None):
         """Write the body to a file.
+
+        The body is written to a temporary file next to the destination,
+        which is renamed to the destination once the body is complete.
+
         Parameters:
             filename: Name to assign to downloaded file.
             overwrite: Overwrite any existing files.
             progress_bar: Show progress bar during download.
+            chunk_size: Size of the chunks to read the body in. Defaults to
+                the size of the chunks received from the network.
+            digest: Expected hex digest of the body.
+            digest_type: Hash algorithm of the digest, e.g. 'md5' or
+                'sha256'.
+            reporter: Aggregate reporter to report progress to. The
+                progress bar of the file is not shown when given.
+
+        Raises:
+            planet.exceptions.DownloadError: If the body is shorter than its
+                Content-Length or does not match the digest.
         """
 
         class _LOG:
@@ -141,10 +171,26 @@ class StreamingBody:
                     self.previous = new
 
         unit = 1024 * 1024
+        filename = Path(filename)
 
-        mode = 'wb' if overwrite else 'xb'
+        if not overwrite and filename.exists():
+            LOGGER.info(f'File {filename} exists, not overwriting')
+            return
+
+        # the body is written to a temporary file in the same directory that
+        # replaces the destination once it is complete, so an interrupted
+        # download never leaves a partial file at the destination. The name
+        # is fixed so that a file left by a killed download is reused.
+        tmp = filename.with_name(f'.{filename.name}{PARTIAL_SUFFIX}')
+        expected_size = self._expected_size()
+        hasher = hashlib.new(digest_type) if digest else None
+        if reporter is not None:
+            progress_bar = False
+            reporter.start(str(filename), expected_size)
         try:
-            with open(filename, mode) as fp:
+            with open(tmp, 'wb') as fp:
+                if expected_size:
+                    _preallocate(fp, expected_size)
                 _log = _LOG(self.size,
                             16 * unit,
                             filename,
@@ -156,14 +202,162 @@ class StreamingBody:
                           desc=str(filename),
                           disable=not progress_bar) as progress:
                     previous = self._response.num_bytes_downloaded
-                    async for chunk in self._response.aiter_bytes():
-                        fp.write(chunk)
-                        new = self._response.num_bytes_downloaded
-                        _log.update(new)
-                        progress.update(new - previous)
-                        previous = new
-        except FileExistsError:
-            LOGGER.info(f'File {filename} exists, not overwriting')
+                    # small bodies do not need a full sized buffer
+                    buffer_size = min(self.size, WRITE_BUFFER_SIZE)
+                    async with _FileWriter(fp, buffer_size, hasher) as writer:
+                        async for chunk in self._response.aiter_bytes(
+                                chunk_size):
+                            await writer.write(chunk)
+                            new = self._response.num_bytes_downloaded
+                            # reporting every chunk is costly at high rates
+                            if new - previous >= PROGRESS_INTERVAL:
+                                _log.update(new)
+                                progress.update(new - previous)
+                                if reporter is not None:
+                                    reporter.update(str(filename),
+                                                    new - previous)
+                                previous = new
+                    new = self._response.num_bytes_downloaded
+                    _log.update(new)
+                    progress.update(new - previous)
+                    if reporter is not None:
+                        reporter.update(str(filename), new - previous)
+
+            if expected_size is not None and \
+                    writer.bytes_written != expected_size:
+                raise DownloadError(
+                    f'Download of {filename} is incomplete: received '
+                    f'{writer.bytes_written} of {expected_size} bytes.')
+
+            if hasher and digest and hasher.hexdigest() != digest.lower():
+                raise DownloadError(
+                    f'Download of {filename} is corrupt: {digest_type} '
+                    f'checksum {hasher.hexdigest()} does not match {digest}.')
+
+            if not overwrite and filename.exists():
+                # written by someone else while downloading
+                LOGGER.info(f'File {filename} exists, not overwriting')
+                return
+
+            os.replace(tmp, filename)
+        except BaseException:
+            if reporter is not None:
+                reporter.finish(str(filename), failed=True)
+                reporter = None
+            raise
+        finally:
+            tmp.unlink(missing_ok=True)
+            if reporter is not None:
+                reporter.finish(str(filename))
+
+    def _expected_size(self) -> Optional[int]:
+        """Size of the decoded body, if known."""
+        # Content-Length is the size of the encoded body
+        encoding = self._response.headers.get('Content-Encoding', 'identity')
+        length = self._response.headers.get('Content-Length')
+        if encoding != 'identity' or length is None:
+            return None
+        return int(length)
+
+
+def _preallocate(fp, size: int):
+    """Reserve disk space for a file to reduce fragmentation, if supported."""
+    if not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(fp.fileno(), 0, size)
+    except (OSError, AttributeError) as e:
+        # not every file system supports it
+        LOGGER.debug(f'could not preallocate {size} bytes: {e}')
+
+
+class _FileWriter:
+    """Write to a file without blocking the event loop.
+
+    Data is collected into blocks of buffer_size bytes, which are hashed, if
+    a hasher is given, and written by a worker thread. At most one block is
+    written at a time, the next block is collected in a second buffer while
+    it is being written. The buffers are allocated when they are first
+    needed and reused for the whole file.
+    """
+
+    def __init__(self, fp, buffer_size: int = WRITE_BUFFER_SIZE, hasher=None):
+        self._fp = fp
+        self._hasher = hasher
+        self.bytes_written = 0
+        self._buffer_size = max(buffer_size, 1)
+        self._buffer: Optional[bytearray] = None
+        self._view = memoryview(b'')
+        self._spare: Optional[bytearray] = None
+        self._used = 0
+        self._pending: Optional[asyncio.Future] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, *args):
+        if exc_type is None:
+            await self.flush()
+        else:
+            # the file must not be closed while it is being written to
+            with contextlib.suppress(Exception):
+                await self._wait()
+
+    async def write(self, data: bytes):
+        size = self._buffer_size
+        if self._buffer is None:
+            self._buffer = bytearray(size)
+            self._view = memoryview(self._buffer)
+        self.bytes_written += len(data)
+        remaining = memoryview(data)
+        while remaining:
+            count = min(len(remaining), size - self._used)
+            self._view[self._used:self._used + count] = remaining[:count]
+            self._used += count
+            remaining = remaining[count:]
+            if self._used == size:
+                await self._submit()
+
+    async def flush(self):
+        """Write all buffered data."""
+        await self._submit(last=True)
+        await self._wait()
+
+    async def _submit(self, last: bool = False):
+        # the spare buffer is free once the pending write completes
+        await self._wait()
+        if self._used:
+            block = self._view[:self._used]
+            if last:
+                # no more data is collected, so no spare buffer is needed
+                self._buffer = None
+                self._view = memoryview(b'')
+            else:
+                if self._spare is None:
+                    self._spare = bytearray(self._buffer_size)
+                self._buffer, self._spare = self._spare, self._buffer
+                self._view = memoryview(self._buffer)
+            self._used = 0
+            loop = asyncio.get_running_loop()
+            self._pending = loop.run_in_executor(None, self._write, block)
+
+    def _write(self, block: memoryview):
+        if self._hasher:
+            self._hasher.update(block)
+        self._fp.write(block)
+
+    async def _wait(self):
+        if self._pending is not None:
+            # shielded so that cancellation leaves the write pending, to be
+            # waited for before the file is closed
+            await asyncio.shield(self._pending)
+            self._pending = None
+
+
+def _get_filename(response: StreamingResponse) -> Optional[str]:
+    """Get the filename the server assigns to a resource, if available."""
+    return (_get_filename_from_headers(response.headers)
+            or _get_filename_from_url(response.url))
 
 
 def _get_filename_from_headers(headers):
@@ -442,7 +442,7 @@ def _tool(name: str, parameters: dict) -> dict:
     return {name: parameters}
 
 
-def clip_tool(aoi: dict) -> dict:
+def clip_tool(aoi: dict, max_vertices: Optional[int] = None) -> dict:
     """Create the API spec representation of a clip tool.
 
     Example:
@@ -462,6 +462,8 @@ def clip_tool(aoi: dict) -> dict:
 
     Parameters:
         aoi: clip GeoJSON, either Polygon or Multipolygon.
+        max_vertices: Simplify the clip GeoJSON to at most this many vertices,
+            see `planet.geojson.simplify_geom()`.
 
     Raises:
         planet.exceptions.ClientError: If GeoJSON is not a valid polygon or
@@ -473,6 +475,8 @@ def clip_tool(aoi: dict) -> dict:
     if geom['type'].lower() not in [v.lower() for v in valid_types]:
         raise ClientError(
             f'Invalid geometry type: {geom["type"]} is not in {valid_types}.')
+    if max_vertices is not None and geom['type'] != 'ref':
+        geom = geojson.simplify_geom(geom, max_vertices=max_vertices)
     return _tool('clip', {'aoi': geom})
 
 
@@ -13,8 +13,11 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 """Functionality for reporting progress."""
+import json
 import logging
-from typing import Optional
+import sys
+import time
+from typing import Dict, Optional, TextIO
 
 from tqdm.asyncio import tqdm
 
@@ -155,3 +158,170 @@ class AssetStatusBar(ProgressBar):
 
         if self.bar is not None:
             self.bar.refresh()
+
+
+class TransferProgress(ProgressBar):
+    """Reporter of the combined progress of many file transfers.
+
+    A single reporter tracks the bytes transferred, files completed and
+    failed, throughput and estimated time remaining across all transfers it
+    is given, e.g. all downloads of a Session. It is refreshed at most once
+    every `interval` seconds, either as one progress bar or, with `ndjson`,
+    as one JSON object per line for consumption by other programs.
+
+    Example:
+        ```python
+        from planet import reporting, Session
+
+        async with Session() as sess:
+            with reporting.TransferProgress() as progress:
+                sess.progress = progress
+                # downloads made with the session are reported here
+        ```
+    """
+
+    def __init__(self,
+                 disable: bool = False,
+                 ndjson: bool = False,
+                 interval: float = 0.5,
+                 file: Optional[TextIO] = None):
+        """Initialize the object.
+
+        Parameters:
+            disable: Do not report progress.
+            ndjson: Report progress as newline-delimited JSON instead of a
+                progress bar.
+            interval: Minimum number of seconds between reports.
+            file: Stream to report to, defaults to stderr.
+        """
+        self.ndjson = ndjson
+        self.interval = interval
+        self.file = file
+
+        self.total_bytes = 0
+        self.bytes_done = 0
+        self.files_total = 0
+        self.files_done = 0
+        self.files_failed = 0
+        self.throughput = 0.0
+        # size and bytes transferred of each transfer in progress
+        self._sizes: Dict[str, Optional[int]] = {}
+        self._done: Dict[str, int] = {}
+        self._last_report: Optional[float] = None
+        self._last_bytes = 0
+        self._start = time.monotonic()
+        super().__init__(disable=disable)
+
+    def __exit__(self, *args):
+        self.refresh(force=True)
+        if self.bar is not None:
+            self.bar.close()
+
+    def open_bar(self):
+        """Initialize and start the progress bar."""
+        self._start = time.monotonic()
+        if not self.ndjson:
+            self.bar = tqdm(total=0,
+                            unit='B',
+                            unit_scale=True,
+                            unit_divisor=1024,
+                            desc='files 0/0',
+                            file=self.file,
+                            disable=self.disable)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until all started transfers are complete.
+
+        None if the throughput or the size of a transfer is not known.
+        """
+        if not self.throughput or None in self._sizes.values():
+            return None
+        return max(self.total_bytes - self.bytes_done, 0) / self.throughput
+
+    def start(self, name: str, size: Optional[int] = None):
+        """Report the start of a transfer.
+
+        Parameters:
+            name: Name of the transferred file.
+            size: Size of the file in bytes, if known.
+        """
+        self._sizes[name] = size
+        self._done[name] = 0
+        self.files_total += 1
+        self.total_bytes += size or 0
+        self.refresh()
+
+    def update(self, name: str, num_bytes: int):
+        """Report bytes transferred for a file."""
+        self.bytes_done += num_bytes
+        if name in self._done:
+            self._done[name] += num_bytes
+        self.refresh()
+
+    def finish(self, name: str, failed: bool = False):
+        """Report the end of a transfer.
+
+        Parameters:
+            name: Name of the transferred file.
+            failed: Whether the transfer failed.
+        """
+        if failed:
+            self.files_failed += 1
+        else:
+            self.files_done += 1
+        # the bytes expected but not transferred are no longer expected and
+        # a file of unknown size is now known to be as large as transferred
+        self.total_bytes += self._done.pop(
+            name, 0) - (self._sizes.pop(name, None) or 0)
+        self.refresh()
+
+    def summary(self) -> dict:
+        """Current progress of all transfers."""
+        return {
+            'elapsed': round(time.monotonic() - self._start, 3),
+            'bytes': self.bytes_done,
+            'total_bytes': self.total_bytes,
+            'files': self.files_total,
+            'files_done': self.files_done,
+            'files_failed': self.files_failed,
+            'throughput': round(self.throughput, 1),
+            'eta': None if self.eta is None else round(self.eta, 1)
+        }
+
+    def refresh(self, force: bool = False):
+        """Report progress if the report interval has passed.
+
+        Parameters:
+            force: Report regardless of the interval.
+        """
+        now = time.monotonic()
+        if self._last_report is None:
+            self._last_report = self._start
+        elapsed = now - self._last_report
+        if not force and elapsed < self.interval:
+            return
+
+        if elapsed > 0:
+            rate = (self.bytes_done - self._last_bytes) / elapsed
+            # smooth over reports so bursts do not swing the estimate
+            self.throughput = rate if not self.throughput \
+                else 0.3 * rate + 0.7 * self.throughput
+        self._last_report = now
+        self._last_bytes = self.bytes_done
+
+        if self.disable:
+            return
+
+        if self.ndjson:
+            stream = self.file or sys.stderr
+            stream.write(json.dumps(self.summary()) + '\n')
+            stream.flush()
+        elif self.bar is not None:
+            self.bar.total = self.total_bytes
+            self.bar.update(self.bytes_done - self.bar.n)
+            desc = f'files {self.files_done}/{self.files_total}'
+            if self.files_failed:
+                desc += f', {self.files_failed} failed'
+            self.bar.set_description_str(desc, refresh=False)
+            self.bar.refresh()
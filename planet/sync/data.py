@@ -13,13 +13,15 @@
 # the License.
 """Functionality for interacting with the data api"""
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
 
+from planet import exceptions
 from planet.models import GeojsonLike
 
 from ..http import Session
 
 from planet.clients import DataClient
+from planet.clients.data import COVERAGE_CONCURRENCY, GET_ITEMS_CHUNK_SIZE
 
 LIST_SORT_DEFAULT = 'created desc'
 LIST_SEARCH_TYPE_DEFAULT = 'any'
@@ -351,7 +353,9 @@ class DataAPI:
                        filename: Optional[str] = None,
                        directory: Path = Path('.'),
                        overwrite: bool = False,
-                       progress_bar: bool = True) -> Path:
+                       progress_bar: bool = True,
+                       preflight: bool = False,
+                       chunk_size: Optional[int] = None) -> Path:
         """Download an asset.
 
         The asset must be active before it can be downloaded. This can be
@@ -367,6 +371,12 @@ class DataAPI:
             directory: Base directory for file download.
             overwrite: Overwrite any existing files.
             progress_bar: Show progress bar during download.
+            preflight: If no filename is given, determine the name the
+                server assigns to the file with a HEAD request so that an
+                existing file is found without requesting the download.
+            chunk_size: Size in bytes of the chunks to read the download
+                in. Defaults to the size of the chunks received from the
+                network.
 
         Returns:
             Path to downloaded file.
@@ -381,7 +391,9 @@ class DataAPI:
                                         filename,
                                         directory,
                                         overwrite,
-                                        progress_bar))
+                                        progress_bar,
+                                        preflight,
+                                        chunk_size))
 
     @staticmethod
     def validate_checksum(asset: Dict[str, Any], filename: Path):
@@ -418,6 +430,48 @@ class DataAPI:
         return self._client._call_sync(
             self._client.get_item(item_type_id, item_id))
 
+    def get_items(
+        self,
+        item_type_id: str,
+        item_ids: Iterable[str],
+        chunk_size: int = GET_ITEMS_CHUNK_SIZE,
+        on_missing: Optional[Callable[[str], None]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over many items of one item type, fetched in bulk.
+
+        Item ids are packed into quick searches filtered on item id, so
+        fetching N items costs about N / chunk_size requests instead of N.
+        Ids that are not returned by a search are requested individually
+        before being reported as missing.
+
+        Example:
+
+        ```python
+        pl = Planet()
+        for item in pl.data.get_items('PSScene', item_ids):
+            print(item['id'])
+        ```
+
+        Parameters:
+            item_type_id: Item type identifier.
+            item_ids: Item identifiers.
+            chunk_size: Maximum number of ids to include in each search.
+            on_missing: Function called with the id of each item that could
+                not be found.
+
+        Yields:
+            Description of an item, in the order of item_ids.
+
+        Raises:
+            planet.exceptions.APIError: On API error.
+            planet.exceptions.ClientError: If chunk_size is not positive.
+        """
+        return self._client._aiter_to_iter(
+            self._client.get_items(item_type_id,
+                                   item_ids,
+                                   chunk_size,
+                                   on_missing))
+
     def get_item_coverage(
         self,
         item_type_id: str,
@@ -447,3 +501,54 @@ class DataAPI:
                                            geometry=geometry,
                                            mode=mode,
                                            band=band))
+
+    def get_items_coverage(
+        self,
+        item_type_id: str,
+        item_ids: Iterable[str],
+        geometry: GeojsonLike,
+        mode: Optional[str] = None,
+        band: Optional[str] = None,
+        concurrency: int = COVERAGE_CONCURRENCY,
+        on_error: Optional[Callable[[str, exceptions.APIError], None]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Get clear coverage for many items within a custom area of interest.
+
+        Coverage requests are submitted concurrently and results are yielded
+        as they complete, not in the order of item_ids. Items whose coverage
+        request fails are skipped and passed to on_error.
+
+        Example:
+
+        ```python
+        pl = Planet()
+        for result in pl.data.get_items_coverage('PSScene', item_ids, aoi):
+            print(result['item_id'], result['coverage']['clear_percent'])
+        ```
+
+        Parameters:
+            item_type_id: Item type identifier.
+            item_ids: Item identifiers.
+            geometry: A feature reference or a GeoJSON
+            mode: Method used for coverage calculation
+            band: Specific band to extract from UDM2
+            concurrency: Maximum number of coverage requests in flight.
+            on_error: Function called with the id and the error of each item
+                whose coverage could not be estimated.
+
+        Yields:
+            A dict with the `item_id`, the `coverage` description for the AOI
+            within the scene and the `latency` (in seconds) of the request.
+
+        Raises:
+            planet.exceptions.InvalidAPIKey: If the API key is not valid.
+            planet.exceptions.ClientError: If concurrency is not positive.
+        """
+        return self._client._aiter_to_iter(
+            self._client.get_items_coverage(item_type_id=item_type_id,
+                                            item_ids=item_ids,
+                                            geometry=geometry,
+                                            mode=mode,
+                                            band=band,
+                                            concurrency=concurrency,
+                                            on_error=on_error))
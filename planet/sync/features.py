@@ -12,8 +12,11 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 
-from typing import Iterator, Optional, Union
-from planet.clients.features import FeaturesClient
+from typing import Iterable, Iterator, Optional, Union
+from planet.cache import FeatureCache
+from planet.clients.features import (FeaturesClient,
+                                     MAX_CHUNK_BYTES,
+                                     MAX_CHUNK_FEATURES)
 from planet.http import Session
 from planet.models import Feature, GeoInterface
 
@@ -22,14 +25,20 @@ class FeaturesAPI:
 
     _client: FeaturesClient
 
-    def __init__(self, session: Session, base_url: Optional[str] = None):
+    def __init__(self,
+                 session: Session,
+                 base_url: Optional[str] = None,
+                 feature_cache: Optional[FeatureCache] = None):
         """
         Parameters:
             session: Open session connected to server.
             base_url: The base URL to use. Defaults to production Features API
                 base url.
+            feature_cache: Cache of features got with `get_item()`. Not
+                cached by default. Features the client deletes or adds are
+                removed from it.
         """
-        self._client = FeaturesClient(session, base_url)
+        self._client = FeaturesClient(session, base_url, feature_cache)
 
     def list_collections(self, limit: int = 0) -> Iterator[dict]:
         """
@@ -127,10 +136,33 @@ class FeaturesAPI:
     def get_item(self, collection_id: str, feature_id: str) -> Feature:
         """
         Return metadata for a single feature in a collection
+
+        If the client has a feature cache, a cached feature is returned
+        without contacting the server while it is fresh and is otherwise
+        revalidated with the server.
         """
         return self._client._call_sync(
             self._client.get_item(collection_id, feature_id))
 
+    def warm_cache(self, collection_id: str, prune: bool = True) -> int:
+        """
+        Fill the client's feature cache with the features of a collection.
+
+        Parameters:
+            collection_id: The ID of the collection.
+            prune: Remove cached features that are no longer in the
+                collection.
+
+        Returns:
+            The number of features cached.
+
+        Raises:
+            planet.exceptions.ClientError: If the client has no feature
+                cache.
+        """
+        return self._client._call_sync(
+            self._client.warm_cache(collection_id, prune=prune))
+
     def delete_item(self, collection_id: str, feature_id: str) -> None:
         """
         Delete a feature from a collection.
@@ -190,3 +222,144 @@ class FeaturesAPI:
                                                    property_id)
 
         return self._client._call_sync(uploaded_features)
+
+    def bulk_add_items(self,
+                       collection_id: str,
+                       features: Iterable[Union[dict, GeoInterface]],
+                       property_id: Optional[str] = None,
+                       max_features: int = MAX_CHUNK_FEATURES,
+                       max_bytes: int = MAX_CHUNK_BYTES,
+                       concurrency: int = 4,
+                       retries: int = 2) -> Iterator[str]:
+        """
+        Add many features to the collection given by `collection_id`.
+
+        Features are taken from `features` as they are needed and packed into
+        FeatureCollections of at most `max_features` features and
+        `max_bytes` bytes of JSON, which are uploaded `concurrency` at a
+        time. Feature references are yielded as each upload completes, so
+        they are not in the order of `features`.
+
+        If the upload of a chunk fails with a server, network or rate limit
+        error, the chunk is uploaded again up to `retries` times.
+
+        Example:
+
+        ```
+        pl = Planet()
+        with open("parcels.geojson") as f:
+            for ref in pl.features.bulk_add_items(
+                    "my-collection", planet.io.read_features(f)):
+                print(ref)
+        ```
+
+        Parameters:
+            collection_id: The collection to add the features to.
+            features: GeoJSON Features or geometries, or objects that
+                implement __geo_interface__.
+            property_id: The name of a property whose value will become the
+                id of each feature.
+            max_features: Maximum number of features in a chunk.
+            max_bytes: Maximum size of a chunk's JSON in bytes.
+            concurrency: Maximum number of chunks uploaded at a time.
+            retries: Number of times a failed chunk is uploaded again.
+
+        Raises:
+            planet.exceptions.APIError: On API error.
+            planet.exceptions.ClientError: If a limit is not positive.
+        """
+        return self._client._aiter_to_iter(
+            self._client.bulk_add_items(collection_id,
+                                        features,
+                                        property_id=property_id,
+                                        max_features=max_features,
+                                        max_bytes=max_bytes,
+                                        concurrency=concurrency,
+                                        retries=retries))
+
+    def delete_items(self,
+                     collection_id: str,
+                     feature_ids: Iterable[str],
+                     concurrency: int = 8) -> Iterator[str]:
+        """
+        Delete many features from a collection.
+
+        Features are deleted `concurrency` at a time and their ids are
+        yielded as each is deleted, so they are not in the order of
+        `feature_ids`.
+
+        Parameters:
+            collection_id: The ID of the collection containing the features.
+            feature_ids: The IDs or references of the features to delete.
+            concurrency: Maximum number of features deleted at a time.
+
+        Example:
+
+        ```
+        pl = Planet()
+        ids = [f["id"] for f in pl.features.list_items("my-collection")]
+        for feature_id in pl.features.delete_items("my-collection", ids):
+            print(feature_id)
+        ```
+
+        Raises:
+            planet.exceptions.APIError: On API error.
+            planet.exceptions.ClientError: If concurrency is not positive.
+        """
+        return self._client._aiter_to_iter(
+            self._client.delete_items(collection_id,
+                                      feature_ids,
+                                      concurrency=concurrency))
+
+    def sync_items(self,
+                   collection_id: str,
+                   features: Iterable[Union[dict, GeoInterface]],
+                   property_id: Optional[str] = None,
+                   match: str = 'id',
+                   dry_run: bool = False,
+                   concurrency: int = 4) -> dict:
+        """
+        Make a collection contain the given features.
+
+        The features are compared with those in the collection and only the
+        differences are applied: features that are not in the collection
+        are added, features that changed are deleted and added again and
+        features that are not among the given features are deleted. See
+        `FeaturesClient.sync_items()` for how features are matched.
+
+        Example:
+
+        ```
+        pl = Planet()
+        with open("aois.geojson") as f:
+            report = pl.features.sync_items(
+                "my-collection", planet.io.read_features(f), dry_run=True)
+        print(report)
+        ```
+
+        Parameters:
+            collection_id: The collection to synchronize.
+            features: GeoJSON Features or geometries, or objects that
+                implement __geo_interface__.
+            property_id: The name of a property whose value is the id of
+                each feature.
+            match: 'id' or 'hash'.
+            dry_run: Report the changes without making them.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            A report of the ids of the features that were `added`, `updated`
+            and `deleted` and the number that were `unchanged`.
+
+        Raises:
+            planet.exceptions.APIError: On API error.
+            planet.exceptions.ClientError: If match is not valid or a
+                feature has no id.
+        """
+        return self._client._call_sync(
+            self._client.sync_items(collection_id,
+                                    features,
+                                    property_id=property_id,
+                                    match=match,
+                                    dry_run=dry_run,
+                                    concurrency=concurrency))
@@ -13,8 +13,10 @@
 # the License.
 
 from typing import Iterator, Optional, TypeVar, Union
+from planet.cache import NameCache
 from planet.clients.mosaics import BBox, MosaicsClient
 from planet.http import Session
+from planet.manifest import Manifest
 from planet.models import GeoInterface, Mosaic, Quad, Series
 
 T = TypeVar("T")
@@ -24,14 +26,19 @@ class MosaicsAPI:
 
     _client: MosaicsClient
 
-    def __init__(self, session: Session, base_url: Optional[str] = None):
+    def __init__(self,
+                 session: Session,
+                 base_url: Optional[str] = None,
+                 name_cache: Optional[NameCache] = None):
         """
         Parameters:
             session: Open session connected to server.
             base_url: The base URL to use. Defaults to production Mosaics API
                 base url.
+            name_cache: Cache of mosaics and series looked up by name.
+                Defaults to an in-memory cache for this client.
         """
-        self._client = MosaicsClient(session, base_url)
+        self._client = MosaicsClient(session, base_url, name_cache)
 
     def get_mosaic(self, name_or_id: str) -> Mosaic:
         """Get the API representation of a mosaic by name or id.
@@ -228,10 +235,23 @@ class MosaicsAPI:
                       *,
                       directory: str = ".",
                       overwrite: bool = False,
-                      progress_bar: bool = False):
+                      progress_bar: bool = False,
+                      manifest: Optional[Manifest] = None,
+                      chunk_size: Optional[int] = None):
         """
         Download a quad to a directory.
 
+        Parameters:
+            quad: The quad to download.
+            directory: Directory to download the quad to.
+            overwrite: Overwrite an existing file.
+            progress_bar: Show a progress bar.
+            manifest: Record of previously downloaded quads, see
+                `MosaicsClient.download_quad`.
+            chunk_size: Size in bytes of the chunks to read the download
+                in. Defaults to the size of the chunks received from the
+                network.
+
         Example:
 
         ```python
@@ -243,7 +263,9 @@ class MosaicsAPI:
             self._client.download_quad(quad,
                                        directory=directory,
                                        overwrite=overwrite,
-                                       progress_bar=progress_bar))
+                                       progress_bar=progress_bar,
+                                       manifest=manifest,
+                                       chunk_size=chunk_size))
 
     def download_quads(self,
                        /,
@@ -254,10 +276,19 @@ class MosaicsAPI:
                        bbox: Optional[BBox] = None,
                        geometry: Optional[Union[dict, GeoInterface]] = None,
                        progress_bar: bool = False,
-                       concurrency: int = 4):
+                       concurrency: int = 4,
+                       incremental: bool = False,
+                       verify: bool = False,
+                       chunk_size: Optional[int] = None):
         """
         Download a mosaics' quads to a directory.
 
+        With `incremental`, downloads are recorded in a manifest in the
+        directory and reruns only download quads that are new, changed or
+        whose file does not match the record. Quads republished without a
+        change to their download path or coverage are not detected, see
+        `MosaicsClient.download_quads`.
+
         Example:
 
         ```python
@@ -274,4 +305,7 @@ class MosaicsAPI:
                 geometry=geometry,
                 progress_bar=progress_bar,
                 concurrency=concurrency,
+                incremental=incremental,
+                verify=verify,
+                chunk_size=chunk_size,
             ))
@@ -129,7 +129,10 @@ class OrdersAPI:
                        filename: Optional[str] = None,
                        directory: Path = Path('.'),
                        overwrite: bool = False,
-                       progress_bar: bool = True) -> Path:
+                       progress_bar: bool = True,
+                       preflight: bool = False,
+                       chunk_size: Optional[int] = None,
+                       digest: Optional[str] = None) -> Path:
         """Download ordered asset.
 
         Parameters:
@@ -139,33 +142,58 @@ class OrdersAPI:
                 created if it does not already exist.
             overwrite: Overwrite any existing files.
             progress_bar: Show progress bar during download.
+            preflight: If no filename is given, determine the name the
+                server assigns to the file with a HEAD request so that an
+                existing file is found without requesting the download.
+            chunk_size: Size in bytes of the chunks to read the download
+                in. Defaults to the size of the chunks received from the
+                network.
+            digest: Expected md5 hex digest of the asset.
 
         Returns:
             Path to downloaded file.
 
         Raises:
             planet.exceptions.APIError: On API error.
+            planet.exceptions.DownloadError: If the download is incomplete or
+                does not match the digest.
         """
         return self._client._call_sync(
             self._client.download_asset(location,
                                         filename,
                                         directory,
                                         overwrite,
-                                        progress_bar))
+                                        progress_bar,
+                                        preflight,
+                                        chunk_size,
+                                        digest))
 
     def download_order(self,
                        order_id: str,
                        directory: Path = Path('.'),
                        overwrite: bool = False,
-                       progress_bar: bool = False) -> List[Path]:
+                       progress_bar: bool = False,
+                       incremental: bool = False,
+                       verify: bool = False,
+                       chunk_size: Optional[int] = None) -> List[Path]:
         """Download all assets in an order.
 
+        With `incremental`, downloads are recorded in a manifest in the base
+        directory and reruns only request assets that are missing or whose
+        file does not match the record.
+
         Parameters:
             order_id: The ID of the order.
             directory: Base directory for file download. This directory must
                 already exist.
             overwrite: Overwrite files if they already exist.
             progress_bar: Show progress bar during download.
+            incremental: Use a manifest to skip assets already downloaded.
+            verify: With `incremental`, verify the checksums of existing
+                files rather than only their size.
+            chunk_size: Size in bytes of the chunks to read the download
+                in. Defaults to the size of the chunks received from the
+                network.
 
         Returns:
             Paths to downloaded files.
@@ -179,7 +207,10 @@ class OrdersAPI:
             self._client.download_order(order_id,
                                         directory,
                                         overwrite,
-                                        progress_bar))
+                                        progress_bar,
+                                        incremental,
+                                        verify,
+                                        chunk_size))
 
     def validate_checksum(self, directory: Path, checksum: str):
         """Validate checksums of downloaded files against order manifest.
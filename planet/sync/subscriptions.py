@@ -1,5 +1,6 @@
 """Planet Subscriptions API Python client."""
 
+from pathlib import Path
 from typing import Any, Dict, Iterator, Optional, Sequence, Union, List
 
 from typing_extensions import Literal
@@ -341,7 +342,11 @@ class SubscriptionsAPI:
         created: Optional[str] = None,
         updated: Optional[str] = None,
         completed: Optional[str] = None,
-        item_datetime: Optional[str] = None
+        item_datetime: Optional[str] = None,
+        windows: int = 1,
+        window_by: Literal["created", "completed",
+                           "item_datetime"] = "created",
+        checkpoint: Optional[Union[str, Path]] = None
     ) -> Iterator[Union[Dict[str, Any], str]]:
         """Iterate over results of a Subscription.
 
@@ -360,6 +365,16 @@ class SubscriptionsAPI:
             updated (str): filter by updated time or interval.
             completed (str): filter by completed time or interval.
             item_datetime (str): filter by item datetime or interval.
+            windows (int): number of time windows to split the results
+                into and get concurrently. Results from different windows
+                are interleaved.
+            window_by (str): the filter to split into windows, "created",
+                "completed" or "item_datetime". "completed" requires a
+                completed filter.
+            checkpoint (str or Path): JSON file recording the results
+                already iterated over. Only results updated since are
+                yielded and the file is updated once all results have
+                been iterated over. Cannot be used with `updated`.
 
         Datetime args (created, updated, completed, item_datetime) can either be a
         date-time or an interval, open or closed. Date and time expressions adhere
@@ -370,6 +385,9 @@ class SubscriptionsAPI:
             * A closed interval: "2018-02-12T00:00:00Z/2018-03-18T12:31:12Z"
             * Open intervals: "2018-02-12T00:00:00Z/.." or "../2018-03-18T12:31:12Z"
 
+        With a checkpoint, the file is updated only if iteration completes
+        and fewer than `limit` results were received, so use `limit=0`.
+
         Yields:
             dict: description of a subscription results.
 
@@ -384,19 +402,26 @@ class SubscriptionsAPI:
                                      created,
                                      updated,
                                      completed,
-                                     item_datetime))
-
-    def get_results_csv(self,
-                        subscription_id: str,
-                        status: Optional[Sequence[Literal["created",
-                                                          "queued",
-                                                          "processing",
-                                                          "failed",
-                                                          "success"]]] = None,
-                        created: Optional[str] = None,
-                        updated: Optional[str] = None,
-                        completed: Optional[str] = None,
-                        item_datetime: Optional[str] = None) -> Iterator[str]:
+                                     item_datetime,
+                                     windows,
+                                     window_by,
+                                     checkpoint))
+
+    def get_results_csv(
+        self,
+        subscription_id: str,
+        status: Optional[Sequence[Literal["created",
+                                          "queued",
+                                          "processing",
+                                          "failed",
+                                          "success"]]] = None,
+        created: Optional[str] = None,
+        updated: Optional[str] = None,
+        completed: Optional[str] = None,
+        item_datetime: Optional[str] = None,
+        windows: int = 1,
+        window_by: Literal["created", "completed", "item_datetime"] = "created"
+    ) -> Iterator[str]:
         """Iterate over rows of results CSV for a Subscription.
 
         Parameters:
@@ -407,6 +432,12 @@ class SubscriptionsAPI:
             updated (str): filter by updated time or interval.
             completed (str): filter by completed time or interval.
             item_datetime (str): filter by item datetime or interval.
+            windows (int): number of time windows to split the results
+                into and get concurrently. The header row is yielded once
+                and rows from different windows are interleaved.
+            window_by (str): the filter to split into windows, "created",
+                "completed" or "item_datetime". "completed" requires a
+                completed filter.
 
         Datetime args (created, updated, completed, item_datetime) can either be a
         date-time or an interval, open or closed. Date and time expressions adhere
@@ -417,6 +448,10 @@ class SubscriptionsAPI:
             * A closed interval: "2018-02-12T00:00:00Z/2018-03-18T12:31:12Z"
             * Open intervals: "2018-02-12T00:00:00Z/.." or "../2018-03-18T12:31:12Z"
 
+        If the CSV is interrupted by a network error, the request is
+        reissued and rows continue from where they stopped, without
+        repeating rows.
+
         Yields:
             str: a row from a CSV file.
 
@@ -424,18 +459,15 @@ class SubscriptionsAPI:
             APIError: on an API server error.
             ClientError: on a client error.
         """
-        # Note: retries are not implemented yet. This project has
-        # retry logic for HTTP requests, but does not handle errors
-        # during streaming. We may want to consider a retry decorator
-        # for this entire method a la stamina:
-        # https://github.com/hynek/stamina.
         return self._client._aiter_to_iter(
             self._client.get_results_csv(subscription_id,
                                          status,
                                          created,
                                          updated,
                                          completed,
-                                         item_datetime))
+                                         item_datetime,
+                                         windows,
+                                         window_by))
 
     def get_summary(self) -> Dict[str, Any]:
         """Summarize the status of all subscriptions via GET.
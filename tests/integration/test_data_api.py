@@ -11,6 +11,7 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations under
 # the License.
+import asyncio
 from contextlib import nullcontext as does_not_raise
 import copy
 from http import HTTPStatus
@@ -1446,6 +1447,71 @@ async def test_download_asset(exists,
         assert len(path.read_bytes()) == 527
 
 
+@respx.mock
+@pytest.mark.anyio
+@pytest.mark.parametrize("filename, preflight, head_calls",
+                         [("img.tif", False, 0), (None, True, 1)])
+async def test_download_asset_existing(filename,
+                                       preflight,
+                                       head_calls,
+                                       tmpdir,
+                                       session):
+    dl_url = f'{TEST_URL}/1?token=IAmAToken'
+    headers = {'Content-Disposition': 'attachment; filename="img.tif"'}
+    head = respx.head(dl_url)
+    head.return_value = httpx.Response(HTTPStatus.OK, headers=headers)
+    get = respx.get(dl_url)
+    get.return_value = httpx.Response(HTTPStatus.OK,
+                                      content=b'new',
+                                      headers=headers)
+
+    asset = {"location": dl_url, "type": "basic_udm2"}
+    cl = DataClient(session, base_url=TEST_URL)
+
+    # the file is downloaded if it does not exist
+    path = await cl.download_asset(asset,
+                                   filename=filename,
+                                   directory=tmpdir,
+                                   preflight=preflight)
+    assert path.read_bytes() == b'new'
+    assert get.call_count == 1
+    assert head.call_count == head_calls
+
+    # and found without a download request if it does
+    path.write_text('i exist')
+    path = await cl.download_asset(asset,
+                                   filename=filename,
+                                   directory=tmpdir,
+                                   preflight=preflight)
+    assert path == Path(tmpdir, 'img.tif')
+    assert path.read_text() == 'i exist'
+    assert get.call_count == 1
+    assert head.call_count == 2 * head_calls
+
+
+@respx.mock
+@pytest.mark.anyio
+@pytest.mark.parametrize("status",
+                         [HTTPStatus.FORBIDDEN, HTTPStatus.METHOD_NOT_ALLOWED])
+async def test_download_asset_preflight_refused(status, tmpdir, session):
+    """A refused HEAD request falls back to the download request."""
+    dl_url = f'{TEST_URL}/1?token=IAmAToken'
+    head = respx.head(dl_url)
+    head.return_value = httpx.Response(status)
+    headers = {'Content-Disposition': 'attachment; filename="img.tif"'}
+    respx.get(dl_url).return_value = httpx.Response(HTTPStatus.OK,
+                                                    content=b'new',
+                                                    headers=headers)
+
+    asset = {"location": dl_url, "type": "basic_udm2"}
+    cl = DataClient(session, base_url=TEST_URL)
+    path = await cl.download_asset(asset, directory=tmpdir, preflight=True)
+
+    assert path == Path(tmpdir, 'img.tif')
+    assert path.read_bytes() == b'new'
+    assert head.call_count == 1
+
+
 @respx.mock
 @pytest.mark.anyio
 @pytest.mark.parametrize("exists, overwrite",
@@ -1642,6 +1708,129 @@ def test_get_item_not_found_sync(item_descriptions, data_api):
         data_api.get_item(item_type, item_id)
 
 
+@respx.mock
+@pytest.mark.anyio
+async def test_get_items(item_descriptions, mock_bundles, session):
+    """Items are searched for in chunks and yielded in request order."""
+    item1, item2, item3 = item_descriptions
+    item_type = item1['properties']['item_type']
+    quick_search_url = f'{TEST_URL}/quick-search'
+
+    # search results are returned out of request order
+    route = respx.post(quick_search_url)
+    route.side_effect = [
+        httpx.Response(HTTPStatus.OK,
+                       json={
+                           "_links": {}, "features": [item1, item3]
+                       }),
+        httpx.Response(HTTPStatus.OK, json={
+            "_links": {}, "features": [item2]
+        })
+    ]
+
+    ids = [item3['id'], item1['id'], item2['id']]
+    cl = DataClient(session, base_url=TEST_URL)
+    items = [i async for i in cl.get_items(item_type, ids, chunk_size=2)]
+
+    assert items == [item3, item1, item2]
+    assert route.call_count == 2
+
+    first_request = json.loads(route.calls[0].request.content)
+    assert first_request == {
+        'filter': data_filter.string_in_filter('id', ids[:2]),
+        'item_types': [item_type]
+    }
+    assert route.calls[0].request.url.params['_page_size'] == '2'
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_get_items_fallback_and_missing(item_descriptions,
+                                              mock_bundles,
+                                              session):
+    """Ids missing from search results are requested individually."""
+    item1, item2, _ = item_descriptions
+    item_type = item1['properties']['item_type']
+
+    respx.post(f'{TEST_URL}/quick-search').return_value = httpx.Response(
+        HTTPStatus.OK, json={
+            "_links": {}, "features": [item1]
+        })
+    item2_url = f'{TEST_URL}/item-types/{item_type}/items/{item2["id"]}'
+    item2_route = respx.get(item2_url)
+    item2_route.return_value = httpx.Response(HTTPStatus.OK, json=item2)
+    missing_url = f'{TEST_URL}/item-types/{item_type}/items/missing-id'
+    respx.get(missing_url).return_value = httpx.Response(404, json={})
+
+    missing = []
+    cl = DataClient(session, base_url=TEST_URL)
+    items = [
+        i async for i in
+        cl.get_items(item_type, ['missing-id', item2['id'], item1['id']],
+                     on_missing=missing.append)
+    ]
+
+    assert items == [item2, item1]
+    assert missing == ['missing-id']
+    assert item2_route.call_count == 1
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_get_items_fallback_bounded(mock_bundles, session, monkeypatch):
+    """Items are requested individually a few at a time."""
+    monkeypatch.setattr('planet.clients.data.GET_ITEMS_CONCURRENCY', 3)
+    respx.post(f'{TEST_URL}/quick-search').return_value = httpx.Response(
+        HTTPStatus.OK, json={
+            "_links": {}, "features": []
+        })
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _get(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        item_id = request.url.path.rsplit('/', 1)[-1]
+        return httpx.Response(HTTPStatus.OK, json={'id': item_id})
+
+    respx.get(url__startswith=f'{TEST_URL}/item-types/PSScene/items/'
+              ).side_effect = _get
+
+    ids = [f'id{i}' for i in range(10)]
+    cl = DataClient(session, base_url=TEST_URL)
+    items = [i async for i in cl.get_items('PSScene', ids)]
+
+    assert [i['id'] for i in items] == ids
+    assert max_in_flight == 3
+
+
+@respx.mock
+def test_get_items_sync(item_descriptions, mock_bundles, data_api):
+    item1, item2, item3 = item_descriptions
+    item_type = item1['properties']['item_type']
+
+    respx.post(f'{TEST_URL}/quick-search').return_value = httpx.Response(
+        HTTPStatus.OK, json={
+            "_links": {}, "features": [item1, item2, item3]
+        })
+
+    ids = [item2['id'], item3['id'], item1['id']]
+    items = list(data_api.get_items(item_type, ids))
+
+    assert items == [item2, item3, item1]
+
+
+@pytest.mark.anyio
+async def test_get_items_invalid_chunk_size(session):
+    cl = DataClient(session, base_url=TEST_URL)
+    with pytest.raises(exceptions.ClientError):
+        [i async for i in cl.get_items('PSScene', ['id'], chunk_size=0)]
+
+
 @respx.mock
 @pytest.mark.anyio
 async def test_get_item_coverage_success(item_descriptions, session):
@@ -1689,6 +1878,102 @@ async def test_get_item_coverage_invalid_geometry(item_descriptions, session):
                                    geometry=invalid_geom)
 
 
+@respx.mock
+@pytest.mark.anyio
+async def test_get_items_coverage(item_descriptions, session):
+    """Coverage is requested for every item and yielded with latency."""
+    item_type = item_descriptions[0]['properties']['item_type']
+    item_ids = [i['id'] for i in item_descriptions]
+
+    routes = {}
+    for n, item_id in enumerate(item_ids):
+        url = f'{TEST_URL}/item-types/{item_type}/items/{item_id}/coverage'
+        routes[item_id] = respx.post(url)
+        routes[item_id].return_value = httpx.Response(HTTPStatus.OK,
+                                                      json={
+                                                          'clear_percent': n,
+                                                          'status': 'complete'
+                                                      })
+
+    cl = DataClient(session, base_url=TEST_URL)
+    results = [
+        r async for r in cl.get_items_coverage(item_type, iter(
+            item_ids), item_descriptions[0]['geometry'], mode='estimate',
+                                               concurrency=2)
+    ]
+
+    assert sorted(r['item_id'] for r in results) == sorted(item_ids)
+    for r in results:
+        n = item_ids.index(r['item_id'])
+        assert r['coverage'] == {'clear_percent': n, 'status': 'complete'}
+        assert r['latency'] >= 0
+
+    for route in routes.values():
+        assert route.call_count == 1
+        request = route.calls.last.request
+        assert request.url.params['mode'] == 'estimate'
+        assert json.loads(request.content) == {
+            'geometry': item_descriptions[0]['geometry']
+        }
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_get_items_coverage_errors(item_descriptions, session):
+    """Failed items are reported and skipped without stopping the others."""
+    item_type = item_descriptions[0]['properties']['item_type']
+    item_ids = [i['id'] for i in item_descriptions]
+    statuses = [HTTPStatus.OK, HTTPStatus.NOT_FOUND, HTTPStatus.BAD_REQUEST]
+    for item_id, status in zip(item_ids, statuses):
+        url = f'{TEST_URL}/item-types/{item_type}/items/{item_id}/coverage'
+        respx.post(url).return_value = httpx.Response(
+            status, json={'clear_percent': 50})
+
+    errors = []
+    cl = DataClient(session, base_url=TEST_URL)
+    results = [
+        r async for r in cl.get_items_coverage(
+            item_type, item_ids, item_descriptions[0]['geometry'],
+            on_error=lambda i, e: errors.append((i, type(e))))
+    ]
+
+    assert [r['item_id'] for r in results] == item_ids[:1]
+    assert sorted(errors) == sorted([(item_ids[1], exceptions.MissingResource),
+                                     (item_ids[2], exceptions.BadQuery)])
+
+
+@pytest.mark.anyio
+async def test_get_items_coverage_invalid_concurrency(item_descriptions,
+                                                      session):
+    cl = DataClient(session, base_url=TEST_URL)
+    with pytest.raises(exceptions.ClientError):
+        [
+            r async for r in
+            cl.get_items_coverage('PSScene', ['id'], item_descriptions[0]
+                                  ['geometry'], concurrency=0)
+        ]
+
+
+@respx.mock
+def test_get_items_coverage_sync(item_descriptions, data_api):
+    item_type = item_descriptions[0]['properties']['item_type']
+    item_ids = [i['id'] for i in item_descriptions]
+    for item_id in item_ids:
+        url = f'{TEST_URL}/item-types/{item_type}/items/{item_id}/coverage'
+        respx.post(url).return_value = httpx.Response(HTTPStatus.OK,
+                                                      json={
+                                                          'clear_percent': 28,
+                                                          'status': 'complete'
+                                                      })
+
+    results = list(
+        data_api.get_items_coverage(item_type,
+                                    item_ids,
+                                    item_descriptions[0]['geometry']))
+
+    assert sorted(r['item_id'] for r in results) == sorted(item_ids)
+
+
 @respx.mock
 def test_get_item_coverage_success_sync(item_descriptions, data_api):
     """Test get item coverage successfully."""
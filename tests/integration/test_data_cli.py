@@ -1203,6 +1203,71 @@ def test_item_coverage_with_mode_and_band(invoke,
     assert coverage["status"] == "complete"
 
 
+@respx.mock
+def test_item_coverage_stdin(invoke,
+                             item_type,
+                             geom_geojson,
+                             search_result,
+                             mock_bundles):
+    """Test item coverage command reading item ids from stdin."""
+    item_ids = ['id1', 'id2', search_result['id']]
+    for item_id in item_ids:
+        coverage_url = \
+            f'{TEST_URL}/item-types/{item_type}/items/{item_id}/coverage'
+        respx.post(coverage_url).return_value = httpx.Response(
+            HTTPStatus.OK, json={
+                "clear_percent": 90, "status": "complete"
+            })
+    missing_url = \
+        f'{TEST_URL}/item-types/{item_type}/items/missing/coverage'
+    respx.post(missing_url).return_value = httpx.Response(HTTPStatus.NOT_FOUND,
+                                                          json={})
+
+    # ids and item descriptions can be mixed, failed items are skipped
+    stdin = '\n'.join(['id1', '', 'missing', 'id2', json.dumps(search_result)])
+    result = invoke([
+        "item-coverage",
+        item_type,
+        "-",
+        "--geom",
+        json.dumps(geom_geojson),
+        "--concurrency",
+        "2"
+    ],
+                    input=stdin)
+    assert result.exit_code == 0
+    assert 'coverage of missing failed' in result.stderr
+
+    results = [json.loads(line) for line in result.stdout.splitlines()]
+    assert sorted(r['item_id'] for r in results) == sorted(item_ids)
+    for r in results:
+        assert r['coverage'] == {"clear_percent": 90, "status": "complete"}
+        assert 'latency' in r
+
+
+@respx.mock
+def test_item_coverage_stdin_pretty(invoke, item_type, geom_geojson):
+    """Test item coverage results from stdin are pretty printed."""
+    coverage_url = f'{TEST_URL}/item-types/{item_type}/items/id1/coverage'
+    respx.post(coverage_url).return_value = httpx.Response(
+        HTTPStatus.OK, json={"clear_percent": 90})
+
+    result = invoke([
+        "item-coverage",
+        item_type,
+        "-",
+        "--geom",
+        json.dumps(geom_geojson),
+        "--pretty"
+    ],
+                    input='id1')
+    assert result.exit_code == 0
+
+    coverage = json.loads(result.output)
+    assert result.output == json.dumps(coverage, indent=2,
+                                       sort_keys=True) + '\n'
+
+
 @respx.mock
 def test_item_coverage_invalid_geometry(invoke, item_type, item_id):
     """Test item coverage command with invalid geometry."""
@@ -1237,3 +1302,30 @@ def test_item_types(invoke, mock_bundles):
     for item_type in expected_item_types:
         assert item_type in result.output
     assert result.exit_code == 0
+
+
+@respx.mock
+def test_data_search_cmd_stats(mock_bundles, tmp_path):
+    respx.post(TEST_QUICKSEARCH_URL).return_value = httpx.Response(
+        HTTPStatus.OK, json={'features': [{
+            "key": "value"
+        }]})
+    stats_file = tmp_path / 'stats.json'
+
+    result = CliRunner().invoke(cli.main,
+                                args=[
+                                    '--stats',
+                                    f'--stats-file={stats_file}',
+                                    'data',
+                                    'search',
+                                    'PSScene'
+                                ])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout) == {"key": "value"}
+    assert 'Requests: 1' in result.stderr
+    assert 'Limiter wait' in result.stderr
+
+    stats = json.loads(stats_file.read_text())
+    assert stats['requests'] == 1
+    endpoint = stats['endpoints']['POST api.planet.com/data/v1/quick-search']
+    assert endpoint['outcomes'] == {'200': 1}
@@ -19,8 +19,10 @@ import httpx
 import pytest
 import respx
 
-from planet import FeaturesClient, Session
+from planet import FeaturesClient, Session, exceptions
 from planet.auth import Auth
+from planet.cache import FeatureCache
+from planet.clients.features import _feature_hash
 from planet.sync.features import FeaturesAPI
 
 pytestmark = pytest.mark.anyio  # noqa
@@ -280,6 +282,118 @@ async def test_get_item():
     assertf(cl_sync.get_item(collection_id, item_id))
 
 
+@respx.mock
+async def test_get_item_cache(tmp_path):
+    items_url = f"{TEST_URL}/collections/test/items/test123"
+    route = respx.get(items_url)
+    route.side_effect = [
+        httpx.Response(HTTPStatus.OK,
+                       json=to_feature_model("test123"),
+                       headers={"ETag": '"a"'}),
+        httpx.Response(HTTPStatus.NOT_MODIFIED),
+        httpx.Response(HTTPStatus.NOT_FOUND, json={})
+    ]
+    cache = FeatureCache(tmp_path, ttl=60)
+    cl = FeaturesClient(test_session, base_url=TEST_URL, feature_cache=cache)
+
+    for _ in range(2):
+        assert (await cl.get_item("test", "test123"))["id"] == "test123"
+    assert route.call_count == 1
+
+    # a stale feature is revalidated
+    cache.ttl = 0
+    assert (await cl.get_item("test", "test123"))["id"] == "test123"
+    assert route.calls[1].request.headers["If-None-Match"] == '"a"'
+    size = len(cache.get("pl:features/my/test/test123").content)
+    assert cache.stats() == {
+        "hits": 1,
+        "revalidations": 1,
+        "misses": 1,
+        "hit_ratio": 2 / 3,
+        "bytes_saved": 2 * size
+    }
+
+    # a deleted feature is removed from the cache
+    with pytest.raises(exceptions.MissingResource):
+        await cl.get_item("test", "test123")
+    assert cache.get("pl:features/my/test/test123") is None
+
+
+@respx.mock
+async def test_warm_cache(tmp_path):
+    collection_id = "test"
+    items_url = f"{TEST_URL}/collections/{collection_id}/items"
+    mock_response(items_url, list_features_response(collection_id, 3))
+    item_route = respx.get(url__regex=f"{items_url}/.*")
+
+    cache = FeatureCache(tmp_path)
+    cache.set_feature("pl:features/my/test/deleted",
+                      to_feature_model("deleted"))
+    cl = FeaturesAPI(test_session, base_url=TEST_URL, feature_cache=cache)
+
+    assert cl.warm_cache(collection_id) == 3
+    assert cache.get("pl:features/my/test/deleted") is None
+    for i in range(3):
+        assert cl.get_item(collection_id, str(i))["id"] == str(i)
+    assert not item_route.called
+
+
+@respx.mock
+async def test_delete_item_cache(tmp_path):
+    items_url = f"{TEST_URL}/collections/test/items"
+    item_route = respx.get(url__regex=f"{items_url}/.*")
+    item_route.return_value = httpx.Response(HTTPStatus.NOT_FOUND, json={})
+    mock_response(f"{items_url}/0",
+                  json=None,
+                  method="delete",
+                  status_code=HTTPStatus.NO_CONTENT)
+    mock_response(f"{items_url}/1",
+                  json=None,
+                  method="delete",
+                  status_code=HTTPStatus.NO_CONTENT)
+
+    cache = FeatureCache(tmp_path, ttl=60)
+    for i in range(3):
+        cache.set_feature(f"pl:features/my/test/{i}", to_feature_model(str(i)))
+    cl = FeaturesClient(test_session, base_url=TEST_URL, feature_cache=cache)
+
+    # a deleted feature is no longer served from the cache
+    await cl.delete_item("test", "0")
+    with pytest.raises(exceptions.MissingResource):
+        await cl.get_item("test", "0")
+
+    async for _ in cl.delete_items("test", ["pl:features/my/test/1"]):
+        pass
+    assert cache.get("pl:features/my/test/1") is None
+    assert cache.get("pl:features/my/test/2")
+
+    mock_response(f"{TEST_URL}/collections/test",
+                  json=None,
+                  method="delete",
+                  status_code=HTTPStatus.NO_CONTENT)
+    await cl.delete_collection("test")
+    assert cache.get("pl:features/my/test/2") is None
+
+
+@respx.mock
+async def test_add_items_cache(tmp_path):
+    items_url = f"{TEST_URL}/collections/test/items"
+    mock_response(items_url, ["pl:features/my/test/0"], method="post")
+
+    cache = FeatureCache(tmp_path, ttl=60)
+    cache.set_feature("pl:features/my/test/0", to_feature_model("0"))
+    cl = FeaturesClient(test_session, base_url=TEST_URL, feature_cache=cache)
+
+    # an added feature replaces the cached one
+    await cl.add_items("test", TEST_GEOM)
+    assert cache.get("pl:features/my/test/0") is None
+
+
+async def test_warm_cache_no_cache():
+    with pytest.raises(exceptions.ClientError):
+        await cl_async.warm_cache("test")
+
+
 @respx.mock
 async def test_delete_item():
     collection_id = "test"
@@ -313,3 +427,178 @@ async def test_delete_collection():
 
     assertf(await cl_async.delete_collection(collection_id))
     assertf(cl_sync.delete_collection(collection_id))
+
+
+def _bulk_add_side_effect(request):
+    """Respond with a reference for each uploaded feature."""
+    body = json.loads(request.content)
+    return httpx.Response(
+        HTTPStatus.OK,
+        json=[f"pl:features/my/test/{f.get('id')}" for f in body["features"]])
+
+
+@respx.mock
+@pytest.mark.parametrize("max_features, max_bytes, expected_chunks",
+                         [(2, 10000, [2, 2, 1]), (10, 500, [1] * 5),
+                          (10, 10000, [5])])
+async def test_bulk_add_items(max_features, max_bytes, expected_chunks):
+    collection_id = "test"
+    items_url = f"{TEST_URL}/collections/{collection_id}/items"
+    respx.post(items_url).mock(side_effect=_bulk_add_side_effect)
+    features = [to_feature_model(str(i)) for i in range(5)]
+    expected = {f"pl:features/my/test/{i}" for i in range(5)}
+
+    async def _features():
+        for f in features:
+            yield f
+
+    refs = [
+        ref async for ref in cl_async.bulk_add_items(collection_id, _features(
+        ), max_features=max_features, max_bytes=max_bytes)
+    ]
+    assert sorted(refs) == sorted(expected)
+    assert sorted(
+        len(json.loads(call.request.content)["features"])
+        for call in respx.calls) == sorted(expected_chunks)
+
+    refs = cl_sync.bulk_add_items(collection_id,
+                                  features,
+                                  max_features=max_features,
+                                  max_bytes=max_bytes)
+    assert set(refs) == expected
+
+
+@respx.mock
+async def test_bulk_add_items_retry(monkeypatch):
+    collection_id = "test"
+    items_url = f"{TEST_URL}/collections/{collection_id}/items"
+    responses = [httpx.Response(HTTPStatus.INTERNAL_SERVER_ERROR, json={})]
+
+    def _side_effect(request):
+        if responses:
+            return responses.pop()
+        return _bulk_add_side_effect(request)
+
+    respx.post(items_url).mock(side_effect=_side_effect)
+    monkeypatch.setattr(test_session, "max_retry_backoff", 0)
+
+    refs = [
+        ref async for ref in cl_async.bulk_add_items(
+            collection_id, [TEST_GEOM, to_feature_model("a")],
+            property_id="id")
+    ]
+    assert refs == ["pl:features/my/test/None", "pl:features/my/test/a"]
+    assert len(respx.calls) == 2
+    assert respx.calls[1].request.url.params["property_id"] == "id"
+    # geometries are uploaded as features
+    body = json.loads(respx.calls[1].request.content)
+    assert body["features"][0] == {"type": "Feature", "geometry": TEST_GEOM}
+
+
+@respx.mock
+async def test_bulk_add_items_error():
+    collection_id = "test"
+    items_url = f"{TEST_URL}/collections/{collection_id}/items"
+    mock_response(items_url, {},
+                  method="post",
+                  status_code=HTTPStatus.BAD_REQUEST)
+
+    with pytest.raises(exceptions.BadQuery):
+        async for _ in cl_async.bulk_add_items(collection_id, [TEST_FEAT]):
+            pass
+    with pytest.raises(exceptions.ClientError):
+        async for _ in cl_async.bulk_add_items(collection_id, [TEST_FEAT],
+                                               concurrency=0):
+            pass
+
+
+@respx.mock
+async def test_delete_items():
+    collection_id = "test"
+    route = respx.delete(url__regex=f"{TEST_URL}/collections/test/items/.*")
+    route.return_value = httpx.Response(HTTPStatus.NO_CONTENT)
+
+    deleted = [
+        feature_id async for feature_id in cl_async.delete_items(
+            collection_id, ["a", "pl:features/my/test/b"], concurrency=1)
+    ]
+    assert deleted == ["a", "b"]
+    assert sorted(cl_sync.delete_items(collection_id,
+                                       ["c", "d"])) == ["c", "d"]
+    assert [call.request.url.path.rsplit("/", 1)[-1]
+            for call in respx.calls] == ["a", "b", "c", "d"]
+
+
+def _sync_features():
+    """Local features and the state of the collection for a sync."""
+    local = [to_feature_model(str(i)) for i in range(3)]
+    for f in local:
+        f["properties"] = {"name": f["id"]}
+    remote = [to_feature_model(str(i)) for i in range(4) if i != 2]
+    for f in remote:
+        f["properties"] = {"name": f["id"]}
+    # 0 is unchanged, 1 has changed, 2 is new and 3 was removed
+    remote[0]["properties"]["sync_hash"] = _feature_hash(local[0])
+    remote[1]["properties"]["sync_hash"] = "old"
+    return local, remote
+
+
+@respx.mock
+@pytest.mark.parametrize("dry_run", [True, False])
+async def test_sync_items(dry_run):
+    collection_id = "test"
+    items_url = f"{TEST_URL}/collections/{collection_id}/items"
+    local, remote = _sync_features()
+    listing = list_features_response(collection_id, 0)
+    listing["features"] = remote
+    respx.get(items_url).return_value = httpx.Response(HTTPStatus.OK,
+                                                       json=listing)
+    delete_route = respx.delete(url__regex=f"{items_url}/.*")
+    delete_route.return_value = httpx.Response(HTTPStatus.NO_CONTENT)
+    post_route = respx.post(items_url).mock(side_effect=_bulk_add_side_effect)
+
+    report = await cl_async.sync_items(collection_id, local, dry_run=dry_run)
+    assert report == {
+        "added": ["2"], "updated": ["1"], "deleted": ["3"], "unchanged": 1
+    }
+
+    if dry_run:
+        assert not delete_route.called and not post_route.called
+    else:
+        assert sorted(
+            call.request.url.path.rsplit("/", 1)[-1]
+            for call in delete_route.calls) == ["1", "3"]
+        body = json.loads(post_route.calls[0].request.content)
+        assert [f["properties"]["id"] for f in body["features"]] == ["2", "1"]
+        assert body["features"][0]["properties"]["sync_hash"] == _feature_hash(
+            local[2])
+
+
+@respx.mock
+async def test_sync_items_hash():
+    collection_id = "test"
+    items_url = f"{TEST_URL}/collections/{collection_id}/items"
+    local, remote = _sync_features()
+    listing = list_features_response(collection_id, 0)
+    listing["features"] = remote
+    respx.get(items_url).return_value = httpx.Response(HTTPStatus.OK,
+                                                       json=listing)
+
+    report = cl_sync.sync_items(collection_id,
+                                local,
+                                match="hash",
+                                dry_run=True)
+    # features without a hash in the collection are deleted
+    assert report == {
+        "added": [_feature_hash(local[1]), _feature_hash(local[2])],
+        "updated": [],
+        "deleted": ["3", "1"],
+        "unchanged": 1
+    }
+
+
+async def test_sync_items_no_id():
+    with pytest.raises(exceptions.ClientError):
+        await cl_async.sync_items("test", [TEST_FEAT])
+    with pytest.raises(exceptions.ClientError):
+        await cl_async.sync_items("test", [TEST_FEAT], match="other")
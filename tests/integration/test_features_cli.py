@@ -1,13 +1,14 @@
 from http import HTTPStatus
 import tempfile
 import json
+import httpx
 import pytest
 
 import respx
 from click.testing import CliRunner
 
 from planet.cli import cli
-from tests.integration.test_features_api import TEST_COLLECTION_1, TEST_COLLECTION_LIST, TEST_FEAT, TEST_GEOM, TEST_URL, list_collections_response, list_features_response, mock_response, to_collection_model, to_feature_model
+from tests.integration.test_features_api import _bulk_add_side_effect, TEST_COLLECTION_1, TEST_COLLECTION_LIST, TEST_FEAT, TEST_GEOM, TEST_URL, list_collections_response, list_features_response, mock_response, to_collection_model, to_feature_model
 
 
 def invoke(*args):
@@ -181,3 +182,103 @@ def test_delete_collection():
         assert resp is None
 
     assertf(invoke("collections", "delete", collection_id))
+
+
+@respx.mock
+def test_bulk_add_items():
+    collection_id = "test"
+    items_url = f'{TEST_URL}/collections/{collection_id}/items'
+    respx.post(items_url).mock(side_effect=_bulk_add_side_effect)
+
+    with tempfile.NamedTemporaryFile('w+') as file:
+        for i in range(3):
+            file.write(json.dumps(to_feature_model(str(i))) + '\n')
+        file.flush()
+
+        runner = CliRunner()
+        result = runner.invoke(cli.main,
+                               args=[
+                                   'features',
+                                   '--base-url',
+                                   TEST_URL,
+                                   'items',
+                                   'bulk-add',
+                                   collection_id,
+                                   file.name,
+                                   '--max-features',
+                                   '2'
+                               ])
+    assert result.exit_code == 0, result.output
+    refs = [json.loads(line) for line in result.output.splitlines()]
+    assert sorted(refs) == [f'pl:features/my/test/{i}' for i in range(3)]
+    assert len(respx.calls) == 2
+
+
+@respx.mock
+def test_bulk_delete_items():
+    collection_id = "test"
+    route = respx.delete(url__regex=f"{TEST_URL}/collections/test/items/.*")
+    route.return_value = httpx.Response(HTTPStatus.NO_CONTENT)
+
+    runner = CliRunner()
+    result = runner.invoke(cli.main,
+                           args=[
+                               'features',
+                               '--base-url',
+                               TEST_URL,
+                               'items',
+                               'bulk-delete',
+                               collection_id,
+                               '-'
+                           ],
+                           input='a\n\npl:features/my/test/b\n{"id": "c"}\n')
+    assert result.exit_code == 0, result.output
+    deleted = [json.loads(line) for line in result.output.splitlines()]
+    assert sorted(deleted) == ['a', 'b', 'c']
+
+
+@respx.mock
+def test_sync_collection():
+    collection_id = "test"
+    items_url = f'{TEST_URL}/collections/{collection_id}/items'
+    mock_response(items_url, list_features_response(collection_id, 0))
+
+    with tempfile.NamedTemporaryFile('w+') as file:
+        json.dump(TEST_FEAT | {'id': 'a'}, file)
+        file.flush()
+        report = invoke("collections",
+                        "sync",
+                        collection_id,
+                        file.name,
+                        "--dry-run")
+    assert report == {
+        'added': ['a'], 'updated': [], 'deleted': [], 'unchanged': 0
+    }
+
+
+@respx.mock
+def test_warm_cache(tmp_path):
+    collection_id = "test"
+    items_url = f'{TEST_URL}/collections/{collection_id}/items'
+    mock_response(items_url, list_features_response(collection_id, 2))
+    item_route = respx.get(url__regex=f"{items_url}/.*")
+
+    runner = CliRunner()
+    args = ['features', '--base-url', TEST_URL]
+    result = runner.invoke(cli.main,
+                           args=args + ['items', 'warm-cache', collection_id],
+                           env={'PL_FEATURES_CACHE': str(tmp_path)})
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == {'cached': 2}
+
+    result = runner.invoke(cli.main,
+                           args=args + ['items', 'get', collection_id, '1'],
+                           env={'PL_FEATURES_CACHE': str(tmp_path)})
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)['id'] == '1'
+    assert not item_route.called
+
+    result = runner.invoke(cli.main,
+                           args=args + ['items', 'warm-cache', collection_id],
+                           env={'PL_FEATURES_CACHE': ''})
+    assert result.exit_code != 0
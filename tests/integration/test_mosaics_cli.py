@@ -8,6 +8,7 @@ import pytest
 import respx
 from click.testing import CliRunner
 
+from planet import models
 from planet.cli import cli
 
 baseurl = "http://basemaps.com/v1/"
@@ -405,3 +406,169 @@ def run_test(tc: CLITestCase):
         if tc.expect_files:
             for f in tc.expect_files:
                 assert Path(folder, f).exists(), f
+
+
+@respx.mock
+def test_cli_name_cache():
+    lookup = respx.get(url("mosaics?name__is=mosaic-name"))
+    lookup.return_value = httpx.Response(
+        200, json={"mosaics": [{
+            "id": "123", "name": "mosaic-name"
+        }]})
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        for _ in range(2):
+            result = runner.invoke(cli.main,
+                                   args=[
+                                       "mosaics",
+                                       "-u",
+                                       baseurl,
+                                       "--name-cache",
+                                       "names.json",
+                                       "info",
+                                       "mosaic-name"
+                                   ])
+            assert result.exit_code == 0, result.output
+            assert json.loads(result.output) == {
+                "id": "123", "name": "mosaic-name"
+            }
+
+    # the second command found the mosaic in the cache file
+    assert lookup.call_count == 1
+
+
+@respx.mock
+def test_cli_download_incremental():
+    mosaic = {
+        "id": "123",
+        "name": "a mosaic",
+        "_links": {
+            "quads": url("mosaics/123/quads?bbox={lx},{ly},{ux},{uy}")
+        }
+    }
+    request(f"mosaics/{uuid}", mosaic)()
+    quads = quad_item_downloads(2)
+    listing = respx.get(
+        url("mosaics/123/quads?bbox=-100.0,40.0,-100.0,40.0&minimal=true"))
+    downloads = [
+        respx.get(url(f"mosaics/download-a-quad/{i}")) for i in range(2)
+    ]
+    for d in downloads:
+        d.side_effect = lambda request: httpx.Response(
+            200, content=b"data" * 25, headers={"Content-Length": "100"})
+
+    args = [
+        "mosaics",
+        "-u",
+        baseurl,
+        "download",
+        uuid,
+        "--bbox",
+        "-100,40,-100,40",
+        "--incremental"
+    ]
+    runner = CliRunner()
+    with runner.isolated_filesystem() as folder:
+        listing.return_value = httpx.Response(200, json={"items": quads})
+        result = runner.invoke(cli.main, args=args)
+        assert result.exit_code == 0, result.output
+        assert [d.call_count for d in downloads] == [1, 1]
+
+        # nothing changed, nothing is downloaded
+        result = runner.invoke(cli.main, args=args)
+        assert result.exit_code == 0, result.output
+        assert [d.call_count for d in downloads] == [1, 1]
+
+        # a republished quad and a partially written one are downloaded
+        quads[0]["percent_covered"] = 50
+        listing.return_value = httpx.Response(200, json={"items": quads})
+        Path(folder, "a mosaic", "456-7891.tif").write_bytes(b"da")
+        result = runner.invoke(cli.main, args=args)
+        assert result.exit_code == 0, result.output
+        assert [d.call_count for d in downloads] == [2, 2]
+        assert Path(folder, "a mosaic", "456-7891.tif").stat().st_size == 100
+
+
+@respx.mock
+def test_cli_download_progress_ndjson():
+    mosaic = {
+        "id": "123",
+        "name": "a mosaic",
+        "_links": {
+            "quads": url("mosaics/123/quads?bbox={lx},{ly},{ux},{uy}")
+        }
+    }
+    request(f"mosaics/{uuid}", mosaic)()
+    respx.get(
+        url("mosaics/123/quads?bbox=-100.0,40.0,-100.0,40.0&minimal=true")
+    ).return_value = httpx.Response(200,
+                                    json={"items": quad_item_downloads(2)})
+    for i in range(2):
+        respx.get(url(f"mosaics/download-a-quad/{i}")).return_value = \
+            httpx.Response(200, content=b"data" * 25,
+                           headers={"Content-Length": "100"})
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(cli.main,
+                               args=[
+                                   "mosaics",
+                                   "-u",
+                                   baseurl,
+                                   "download",
+                                   uuid,
+                                   "--bbox",
+                                   "-100,40,-100,40",
+                                   "--progress",
+                                   "ndjson"
+                               ])
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.output.splitlines()[-1])
+        assert report["files_done"] == 2
+        assert report["bytes"] == 200
+
+
+@respx.mock
+def test_cli_download_chunk_size(tmp_path, monkeypatch):
+    read_sizes = []
+    aiter_bytes = models.StreamingResponse.aiter_bytes
+
+    def _aiter_bytes(self, chunk_size=None):
+        read_sizes.append(chunk_size)
+        return aiter_bytes(self, chunk_size)
+
+    monkeypatch.setattr(models.StreamingResponse, 'aiter_bytes', _aiter_bytes)
+    mosaic = {
+        "id": "123",
+        "name": "a mosaic",
+        "_links": {
+            "quads": url("mosaics/123/quads?bbox={lx},{ly},{ux},{uy}")
+        }
+    }
+    request(f"mosaics/{uuid}", mosaic)()
+    respx.get(
+        url("mosaics/123/quads?bbox=-100.0,40.0,-100.0,40.0&minimal=true")
+    ).return_value = httpx.Response(200,
+                                    json={"items": quad_item_downloads(1)})
+    respx.get(url("mosaics/download-a-quad/0")).return_value = \
+        httpx.Response(200, content=b"data" * 25,
+                       headers={"Content-Length": "100"})
+
+    result = CliRunner().invoke(cli.main,
+                                args=[
+                                    "mosaics",
+                                    "-u",
+                                    baseurl,
+                                    "download",
+                                    uuid,
+                                    "--bbox",
+                                    "-100,40,-100,40",
+                                    "--output-dir",
+                                    str(tmp_path),
+                                    "--chunk-size",
+                                    "16"
+                                ])
+    assert result.exit_code == 0, result.output
+    assert read_sizes == [16]
+    assert (tmp_path / "456-7890.tif").read_bytes() == b"data" * 25
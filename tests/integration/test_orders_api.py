@@ -27,7 +27,7 @@ import httpx
 import pytest
 import respx
 
-from planet import OrdersClient, exceptions, reporting
+from planet import OrdersClient, exceptions, models, reporting
 from planet.clients.orders import OrderStates
 from planet.sync import Planet
 
@@ -1095,6 +1095,92 @@ async def test_download_order_success(results,
             assert json.load(f) == {'key2': 'value2'}
 
 
+@respx.mock
+@pytest.mark.anyio
+@pytest.mark.parametrize("content, error",
+                         [(b'asset', None),
+                          (b'corrupt', exceptions.DownloadError)])
+async def test_download_order_manifest_digests(content,
+                                               error,
+                                               tmpdir,
+                                               order_description,
+                                               oid,
+                                               session):
+    order_description['state'] = 'success'
+    order_description['_links']['results'] = [
+        {
+            "location": f'{TEST_DOWNLOAD_URL}/1',
+            "name": f"{oid}/itemtype1/asset.tif"
+        }, {
+            "location": f'{TEST_DOWNLOAD_URL}/2',
+            "name": f"{oid}/manifest.json"
+        }
+    ]
+    manifest_data = {
+        "name": "",
+        "files": [{
+            "path": "itemtype1/asset.tif",
+            "digests": {
+                "md5": hashlib.md5(b'asset').hexdigest()
+            }
+        }]
+    }
+    respx.get(f'{TEST_ORDERS_URL}/{oid}').return_value = httpx.Response(
+        HTTPStatus.OK, json=order_description)
+    respx.get(f'{TEST_DOWNLOAD_URL}/1').return_value = httpx.Response(
+        HTTPStatus.OK, content=content)
+    respx.get(f'{TEST_DOWNLOAD_URL}/2').return_value = httpx.Response(
+        HTTPStatus.OK, json=manifest_data)
+
+    cl = OrdersClient(session, base_url=TEST_URL)
+    asset = Path(tmpdir, oid, 'itemtype1', 'asset.tif')
+    if error:
+        with pytest.raises(error):
+            await cl.download_order(oid, directory=Path(tmpdir))
+        assert not asset.exists()
+    else:
+        filenames = await cl.download_order(oid, directory=Path(tmpdir))
+        # the order of the results is kept
+        assert filenames == [asset, Path(tmpdir, oid, 'manifest.json')]
+        assert asset.read_bytes() == b'asset'
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_download_order_chunk_size(tmpdir,
+                                         order_description,
+                                         oid,
+                                         session,
+                                         monkeypatch):
+    read_sizes = []
+    aiter_bytes = models.StreamingResponse.aiter_bytes
+
+    def _aiter_bytes(self, chunk_size=None):
+        read_sizes.append(chunk_size)
+        return aiter_bytes(self, chunk_size)
+
+    monkeypatch.setattr(models.StreamingResponse, 'aiter_bytes', _aiter_bytes)
+    order_description['state'] = 'success'
+    order_description['_links']['results'] = [{
+        "location": f'{TEST_DOWNLOAD_URL}/1',
+        "name": "oid/itemtype1/asset.json"
+    }]
+    respx.get(f'{TEST_ORDERS_URL}/{oid}').return_value = httpx.Response(
+        HTTPStatus.OK, json=order_description)
+    respx.get(f'{TEST_DOWNLOAD_URL}/1').return_value = httpx.Response(
+        HTTPStatus.OK,
+        json={'key': 'value'},
+        headers={'Content-Disposition': 'attachment; filename="asset.json"'})
+
+    cl = OrdersClient(session, base_url=TEST_URL)
+    filenames = await cl.download_order(oid,
+                                        directory=str(tmpdir),
+                                        chunk_size=4)
+
+    assert read_sizes == [4]
+    assert json.loads(filenames[0].read_text()) == {'key': 'value'}
+
+
 @respx.mock
 @pytest.mark.parametrize(
     "results, paths",
@@ -1276,3 +1362,60 @@ async def test_download_order_overwrite_false_nonexisting_data(
     # Check that the was data downloaded and has the correct contents
     with open(Path(tmpdir, 'file.json')) as f:
         assert json.load(f) == downloaded_content
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_download_order_incremental(tmpdir,
+                                          oid,
+                                          session,
+                                          create_download_mock,
+                                          original_content,
+                                          downloaded_content):
+    create_download_mock()
+    dl_route = respx.routes[-1]
+    cl = OrdersClient(session, base_url=TEST_URL)
+
+    # an existing file that was not recorded is replaced
+    with open(Path(tmpdir, 'file.json'), "a") as out_file:
+        json.dump(original_content, out_file)
+    await cl.download_order(oid, directory=str(tmpdir), incremental=True)
+    assert dl_route.call_count == 1
+    with open(Path(tmpdir, 'file.json')) as f:
+        assert json.load(f) == downloaded_content
+
+    # a recorded, valid file is not requested again
+    paths = await cl.download_order(oid,
+                                    directory=str(tmpdir),
+                                    incremental=True)
+    assert dl_route.call_count == 1
+    assert paths == [Path(tmpdir, 'file.json')]
+
+    # a truncated file is requested again
+    Path(tmpdir, 'file.json').write_text('{')
+    await cl.download_order(oid, directory=str(tmpdir), incremental=True)
+    assert dl_route.call_count == 2
+    with open(Path(tmpdir, 'file.json')) as f:
+        assert json.load(f) == downloaded_content
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_download_order_existing_not_requested(tmpdir,
+                                                     oid,
+                                                     session,
+                                                     create_download_mock,
+                                                     original_content):
+    create_download_mock()
+    dl_route = respx.routes[-1]
+
+    with open(Path(tmpdir, 'file.json'), "a") as out_file:
+        json.dump(original_content, out_file)
+
+    cl = OrdersClient(session, base_url=TEST_URL)
+    paths = await cl.download_order(oid, directory=str(tmpdir))
+
+    # the file name is known from the order, so the existing file is found
+    # without a download request
+    assert paths == [Path(tmpdir, 'file.json')]
+    assert dl_route.call_count == 0
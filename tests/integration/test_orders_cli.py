@@ -436,6 +436,30 @@ def test_cli_orders_download_overwrite(invoke,
             assert json.load(f) == {'key': 'value'}
 
 
+@respx.mock
+def test_cli_orders_download_incremental(invoke, mock_download_response, oid):
+    mock_download_response()
+
+    def download_calls():
+        return [
+            c for c in respx.calls
+            if c.request.url.path.startswith('/api/path/download')
+        ]
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = invoke(['download', '--incremental', oid], runner=runner)
+        assert result.exit_code == 0
+        downloads = len(download_calls())
+        assert downloads == 3
+
+        # rerun requests the order but none of its files
+        result = invoke(['download', '--incremental', '--checksum=MD5', oid],
+                        runner=runner)
+        assert result.exit_code == 0
+        assert len(download_calls()) == downloads
+
+
 @respx.mock
 def test_cli_orders_download_state(invoke, order_description, oid):
     get_url = f'{TEST_ORDERS_URL}/{oid}'
@@ -5,6 +5,7 @@ from datetime import datetime
 from itertools import zip_longest
 import json
 
+import httpx
 from httpx import Response
 import pytest
 import respx
@@ -830,6 +831,272 @@ def test_get_results_csv_sync():
     assert rows == [['id', 'status'], ['1234-abcd', 'SUCCESS']]
 
 
+def _windowed_results(request, window_by='created'):
+    """Results of a window, named by the window, in two pages."""
+    window = request.url.params[window_by]
+    page = int(request.url.params.get('page', 0))
+    body = {'results': [{'id': f'{window}-{page}'}], '_links': {}}
+    if page == 0:
+        body['_links']['next'] = f'{TEST_URL}/42/results?' + str(
+            request.url.params.set('page', '1'))
+    if request.url.params.get('format') == 'csv':
+        return Response(200, text=f"id\n{window}\n")
+    return Response(200, json=body)
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_results_windows():
+    """Windows of a closed interval are fetched and merged."""
+    route = respx.get(f'{TEST_URL}/42/results')
+    route.side_effect = _windowed_results
+    windows = [
+        '2024-01-01T00:00:00.000000Z/2024-01-01T23:59:59.999999Z',
+        '2024-01-02T00:00:00.000000Z/2024-01-02T23:59:59.999999Z',
+        '2024-01-03T00:00:00.000000Z/2024-01-03T23:59:59.999999Z',
+        '2024-01-04T00:00:00.000000Z/2024-01-05T00:00:00.000000Z'
+    ]
+    async with Session() as session:
+        client = SubscriptionsClient(session, base_url=TEST_URL)
+        results = [
+            res async for res in client.get_results(
+                "42", limit=0,
+                created="2024-01-01T00:00:00Z/2024-01-05T00:00:00Z", windows=4)
+        ]
+        assert sorted(r['id'] for r in results) == sorted(f'{w}-{p}'
+                                                          for w in windows
+                                                          for p in range(2))
+
+        limited = [
+            res async for res in client.get_results(
+                "42", limit=3,
+                created="2024-01-01T00:00:00Z/2024-01-05T00:00:00Z", windows=4)
+        ]
+        assert len(limited) == 3
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_results_windows_open():
+    """Open ends are kept and the subscription's creation bounds windows."""
+    respx.get(f'{TEST_URL}/42').return_value = Response(
+        200, json={
+            'id': '42', 'created': '2024-01-01T00:00:00.000Z'
+        })
+    route = respx.get(f'{TEST_URL}/42/results')
+    route.side_effect = _windowed_results
+    pl = Planet()
+    pl.subscriptions._client._base_url = TEST_URL
+    rows = list(
+        pl.subscriptions.get_results_csv("42",
+                                         created="../2024-01-03T00:00:00Z",
+                                         windows=2))
+    # the header row is yielded once
+    assert rows[0] == 'id'
+    assert sorted(rows[1:]) == [
+        '../2024-01-01T23:59:59.999999Z',
+        '2024-01-02T00:00:00.000000Z/2024-01-03T00:00:00.000000Z'
+    ]
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_results_windows_item_datetime():
+    """Source times without a fraction split item datetime windows."""
+    respx.get(f'{TEST_URL}/42').return_value = Response(
+        200,
+        json={
+            'id': '42',
+            'source': {
+                'parameters': {
+                    'start_time': '2024-01-01T00:00:00Z',
+                    'end_time': '2024-01-03T00:00:00Z'
+                }
+            }
+        })
+    route = respx.get(f'{TEST_URL}/42/results')
+    route.side_effect = lambda request: _windowed_results(
+        request, 'item_datetime')
+    async with Session() as session:
+        client = SubscriptionsClient(session, base_url=TEST_URL)
+        results = [
+            res async for res in client.get_results("42", limit=0, windows=2,
+                                                    window_by='item_datetime')
+        ]
+    assert sorted(r['id'] for r in results) == [
+        '../2024-01-01T23:59:59.999999Z-0',
+        '../2024-01-01T23:59:59.999999Z-1',
+        '2024-01-02T00:00:00.000000Z/..-0',
+        '2024-01-02T00:00:00.000000Z/..-1'
+    ]
+
+
+@pytest.mark.parametrize('options',
+                         [{
+                             'windows': 0
+                         }, {
+                             'windows': 2, 'window_by': 'updated'
+                         }, {
+                             'windows': 2, 'window_by': 'completed'
+                         }])
+@pytest.mark.anyio
+async def test_get_results_windows_invalid(options):
+    async with Session() as session:
+        client = SubscriptionsClient(session, base_url=TEST_URL)
+        with pytest.raises(ClientError):
+            _ = [res async for res in client.get_results("42", **options)]
+
+
+CSV_CONTENT = b"id,status\r\n1,SUCCESS\r\n2,SUCCESS\r\n3,SUCCESS\r\n"
+
+
+class InterruptedStream(httpx.AsyncByteStream):
+    """Response content that fails after some bytes."""
+
+    def __init__(self, content, fail_after):
+        self.content = content
+        self.fail_after = fail_after
+
+    async def __aiter__(self):
+        yield self.content[:self.fail_after]
+        raise httpx.ReadError('connection reset')
+
+
+@pytest.mark.parametrize('accept_ranges', [True, False])
+@pytest.mark.anyio
+@respx.mock
+async def test_get_results_csv_resume(accept_ranges):
+    """An interrupted CSV is resumed without repeating rows."""
+    headers = {'Accept-Ranges': 'bytes'} if accept_ranges else {}
+    # interrupted in the middle of the third line
+    fail_after = CSV_CONTENT.index(b'2,') + 3
+    offset = CSV_CONTENT.index(b'2,')
+
+    def _respond(request):
+        if request.headers.get('Range'):
+            assert request.headers['Range'] == f'bytes={offset}-'
+            return Response(206, content=CSV_CONTENT[offset:])
+        if route.call_count == 0:
+            return Response(200,
+                            headers=headers,
+                            stream=InterruptedStream(CSV_CONTENT, fail_after))
+        return Response(200, content=CSV_CONTENT)
+
+    route = respx.get(f'{TEST_URL}/42/results')
+    route.side_effect = _respond
+    async with Session() as session:
+        session.max_retry_backoff = 0
+        client = SubscriptionsClient(session, base_url=TEST_URL)
+        rows = [res async for res in client.get_results_csv("42")]
+    assert rows == ['id,status', '1,SUCCESS', '2,SUCCESS', '3,SUCCESS']
+    assert route.call_count == 2
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_results_csv_resume_failure():
+    """Errors are raised once retries are exhausted."""
+    route = respx.get(f'{TEST_URL}/42/results')
+    route.side_effect = lambda request: Response(200, stream=InterruptedStream(
+        CSV_CONTENT, 12))
+    async with Session() as session:
+        session.max_retry_backoff = 0
+        session.max_retries = 1
+        client = SubscriptionsClient(session, base_url=TEST_URL)
+        rows = []
+        with pytest.raises(httpx.ReadError):
+            async for row in client.get_results_csv("42"):
+                rows.append(row)
+    assert rows == ['id,status']
+    assert route.call_count == 2
+
+
+def _updated_results(hours):
+    """Mock results updated at the given hours, filtered by update time."""
+
+    def _respond(request):
+        results = [{
+            'id': f'{i}', 'updated': f'2024-01-01T{hour:02d}:00:00.000Z'
+        } for i, hour in enumerate(hours)]
+        since = request.url.params.get('updated')
+        if since:
+            start = since.split('/')[0]
+            results = [r for r in results if r['updated'] >= start]
+        return Response(200, json={'results': results, '_links': {}})
+
+    return _respond
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_results_checkpoint(tmp_path):
+    """Only results updated since the checkpoint are yielded."""
+    hours = [1, 2, 2, 3]
+    route = respx.get(f'{TEST_URL}/42/results')
+    route.side_effect = _updated_results(hours)
+    checkpoint = tmp_path / 'checkpoint.json'
+    async with Session() as session:
+        client = SubscriptionsClient(session, base_url=TEST_URL)
+
+        async def _ids():
+            return [
+                r['id'] async for r in client.get_results(
+                    "42", limit=0, checkpoint=checkpoint)
+            ]
+
+        assert await _ids() == ['0', '1', '2', '3']
+        assert json.loads(checkpoint.read_text()) == {
+            '42': {
+                'updated': '2024-01-01T03:00:00.000Z', 'ids': ['3']
+            }
+        }
+
+        # results updated at the checkpoint are not repeated
+        assert await _ids() == []
+        assert route.calls[-1].request.url.params['updated'] == (
+            '2024-01-01T03:00:00.000Z/..')
+
+        hours.extend([3, 4])
+        assert await _ids() == ['4', '5']
+        assert json.loads(checkpoint.read_text())['42'] == {
+            'updated': '2024-01-01T04:00:00.000Z', 'ids': ['5']
+        }
+
+
+@pytest.mark.anyio
+@respx.mock
+async def test_get_results_checkpoint_limit(tmp_path):
+    """The checkpoint is not advanced if not all results were received."""
+    respx.get(f'{TEST_URL}/42/results').side_effect = _updated_results(
+        [1, 2, 2, 3])
+    checkpoint = tmp_path / 'checkpoint.json'
+    pl = Planet()
+    pl.subscriptions._client._base_url = TEST_URL
+    results = list(
+        pl.subscriptions.get_results("42", limit=2, checkpoint=checkpoint))
+    assert len(results) == 2
+    assert not checkpoint.exists()
+
+
+@pytest.mark.anyio
+async def test_get_results_checkpoint_invalid(tmp_path):
+    checkpoint = tmp_path / 'checkpoint.json'
+    async with Session() as session:
+        client = SubscriptionsClient(session, base_url=TEST_URL)
+        with pytest.raises(ClientError):
+            _ = [
+                r async for r in client.get_results(
+                    "42", checkpoint=checkpoint, updated='2024-01-01/..')
+            ]
+
+        checkpoint.write_text('not json')
+        with pytest.raises(ClientError):
+            _ = [
+                r
+                async for r in client.get_results("42", checkpoint=checkpoint)
+            ]
+
+
 # Mock router for testing query parameter filtering
 results_filter_mock = respx.mock(assert_all_called=False)
 
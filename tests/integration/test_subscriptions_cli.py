@@ -18,6 +18,7 @@ import json
 import respx
 
 from click.testing import CliRunner
+from httpx import Response
 import pytest
 
 from planet.cli import cli
@@ -550,6 +551,58 @@ def test_subscriptions_results_csv(invoke):
     assert result.output.splitlines() == ["id,status", "1234-abcd,SUCCESS"]
 
 
+@respx.mock
+def test_subscriptions_results_windows(invoke):
+    """Get results in time windows."""
+    respx.get(f'{TEST_URL}/test/results').side_effect = lambda request: (
+        Response(200, json={
+            'results': [{
+                'id': request.url.params['completed']
+            }], '_links': {}
+        }))
+    result = invoke([
+        "results",
+        "test",
+        "--windows=2",
+        "--window-by=completed",
+        "--completed=2024-01-01T00:00:00Z/2024-01-03T00:00:00Z"
+    ])
+    assert result.exit_code == 0, result.output
+    windows = [json.loads(line)['id'] for line in result.output.splitlines()]
+    assert sorted(windows) == [
+        '2024-01-01T00:00:00.000000Z/2024-01-01T23:59:59.999999Z',
+        '2024-01-02T00:00:00.000000Z/2024-01-03T00:00:00.000000Z'
+    ]
+
+    result = invoke(["results", "test", "--windows=0"])
+    assert result.exit_code == 2
+
+
+@respx.mock
+def test_subscriptions_results_checkpoint(invoke, tmp_path):
+    """Get results updated since the previous run."""
+    respx.get(f'{TEST_URL}/test/results').return_value = Response(
+        200,
+        json={
+            'results': [{
+                'id': '1', 'updated': '2024-01-01T00:00:00.000Z'
+            }],
+            '_links': {}
+        })
+    checkpoint = str(tmp_path / 'checkpoint.json')
+    options = ["results", "test", "--limit=0", f"--checkpoint={checkpoint}"]
+    result = invoke(options)
+    assert result.exit_code == 0, result.output
+    assert result.output.count('"id"') == 1
+
+    result = invoke(options)
+    assert result.exit_code == 0, result.output
+    assert result.output == ''
+
+    result = invoke(options + ["--csv"])
+    assert result.exit_code == 2
+
+
 @pytest.mark.parametrize("geom",
                          [("geom_geojson"), ("geom_reference"),
                           ("str_geom_reference")])
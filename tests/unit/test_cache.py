@@ -0,0 +1,262 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+import gzip
+from http import HTTPStatus
+import json
+import time
+
+import httpx
+import pytest
+import respx
+
+from planet import cache, http
+
+TEST_URL = 'http://www.mocknotrealurl.com/api/path'
+
+
+def _response(headers=None, json={'id': 'x'}, status=HTTPStatus.OK):
+    return httpx.Response(status,
+                          json=json,
+                          headers=headers,
+                          request=httpx.Request('GET', TEST_URL))
+
+
+@pytest.mark.parametrize(
+    'headers, cacheable, max_age',
+    [({}, False, 0), ({
+        'etag': '"a"'
+    }, True, 0), ({
+        'last-modified': 'Wed, 21 Oct 2015 07:28:00 GMT'
+    }, True, 0), ({
+        'cache-control': 'max-age=60'
+    }, True, 60), ({
+        'cache-control': 'no-store', 'etag': '"a"'
+    }, False, 0),
+     ({
+         'cache-control': 'no-cache, max-age=60', 'etag': '"a"'
+     }, True, 0)])
+def test_CachedResponse_from_response(headers, cacheable, max_age):
+    entry = cache.CachedResponse.from_response(_response(headers))
+    if not cacheable:
+        assert entry is None
+    else:
+        assert entry.max_age == max_age
+        assert entry.is_fresh() == bool(max_age)
+
+
+def test_CachedResponse_not_ok():
+    resp = _response({'etag': '"a"'}, status=HTTPStatus.CREATED)
+    assert cache.CachedResponse.from_response(resp) is None
+
+
+def test_CachedResponse_roundtrip():
+    entry = cache.CachedResponse.from_response(
+        httpx.Response(HTTPStatus.OK,
+                       content=gzip.compress(b'{"id": "x"}'),
+                       headers={
+                           'etag': '"a"', 'content-encoding': 'gzip'
+                       },
+                       request=httpx.Request('GET', TEST_URL)))
+    copy = cache.CachedResponse.from_dict(entry.to_dict())
+
+    assert copy.conditional_headers() == {'If-None-Match': '"a"'}
+    resp = copy.to_response(httpx.Request('GET', TEST_URL))
+    assert resp.json() == {'id': 'x'}
+    assert 'content-encoding' not in resp.headers
+
+
+def test_MemoryCache_lru():
+    c = cache.MemoryCache(max_entries=2)
+    entry = cache.CachedResponse.from_response(_response({'etag': '"a"'}))
+
+    c.set('a', entry)
+    c.set('b', entry)
+    # touch a so that b is least recently used
+    assert c.get('a') is entry
+    c.set('c', entry)
+
+    assert c.get('b') is None
+    assert c.get('a') is entry
+    assert len(c) == 2
+
+    c.delete('a')
+    assert c.get('a') is None
+    c.clear()
+    assert len(c) == 0
+
+
+def test_DiskCache(tmp_path):
+    entry = cache.CachedResponse.from_response(_response({'etag': '"a"'}))
+
+    cache.DiskCache(tmp_path).set(TEST_URL, entry)
+
+    # entries persist across instances
+    c = cache.DiskCache(tmp_path)
+    assert c.get(TEST_URL).etag == '"a"'
+    assert c.get('other') is None
+
+    c.clear()
+    assert c.get(TEST_URL) is None
+
+
+def test_DiskCache_corrupt(tmp_path):
+    c = cache.DiskCache(tmp_path)
+    c._path(TEST_URL).write_text('not json')
+    assert c.get(TEST_URL) is None
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_session_cache_revalidate():
+    c = cache.MemoryCache()
+    route = respx.get(TEST_URL)
+    route.side_effect = [
+        httpx.Response(HTTPStatus.OK,
+                       json={'id': 'x'},
+                       headers={'etag': '"a"'}),
+        httpx.Response(HTTPStatus.NOT_MODIFIED, headers={'etag': '"a"'})
+    ]
+
+    async with http.Session(cache=c) as ps:
+        first = await ps.request(method='GET', url=TEST_URL)
+        second = await ps.request(method='GET', url=TEST_URL)
+
+    assert first.json() == second.json() == {'id': 'x'}
+    assert route.call_count == 2
+    assert 'if-none-match' not in route.calls[0].request.headers
+    assert route.calls[1].request.headers['if-none-match'] == '"a"'
+    assert c.misses == 1
+    assert c.revalidations == 1
+    assert c.hit_ratio == 0.5
+    assert c.bytes_saved == len(first._http_response.content)
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_session_cache_fresh_and_bypass():
+    c = cache.MemoryCache()
+    route = respx.get(TEST_URL)
+    route.return_value = httpx.Response(
+        HTTPStatus.OK,
+        json={'id': 'x'},
+        headers={'cache-control': 'max-age=60'})
+
+    async with http.Session(cache=c) as ps:
+        await ps.request(method='GET', url=TEST_URL)
+        await ps.request(method='GET', url=TEST_URL)
+        assert route.call_count == 1
+        assert c.hits == 1
+
+        with ps.bypass_cache():
+            await ps.request(method='GET', url=TEST_URL)
+        assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_session_cache_not_used_for_post():
+    c = cache.MemoryCache()
+    route = respx.post(TEST_URL)
+    route.return_value = httpx.Response(
+        HTTPStatus.OK,
+        json={'id': 'x'},
+        headers={'cache-control': 'max-age=60'})
+
+    async with http.Session(cache=c) as ps:
+        await ps.request(method='POST', url=TEST_URL, json={'a': 1})
+        await ps.request(method='POST', url=TEST_URL, json={'a': 1})
+
+    assert route.call_count == 2
+    assert len(c) == 0
+
+
+def test_NameCache(monkeypatch):
+    c = cache.NameCache(max_entries=2, ttl=10)
+    c.set('a', {'id': 'a'})
+    c.set('b', {'id': 'b'})
+
+    # returned values are copies
+    c.get('a')['id'] = 'changed'
+    assert c.get('a') == {'id': 'a'}
+
+    c.set('c', {'id': 'c'})
+    assert c.get('b') is None
+    assert len(c) == 2
+
+    now = time.time()
+    monkeypatch.setattr(cache.time, 'time', lambda: now + 11)
+    assert c.get('a') is None
+
+
+def test_NameCache_path(tmp_path):
+    path = tmp_path / 'names.json'
+    cache.NameCache(path=path).set('a', {'id': 'a'})
+
+    assert cache.NameCache(path=path).get('a') == {'id': 'a'}
+    # resources may hold credentials
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    path.write_text('not json')
+    assert len(cache.NameCache(path=path)) == 0
+
+
+def test_FeatureCache(tmp_path):
+    ref = 'pl:features/my/collection/feature'
+    feature = {'id': 'feature', 'geometry': None, 'properties': {}}
+    cache.FeatureCache(tmp_path).set_feature(ref, feature, etag='"a"')
+
+    # entries persist across instances
+    c = cache.FeatureCache(tmp_path, ttl=60)
+    entry = c.get(ref)
+    assert json.loads(entry.content) == feature
+    assert entry.etag == '"a"'
+    assert c.is_fresh(entry)
+    assert c.get('pl:features/my/collection/other') is None
+
+    # an unchanged feature keeps its etag, a changed one does not
+    c.set_feature(ref, feature)
+    assert c.get(ref).etag == '"a"'
+    c.set_feature(ref, feature | {'properties': {'a': 1}})
+    assert c.get(ref).etag is None
+
+    c.delete(ref)
+    assert c.get(ref) is None
+
+    c.set_feature(ref, feature)
+    c.clear()
+    assert c.get(ref) is None
+
+
+def test_FeatureCache_prune(tmp_path):
+    c = cache.FeatureCache(tmp_path)
+    for i in range(3):
+        c.set_feature(f'pl:features/my/a/{i}', {'id': str(i)})
+    c.set_feature('pl:features/my/b/0', {'id': '0'})
+
+    assert c.prune('a', ['pl:features/my/a/1']) == 2
+    assert c.get('pl:features/my/a/0') is None
+    assert c.get('pl:features/my/a/1')
+    # other collections are unaffected
+    assert c.get('pl:features/my/b/0')
+
+    assert c.prune('a') == 1
+    assert c.get('pl:features/my/a/1') is None
+
+
+def test_FeatureCache_corrupt(tmp_path):
+    ref = 'pl:features/my/collection/feature'
+    c = cache.FeatureCache(tmp_path)
+    c.set_feature(ref, {})
+    c._path(ref).write_text('not json')
+    assert c.get(ref) is None
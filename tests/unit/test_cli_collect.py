@@ -13,6 +13,7 @@
 # the License.
 import json
 import logging
+import pytest
 
 from click.testing import CliRunner
 
@@ -67,3 +68,41 @@ def test_cli_collect_file(feature_geojson):
         assert result.exit_code == 0
         expected = {'type': 'FeatureCollection', 'features': values}
         assert json.loads(result.output) == expected
+
+
+@pytest.mark.parametrize('stream', [[], ['--stream']])
+def test_cli_collect_pretty(feature_geojson, stream):
+    values = [feature_geojson] * 3
+
+    runner = CliRunner()
+    sequence = '\n'.join([json.dumps(v) for v in values])
+    result = runner.invoke(cli.main, ['collect', '--pretty', '-'] + stream,
+                           input=sequence)
+
+    assert result.exit_code == 0
+    expected = {'type': 'FeatureCollection', 'features': values}
+    assert result.output == json.dumps(expected, indent=2,
+                                       sort_keys=True) + '\n'
+
+
+def test_cli_collect_mixed(feature_geojson):
+    values = [feature_geojson] * 2000 + [{'a': 1}]
+
+    runner = CliRunner()
+    sequence = '\n'.join([json.dumps(v) for v in values])
+    result = runner.invoke(cli.main, ['collect', '-'], input=sequence)
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == values
+
+
+def test_cli_collect_stream_mixed(feature_geojson):
+    values = [feature_geojson, {'key': 'value'}]
+
+    runner = CliRunner()
+    sequence = '\n'.join([json.dumps(v) for v in values])
+    result = runner.invoke(cli.main, ['collect', '--stream', '-'],
+                           input=sequence)
+
+    assert result.exit_code == 1
+    assert 'is not a valid GeoJSON Feature' in result.output
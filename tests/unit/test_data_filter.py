@@ -14,6 +14,7 @@
 # limitations under the License.
 from datetime import datetime, timedelta, timezone
 import logging
+import math
 import pytest
 
 from planet import data_filter, exceptions
@@ -179,6 +180,22 @@ def test_geometry_filter(geom_fixture, request, geom_geojson):
     assert res == expected
 
 
+def test_geometry_filter_max_vertices():
+    circle = [[math.cos(i * math.pi / 50), math.sin(i * math.pi / 50)]
+              for i in range(100)]
+    circle.append(circle[0])
+    geom = {'type': 'Polygon', 'coordinates': [circle]}
+
+    res = data_filter.geometry_filter(geom, max_vertices=20)
+    assert len(res['config']['coordinates'][0]) <= 20
+
+    # a hole crossing the exterior cannot be repaired and is left as is
+    hole = [[x + 0.9, y] for x, y in circle[::-1]]
+    geom = {'type': 'Polygon', 'coordinates': [circle, hole]}
+    res = data_filter.geometry_filter(geom, max_vertices=20)
+    assert len(res['config']['coordinates']) == 2
+
+
 def test_number_in_filter():
     res = data_filter.number_in_filter('testfield', [3, 3])
     expected = {
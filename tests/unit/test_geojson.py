@@ -14,6 +14,8 @@
 # limitations under the License.
 import json
 import logging
+import math
+import time
 
 import pytest
 
@@ -99,6 +101,203 @@ def test_validate_geom_as_geojson_empty_coordinates(geom_geojson):
     _ = geojson.validate_geom_as_geojson(geom_geojson)
 
 
+@pytest.fixture(params=['numpy', 'python'])
+def with_numpy(request, monkeypatch):
+    """Run a test with and without NumPy."""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(geojson, '_numpy', lambda: None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    'coordinates, message',
+    [([[[0, 0], [1, 0], [0, 0]]], 'at least 4 positions'),
+     ([[[0, 0], [1, 0], [1, 1], [0, 1]]], 'end where it started'),
+     ([[[0, 0], [1, 0], [1, 1], [0, 0.0000001]]], None),
+     ([[[0, 0], [1, 0], [1, 1], [0, 0]], [[0, 0], [1], [1, 1], [0, 1]]],
+      'end where')])
+def test_validate_geom_as_geojson_rings(with_numpy, coordinates, message):
+    geom = {'type': 'Polygon', 'coordinates': coordinates}
+    if message:
+        with pytest.raises(exceptions.GeoJSONError, match=message):
+            geojson.validate_geom_as_geojson(geom)
+        with pytest.raises(exceptions.GeoJSONError, match=message):
+            geojson.validate_geom_as_geojson({
+                'type': 'MultiPolygon', 'coordinates': [coordinates]
+            })
+    else:
+        assert geojson.validate_geom_as_geojson(geom) == geom
+
+
+def test_validate_geom_as_geojson_not_numbers(with_numpy):
+    geom = {
+        'type': 'Polygon', 'coordinates': [[[0, 0], [1, 'a'], [1, 1], [0, 0]]]
+    }
+    with pytest.raises(exceptions.GeoJSONError):
+        geojson.validate_geom_as_geojson(geom)
+
+
+def test_inspect_geom(with_numpy, geom_geojson):
+    assert geojson.inspect_geom(geom_geojson) == {
+        'bbox': [
+            37.791595458984375,
+            14.84923123791421,
+            37.90214538574219,
+            14.945448293647944
+        ],
+        'positions': 5,
+        'in_range': True,
+        'closed': True,
+        'rfc7946_winding': True
+    }
+
+
+def test_inspect_geom_multipolygon(with_numpy):
+    geom = {
+        'type': 'MultiPolygon',
+        'coordinates': [[[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]],
+                         [[0.5, 0.5], [0.5, 1], [1, 1], [0.5, 0.5]]],
+                        [[[190, 0], [191, 0], [191, 1], [190, 0]]]]
+    }
+    assert geojson.inspect_geom(geom) == {
+        'bbox': [0, 0, 191, 2],
+        'positions': 13,
+        'in_range': False,
+        'closed': True,
+        'rfc7946_winding': True
+    }
+
+
+def test_inspect_geom_point(with_numpy, point_geom_geojson):
+    info = geojson.inspect_geom(point_geom_geojson)
+    x, y = point_geom_geojson['coordinates']
+    assert info['bbox'] == [x, y, x, y]
+    assert info['positions'] == 1
+
+
+def test_normalize_geom(with_numpy):
+    geom = {
+        'type': 'Polygon',
+        'coordinates': [[[0, 0], [0, 2], [2, 2], [2, 0]],
+                        [[0.5, 0.5], [1, 0.5], [1, 1], [0.5, 0.5]]]
+    }
+    normalized = geojson.normalize_geom(geom)
+    assert normalized == {
+        'type': 'Polygon',
+        'coordinates': [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]],
+                        [[0.5, 0.5], [1, 1], [1, 0.5], [0.5, 0.5]]]
+    }
+    assert geojson.inspect_geom(normalized)['rfc7946_winding']
+    # the original is unchanged
+    assert geom['coordinates'][0][-1] == [2, 0]
+
+
+def _circle(n, radius=1.0):
+    ring = [[
+        radius * math.cos(2 * math.pi * i / n),
+        radius * math.sin(2 * math.pi * i / n)
+    ] for i in range(n)]
+    return ring + [ring[0]]
+
+
+@pytest.mark.parametrize('method', geojson.SIMPLIFY_METHODS)
+def test_simplify_geom_max_vertices(with_numpy, method):
+    geom = {
+        'type': 'Polygon',
+        'coordinates': [_circle(1000), _circle(100, 0.5)[::-1]]
+    }
+    simplified = geojson.simplify_geom(geom, max_vertices=100, method=method)
+    exterior, hole = simplified['coordinates']
+    assert len(exterior) + len(hole) <= 100
+    assert len(exterior) > len(hole) >= 4
+    assert geojson.area_error(geom, simplified) < 0.01
+    info = geojson.inspect_geom(simplified)
+    assert info['closed'] and info['rfc7946_winding']
+
+
+def test_simplify_geom_tolerance(with_numpy):
+    line = {
+        'type': 'LineString',
+        'coordinates': [[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6], [5, 7]]
+    }
+    assert geojson.simplify_geom(line, tolerance=0.5) == {
+        'type': 'LineString',
+        'coordinates': [[0, 0], [2, -0.1], [3, 5], [5, 7]]
+    }
+    assert geojson.simplify_geom(line, tolerance=10) == {
+        'type': 'LineString', 'coordinates': [[0, 0], [5, 7]]
+    }
+
+
+def test_simplify_geom_self_intersection(with_numpy):
+    # removing the least significant vertices makes the ring cross itself
+    ring = [[10.0, 0.0], [0.9, 0.5], [0.5, 0.9], [0.0, 10.0], [-0.5, 0.9],
+            [-8.7, 5.0], [-1.0, 0.0], [-0.9, -0.5], [-0.5, -0.9], [-0.0, -1.0],
+            [0.5, -0.9], [0.9, -0.5], [10.0, 0.0]]
+    geom = {'type': 'Polygon', 'coordinates': [ring]}
+    simplified = geojson.simplify_geom(geom, max_vertices=6)
+    assert not geojson._crossing_rings(simplified['coordinates'])
+    assert len(simplified['coordinates'][0]) < len(ring)
+
+
+def test_simplify_geom_hole(with_numpy):
+    # removing the corner at (10, 0) leaves the hole outside the polygon
+    geom = {
+        'type': 'Polygon',
+        'coordinates': [[[0, 0], [10, 0], [10, 10], [0, 10.5], [0, 0]],
+                        [[9, 0.5], [9.5, 0.5], [9.5, 1], [9, 0.5]]]
+    }
+    assert geojson.simplify_geom(geom, max_vertices=8) == geom
+
+
+@pytest.mark.parametrize('method', geojson.SIMPLIFY_METHODS)
+def test_simplify_geom_invalid_input(with_numpy, method):
+    # intersections already in the geometry are kept rather than repaired
+    bowtie = {
+        'type': 'Polygon',
+        'coordinates': [[[0, 0], [1, 1], [1, 0], [0, 1], [0, 0]]]
+    }
+    assert geojson.simplify_geom(bowtie, tolerance=0.0001,
+                                 method=method) == bowtie
+
+    hole = [[x + 0.9, y] for x, y in _circle(100, 0.5)[::-1]]
+    geom = {'type': 'Polygon', 'coordinates': [_circle(1000), hole]}
+    exterior, simplified_hole = geojson.simplify_geom(
+        geom, max_vertices=100, method=method)['coordinates']
+    assert len(exterior) < 1000
+
+
+def test_simplify_geom_large_invalid_input():
+    # a noisy ring that crosses itself, which the intersection checks of the
+    # ring used to make quadratic
+    n = 20000
+    ring = [[(1 + 0.05 * math.sin(i * 1.7)) * math.cos(2 * math.pi * i / n),
+             (1 + 0.05 * math.sin(i * 1.7)) * math.sin(2 * math.pi * i / n)]
+            for i in range(n)]
+    ring[1], ring[n // 2] = ring[n // 2], ring[1]
+    geom = {'type': 'Polygon', 'coordinates': [ring + [ring[0]]]}
+    assert geojson._crossing_rings(geom['coordinates']) == {0}
+
+    start = time.perf_counter()
+    simplified = geojson.simplify_geom(geom, max_vertices=1000)
+    assert time.perf_counter() - start < 5
+    assert len(simplified['coordinates'][0]) <= 1000
+
+
+def test_simplify_geom_invalid(geom_geojson):
+    with pytest.raises(exceptions.ClientError):
+        geojson.simplify_geom(geom_geojson)
+    with pytest.raises(exceptions.ClientError):
+        geojson.simplify_geom(geom_geojson, tolerance=1, method='other')
+
+
+def test_simplify_geom_point(point_geom_geojson):
+    assert geojson.simplify_geom(point_geom_geojson,
+                                 tolerance=1) == point_geom_geojson
+
+
 def test_as_geojson(geom_geojson):
     assert geojson.as_geom_or_ref(geom_geojson) == geom_geojson
 
@@ -147,6 +346,84 @@ def test__is_instance_of_success(feature_geojson):
     assert geojson._is_instance_of(feature2, "Feature")
 
 
+_POLYGON = [[[0, 0], [1, 0], [1, 1], [0, 0]]]
+
+
+@pytest.mark.parametrize(
+    'geometry',
+    [
+        None,
+        {
+            'type': 'Point', 'coordinates': [0, 1.5]
+        },
+        {
+            'type': 'Polygon', 'coordinates': _POLYGON
+        },
+        {
+            'type': 'MultiPolygon', 'coordinates': [_POLYGON]
+        },
+        {
+            'type': 'LineString', 'coordinates': [[0, 0], [1, 1]]
+        },
+        # not recognized by the fast path, but valid
+        {
+            'type': 'Polygon', 'coordinates': _POLYGON, 'bbox': [0, 0, 1, 1]
+        },
+        {
+            'type': 'GeometryCollection', 'geometries': []
+        },
+        # invalid
+        {
+            'type': 'Polygon', 'coordinates': [[[0, 0], [1, 0], [0, 0]]]
+        },
+        {
+            'type': 'Point', 'coordinates': [0, True]
+        },
+        {
+            'type': 'Point', 'coordinates': [0]
+        },
+        {
+            'type': 'LineString', 'coordinates': [[0, 0]]
+        },
+        {
+            'type': 'Polygon', 'coordinates': [[0, 0]]
+        },
+        {
+            'type': 'Circle', 'coordinates': [0, 0]
+        },
+        {
+            'type': 'Point'
+        },
+        'not a geometry'
+    ])
+@pytest.mark.parametrize('extra', [{}, {'id': 'a'}, {'id': {}}])
+def test__is_instance_of_matches_schema(geometry, extra):
+    feature = {'type': 'Feature', 'properties': {}, 'geometry': geometry}
+    feature.update(extra)
+
+    expected = geojson._validator('Feature').is_valid(feature)
+    assert geojson._is_instance_of(feature, 'Feature') == expected
+    if geojson._is_well_formed_feature(feature):
+        assert expected
+
+
+@pytest.mark.parametrize(
+    'feature',
+    [{
+        'type': 'Feature', 'geometry': None
+    }, {
+        'type': 'Feature', 'properties': [], 'geometry': None
+    }, {
+        'type': 'Polygon', 'coordinates': _POLYGON
+    }, []])
+def test__is_instance_of_invalid(feature):
+    assert not geojson._is_instance_of(feature, 'Feature')
+
+
+def test__validator_cached():
+    assert geojson._validator('Feature') is geojson._validator('Feature')
+
+
 def test__is_instance_of_does_not_exist(feature_geojson):
     with pytest.raises(exceptions.GeoJSONError):
         geojson._is_instance_of(feature_geojson, "Foobar")
@@ -228,6 +228,18 @@ async def test_session_stream():
             assert chunks[0] == b'bubba'
 
 
+@respx.mock
+@pytest.mark.anyio
+async def test_session_stream_chunk_size():
+    async with http.Session() as ps:
+        mock_resp = httpx.Response(HTTPStatus.OK, text='bubba')
+        respx.get(TEST_URL).return_value = mock_resp
+
+        async with ps.stream(method='GET', url=TEST_URL) as resp:
+            chunks = [c async for c in resp.aiter_bytes(2)]
+            assert chunks == [b'bu', b'bb', b'a']
+
+
 @respx.mock
 @pytest.mark.anyio
 async def test_session_request_retry():
@@ -269,6 +281,81 @@ async def test_session__retry():
         assert args == [(1, 64), (2, 64), (3, 64), (4, 64), (5, 64)]
 
 
+@respx.mock
+@pytest.mark.anyio
+async def test_session_coalesce_requests():
+
+    async def delayed(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(HTTPStatus.OK, json={'id': 'x'})
+
+    route = respx.get(TEST_URL + '/a')
+    route.side_effect = delayed
+    other = respx.get(TEST_URL + '/b')
+    other.side_effect = delayed
+
+    async with http.Session(coalesce_requests=True) as ps:
+        responses = await asyncio.gather(
+            *[ps.request(method='GET', url=TEST_URL + '/a') for _ in range(5)],
+            ps.request(method='GET', url=TEST_URL + '/b'))
+
+        assert route.call_count == 1
+        assert other.call_count == 1
+        assert all(r.json() == {'id': 'x'} for r in responses)
+        assert ps.outcomes['Coalesced'] == 4
+        assert ps.outcomes['Successful'] == 2
+        assert not ps._in_flight
+
+        # requests made after the first completed are sent again
+        await ps.request(method='GET', url=TEST_URL + '/a')
+        assert route.call_count == 2
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_session_coalesce_requests_headers():
+
+    async def delayed(request):
+        await asyncio.sleep(0.01)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(HTTPStatus.NOT_MODIFIED)
+        return httpx.Response(HTTPStatus.OK, json={'id': 'x'})
+
+    route = respx.get(TEST_URL + '/a')
+    route.side_effect = delayed
+
+    async with http.Session(coalesce_requests=True) as ps:
+        conditional, plain = await asyncio.gather(
+            ps.request(method='GET',
+                       url=TEST_URL + '/a',
+                       headers={'If-None-Match': '"v1"'}),
+            ps.request(method='GET', url=TEST_URL + '/a'))
+
+    assert route.call_count == 2
+    assert conditional.status_code == HTTPStatus.NOT_MODIFIED
+    assert plain.json() == {'id': 'x'}
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_session_coalesce_requests_error():
+
+    async def delayed(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(HTTPStatus.NOT_FOUND, json={})
+
+    route = respx.get(TEST_URL + '/a')
+    route.side_effect = delayed
+
+    async with http.Session(coalesce_requests=True) as ps:
+        results = await asyncio.gather(
+            *[ps.request(method='GET', url=TEST_URL + '/a') for _ in range(3)],
+            return_exceptions=True)
+
+    assert route.call_count == 1
+    assert all(isinstance(r, exceptions.MissingResource) for r in results)
+
+
 def test__calculate_wait():
     max_retry_backoff = 20
     wait_times = [
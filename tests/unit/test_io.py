@@ -12,6 +12,8 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 from datetime import datetime
+import io as stdio
+import json
 import logging
 import pytest
 
@@ -55,6 +57,103 @@ async def test_collect_features(feature_geojson, make_aiter):
     assert res == expected
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize('indent, sort_keys', [(None, False), (2, True),
+                                               (4, False)])
+@pytest.mark.parametrize('kind', ['features', 'non-features', 'empty'])
+async def test_iter_collect(feature_geojson,
+                            make_aiter,
+                            kind,
+                            indent,
+                            sort_keys):
+    values = {
+        'features': [feature_geojson, feature_geojson],
+        'non-features': [{
+            'b': 1, 'a': [1, 2]
+        }, {
+            'c': {}
+        }],
+        'empty': []
+    }[kind]
+
+    text = ''.join([
+        piece async for piece in io.iter_collect(make_aiter(
+            values), indent=indent, sort_keys=sort_keys)
+    ])
+
+    expected = await io.collect(make_aiter(values))
+    assert text == json.dumps(expected, indent=indent, sort_keys=sort_keys)
+
+
+@pytest.mark.anyio
+async def test_iter_collect_mixed(feature_geojson, make_aiter):
+    pieces = io.iter_collect(make_aiter([feature_geojson, {'key': 'value'}]))
+    with pytest.raises(exceptions.GeoJSONError):
+        async for _ in pieces:
+            pass
+
+
+def _feature_collection(feature):
+    features = [dict(feature, id=str(i)) for i in range(3)]
+    return {
+        'type': 'FeatureCollection',
+        'name': 'collection',
+        'features': features,
+        'bbox': [0, 0, 1, 1]
+    }
+
+
+@pytest.mark.parametrize('read_size', [7, io.READ_SIZE])
+@pytest.mark.parametrize('fmt', ['compact', 'pretty', 'ndjson'])
+def test_read_features(feature_geojson, monkeypatch, read_size, fmt):
+    monkeypatch.setattr(io, 'READ_SIZE', read_size)
+    collection = _feature_collection(feature_geojson)
+    if fmt == 'compact':
+        text = json.dumps(collection)
+    elif fmt == 'pretty':
+        text = json.dumps(collection, indent=2)
+    else:
+        text = ''.join(json.dumps(f) + '\n' for f in collection['features'])
+
+    assert list(io.read_features(stdio.StringIO(text))) == \
+        collection['features']
+
+
+def test_read_features_other(geom_geojson, feature_geojson):
+    text = json.dumps(geom_geojson) + json.dumps(
+        _feature_collection(feature_geojson)) + ' 1234'
+    values = list(io.read_features(stdio.StringIO(text)))
+    assert values[0] == geom_geojson
+    assert [v['id'] for v in values[1:4]] == ['0', '1', '2']
+    assert values[4] == 1234
+
+
+@pytest.mark.parametrize('text',
+                         ['{"a":', '{"features": [1 2]}', '{"a" 1}', '[1,'])
+def test_read_features_invalid(text):
+    with pytest.raises(exceptions.GeoJSONError):
+        list(io.read_features(stdio.StringIO(text)))
+
+
+def test_write_atomic(tmp_path, monkeypatch):
+    path = tmp_path / 'file.json'
+    io.write_atomic(path, 'a')
+    io.write_atomic(path, 'b')
+    assert path.read_text() == 'b'
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    def fail(src, dst):
+        raise OSError('replace failed')
+
+    monkeypatch.setattr(io.os, 'replace', fail)
+    with pytest.raises(OSError):
+        io.write_atomic(path, 'c')
+
+    # the temporary file is removed and the file is unchanged
+    assert [p.name for p in tmp_path.iterdir()] == ['file.json']
+    assert path.read_text() == 'b'
+
+
 @pytest.mark.parametrize(
     "string, expected",
     [
@@ -0,0 +1,88 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+import hashlib
+import json
+
+import pytest
+
+from planet import manifest
+
+
+def test_file_checksum(tmp_path):
+    path = tmp_path / 'file'
+    path.write_bytes(b'data')
+    assert manifest.file_checksum(path) == hashlib.sha256(b'data').hexdigest()
+
+
+@pytest.mark.anyio
+async def test_Manifest_record(tmp_path):
+    path = tmp_path / 'a.tif'
+    path.write_bytes(b'data')
+
+    m = manifest.Manifest(tmp_path)
+    assert not await m.is_current('a', path)
+
+    entry = await m.record('a', path, {'v': 1})
+    assert entry['path'] == 'a.tif'
+    assert entry['size'] == 4
+    assert await m.is_current('a', path, {'v': 1})
+
+    # source changed
+    assert not await m.is_current('a', path, {'v': 2})
+    # different location
+    assert not await m.is_current('a', tmp_path / 'b.tif')
+
+    # entries persist
+    assert await manifest.Manifest(tmp_path).is_current('a', path, {'v': 1})
+
+
+@pytest.mark.anyio
+async def test_Manifest_invalid_file(tmp_path):
+    path = tmp_path / 'a.tif'
+    path.write_bytes(b'data')
+    await manifest.Manifest(tmp_path).record('a', path)
+
+    # same size, different content is only detected when verifying
+    path.write_bytes(b'dat!')
+    assert await manifest.Manifest(tmp_path).is_current('a', path)
+    assert not await manifest.Manifest(tmp_path, verify=True).is_current(
+        'a', path)
+
+    # partially written
+    path.write_bytes(b'da')
+    assert not await manifest.Manifest(tmp_path).is_current('a', path)
+
+    path.unlink()
+    assert not await manifest.Manifest(tmp_path).is_current('a', path)
+
+
+@pytest.mark.anyio
+async def test_Manifest_load(tmp_path):
+    path = tmp_path / 'a.tif'
+    path.write_bytes(b'data')
+    m = manifest.Manifest(tmp_path)
+    for _ in range(5):
+        await m.record('a', path)
+
+    # truncated line from an interrupted write is ignored
+    with open(m.path, 'a') as fp:
+        fp.write('{"key": "b", "pa')
+
+    m = manifest.Manifest(tmp_path)
+    assert len(m) == 1
+    assert 'a' in m
+
+    # superseded entries were compacted
+    lines = m.path.read_text().splitlines()
+    assert [json.loads(line)['key'] for line in lines] == ['a']
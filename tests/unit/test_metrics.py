@@ -0,0 +1,138 @@
+# Copyright 2025 Planet Labs PBC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+from http import HTTPStatus
+
+import httpx
+import pytest
+import respx
+
+from planet import exceptions, http, metrics
+
+TEST_URL = 'http://www.mocknotrealurl.com/api/v2/orders'
+
+
+@pytest.mark.parametrize(
+    'url, expected',
+    [('http://a.com/data/v1/item-types/PSScene/items/20210101_1234_01',
+      'GET a.com/data/v1/item-types/PSScene/items/{id}'),
+     ('http://a.com/compute/ops/orders/v2/0c2e9f3b-1b6e-4d3e?x=1',
+      'GET a.com/compute/ops/orders/v2/{id}')])
+def test_endpoint(url, expected):
+    assert metrics.endpoint(httpx.Request('GET', url)) == expected
+
+
+def test_Histogram():
+    hist = metrics.Histogram(buckets=[1, 2, 4])
+    assert hist.quantile(0.5) is None
+
+    for value in [0.5, 1.5, 1.5, 3, 10]:
+        hist.observe(value)
+
+    assert hist.count == 5
+    assert hist.sum == 16.5
+    assert hist.cumulative() == [(1, 1), (2, 3), (4, 4), (float('inf'), 5)]
+    # interpolated within the (1, 2] bucket
+    assert hist.quantile(0.5) == 1.75
+    # the last bucket is unbounded
+    assert hist.quantile(0.99) == 4
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_session_metrics():
+    collector = metrics.MetricsCollector()
+    route = respx.get(TEST_URL)
+    route.side_effect = [
+        httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, json={}),
+        httpx.Response(HTTPStatus.OK, json={'id': 'x'})
+    ]
+    respx.get(TEST_URL + '/download').return_value = httpx.Response(
+        HTTPStatus.OK, content=b'data' * 10)
+
+    async with http.Session(metrics=[collector]) as ps:
+        ps.max_retry_backoff = 0
+        await ps.request(method='GET', url=TEST_URL)
+        async with ps.stream(method='GET', url=TEST_URL + '/download') as r:
+            async for _ in r.aiter_bytes():
+                pass
+
+    summary = collector.summary()
+    orders = summary['endpoints']['GET www.mocknotrealurl.com/api/v2/orders']
+    assert orders['requests'] == 2
+    assert orders['outcomes'] == {'200': 1, 'TooManyRequests': 1}
+    assert orders['bytes'] == len(b'{"id":"x"}')
+    download = summary['endpoints'][
+        'GET www.mocknotrealurl.com/api/v2/orders/download']
+    assert download['bytes'] == 40
+    assert summary['requests'] == 3
+    assert summary['retries'] == {'TooManyRequests': 1}
+    assert summary['retry_wait'] == 0
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_session_metrics_hook_failure():
+
+    class Broken(metrics.MetricsHook):
+
+        def request_start(self, request):
+            raise ValueError('broken')
+
+    respx.get(TEST_URL).return_value = httpx.Response(HTTPStatus.OK, json={})
+    async with http.Session(metrics=[Broken()]) as ps:
+        # the request is unaffected
+        resp = await ps.request(method='GET', url=TEST_URL)
+        assert resp.status_code == HTTPStatus.OK
+
+
+@respx.mock
+@pytest.mark.anyio
+async def test_session_metrics_error():
+    collector = metrics.MetricsCollector()
+    respx.get(TEST_URL).return_value = httpx.Response(HTTPStatus.NOT_FOUND,
+                                                      json={})
+    async with http.Session(metrics=[collector]) as ps:
+        with pytest.raises(exceptions.MissingResource):
+            await ps.request(method='GET', url=TEST_URL)
+
+    assert list(collector.requests.values()) == [1]
+    assert list(collector.requests) == [
+        ('GET www.mocknotrealurl.com/api/v2/orders', 'MissingResource')
+    ]
+
+
+def test_MetricsCollector_prometheus():
+    collector = metrics.MetricsCollector(buckets=[0.1, 1])
+    request = httpx.Request('GET', 'http://a.com/items/1')
+    collector.queue_wait(request, 0.05)
+    collector.request_end(request, httpx.Response(HTTPStatus.OK), 0.5)
+    collector.retry(request, exceptions.TooManyRequests(), 1, 2.0)
+    collector.stream_bytes(request, 10)
+
+    text = collector.prometheus()
+    assert text.endswith('\n')
+    lines = text.splitlines()
+    assert '# TYPE planet_http_request_duration_seconds histogram' in lines
+    assert ('planet_http_requests_total'
+            '{endpoint="GET a.com/items/{id}",outcome="200"} 1') in lines
+    assert ('planet_http_request_duration_seconds_bucket'
+            '{endpoint="GET a.com/items/{id}",le="0.1"} 0') in lines
+    assert ('planet_http_request_duration_seconds_bucket'
+            '{endpoint="GET a.com/items/{id}",le="+Inf"} 1') in lines
+    assert 'planet_http_queue_wait_seconds_count 1' in lines
+    assert ('planet_http_retries_total'
+            '{exception="TooManyRequests"} 1') in lines
+    assert 'planet_http_retry_wait_seconds_total 2.0' in lines
+    assert ('planet_http_received_bytes_total'
+            '{endpoint="GET a.com/items/{id}"} 10') in lines
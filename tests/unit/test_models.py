@@ -12,17 +12,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import hashlib
+import io
 import logging
 import math
 from unittest.mock import MagicMock
 import os
 from pathlib import Path
 import re
+import threading
 
 import pytest
 
-from planet import models
-from planet.exceptions import PagingError
+from planet import models, reporting
+from planet.exceptions import DownloadError, PagingError
 
 LOGGER = logging.getLogger(__name__)
 
@@ -127,7 +131,7 @@ def test__get_random_filename(content_type, check):
 @pytest.mark.anyio
 async def test_StreamingBody_write_img(tmpdir, open_test_img):
 
-    async def _aiter_bytes():
+    async def _aiter_bytes(chunk_size=None):
         data = open_test_img.read()
         v = memoryview(data)
 
@@ -148,6 +152,177 @@ async def test_StreamingBody_write_img(tmpdir, open_test_img):
     assert os.stat(filename).st_size == 527
 
 
+def _mock_response(data, headers=None, error=None):
+
+    async def _aiter_bytes(chunk_size=None):
+        for i in range(0, len(data), 4):
+            r.num_bytes_downloaded += len(data[i:i + 4])
+            yield data[i:i + 4]
+        if error:
+            raise error
+
+    r = MagicMock(name='response')
+    r.aiter_bytes = _aiter_bytes
+    r.num_bytes_downloaded = 0
+    r.headers = {'Content-Length': str(len(data))}
+    r.headers.update(headers or {})
+    return r
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('digest',
+                         [None, hashlib.md5(b'data' * 5).hexdigest()])
+async def test_StreamingBody_write_atomic(tmp_path, digest):
+    filename = tmp_path / 'test.tif'
+    body = models.StreamingBody(_mock_response(b'data' * 5))
+    await body.write(filename, progress_bar=False, digest=digest)
+
+    assert filename.read_bytes() == b'data' * 5
+    assert os.listdir(tmp_path) == ['test.tif']
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('headers, error, digest',
+                         [({
+                             'Content-Length': '100'
+                         }, None, None), ({}, ValueError('interrupted'), None),
+                          ({}, None, hashlib.md5(b'other').hexdigest())])
+async def test_StreamingBody_write_failure(tmp_path, headers, error, digest):
+    filename = tmp_path / 'test.tif'
+    filename.write_bytes(b'original')
+    body = models.StreamingBody(_mock_response(b'data' * 5, headers, error))
+
+    with pytest.raises((DownloadError, ValueError)):
+        await body.write(filename,
+                         progress_bar=False,
+                         overwrite=True,
+                         digest=digest)
+
+    # the destination is untouched and no partial file remains
+    assert filename.read_bytes() == b'original'
+    assert os.listdir(tmp_path) == ['test.tif']
+
+
+@pytest.mark.anyio
+async def test_StreamingBody_write_stale_partial(tmp_path):
+    filename = tmp_path / 'test.tif'
+    # left by a killed download
+    (tmp_path / '.test.tif.part').write_bytes(b'stale' * 100)
+    body = models.StreamingBody(_mock_response(b'data' * 5))
+    await body.write(filename, progress_bar=False)
+
+    assert filename.read_bytes() == b'data' * 5
+    assert os.listdir(tmp_path) == ['test.tif']
+
+
+@pytest.mark.anyio
+async def test_StreamingBody_write_reporter(tmp_path):
+    reporter = reporting.TransferProgress(disable=True)
+    await models.StreamingBody(_mock_response(b'data' * 5)
+                               ).write(tmp_path / 'a.tif', reporter=reporter)
+
+    with pytest.raises(DownloadError):
+        await models.StreamingBody(
+            _mock_response(b'data', {'Content-Length': '100'})
+        ).write(tmp_path / 'b.tif', reporter=reporter)
+
+    assert reporter.files_done == 1
+    assert reporter.files_failed == 1
+    assert reporter.bytes_done == 24
+    # the missing bytes of the failed file are no longer expected
+    assert reporter.total_bytes == 24
+
+
+@pytest.mark.anyio
+async def test_StreamingBody_write_no_overwrite(tmp_path):
+    filename = tmp_path / 'test.tif'
+    filename.write_bytes(b'original')
+    body = models.StreamingBody(_mock_response(b'data'))
+    await body.write(filename, progress_bar=False, overwrite=False)
+    assert filename.read_bytes() == b'original'
+
+
+@pytest.mark.anyio
+async def test__FileWriter():
+
+    class BlockingFile:
+
+        def __init__(self):
+            self.writes = []
+            self.started = threading.Event()
+            self.release = threading.Event()
+
+        def write(self, data):
+            self.started.set()
+            # bounded so that a write blocking the event loop fails the test
+            # rather than hanging it
+            self.release.wait(5)
+            self.writes.append(bytes(data))
+
+    fp = BlockingFile()
+
+    async def _write():
+        async with models._FileWriter(fp, buffer_size=10) as writer:
+            for _ in range(10):
+                await writer.write(b'1234')
+
+    task = asyncio.create_task(_write())
+    loop = asyncio.get_running_loop()
+    assert await loop.run_in_executor(None, fp.started.wait, 10)
+
+    # the event loop runs while a write is blocked, and the writer waits
+    # for the write rather than starting another
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert not task.done()
+    assert fp.writes == []
+
+    fp.release.set()
+    await task
+
+    # data is written in blocks of the buffer size
+    assert b''.join(fp.writes) == b'1234' * 10
+    assert [len(w) for w in fp.writes] == [10, 10, 10, 10]
+
+
+@pytest.mark.anyio
+async def test__FileWriter_large_chunks():
+    fp = io.BytesIO()
+    data = bytes(range(256)) * 10
+    async with models._FileWriter(fp, buffer_size=1000) as writer:
+        await writer.write(data[:10])
+        await writer.write(data[10:])
+    assert fp.getvalue() == data
+
+
+@pytest.mark.anyio
+async def test__FileWriter_lazy_buffers():
+    fp = io.BytesIO()
+    async with models._FileWriter(fp, buffer_size=1000) as writer:
+        # nothing is allocated until data is written
+        assert writer._buffer is None
+        await writer.write(b'1234')
+        # a body smaller than a block needs one buffer only
+        assert len(writer._buffer) == 1000
+        assert writer._spare is None
+    assert fp.getvalue() == b'1234'
+    assert writer._spare is None
+
+
+@pytest.mark.anyio
+async def test__FileWriter_error():
+
+    class BrokenFile:
+
+        def write(self, data):
+            raise OSError('disk full')
+
+    with pytest.raises(OSError):
+        async with models._FileWriter(BrokenFile(), buffer_size=1) as writer:
+            await writer.write(b'1')
+            await writer.write(b'2')
+
+
 @pytest.mark.anyio
 async def test_Paged_iterator():
     resp = MagicMock(name='response')
@@ -305,6 +305,29 @@ def test_clip_tool_multipolygon(multipolygon_geom_geojson):
     assert ct == expected
 
 
+def test_clip_tool_max_vertices_self_intersecting():
+    bowtie = {
+        'type': 'Polygon',
+        'coordinates': [[[0, 0], [1, 1], [1, 0], [0, 1], [0, 0]]]
+    }
+    ct = order_request.clip_tool(bowtie, max_vertices=4)
+    assert len(ct['clip']['aoi']['coordinates'][0]) == 4
+
+
+def test_clip_tool_max_vertices(geom_geojson):
+    ct = order_request.clip_tool(geom_geojson, max_vertices=4)
+    ring = geom_geojson['coordinates'][0]
+    # one corner of the rectangle is removed
+    expected = {
+        'clip': {
+            'aoi': {
+                'type': 'Polygon', 'coordinates': [ring[:3] + ring[4:]]
+            }
+        }
+    }
+    assert ct == expected
+
+
 def test_clip_tool_invalid(point_geom_geojson):
     """Confirm an exception is raised if an invalid geometry type is supplied.
     """
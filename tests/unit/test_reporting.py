@@ -12,6 +12,8 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations under
 # the License.
+import io
+import json
 import logging
 import re
 
@@ -78,3 +80,45 @@ def test_AssetStatusBar_update():
 
         bar.update(status='init')
         assert ('status: init') in str(bar)
+
+
+def test_TransferProgress_totals():
+    with reporting.TransferProgress(interval=0) as progress:
+        progress.start('a', 100)
+        progress.start('b', None)
+        progress.update('a', 50)
+        progress.update('b', 10)
+        assert progress.eta is None
+
+        progress.finish('b')
+        assert progress.total_bytes == 110
+        assert 'files 1/2' in str(progress)
+
+        progress.finish('a', failed=True)
+        assert progress.summary()['files_failed'] == 1
+        assert progress.total_bytes == 60
+        assert 'files 1/2, 1 failed' in str(progress)
+
+
+def test_TransferProgress_ndjson(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr(reporting.time, 'monotonic', lambda: now)
+    out = io.StringIO()
+    with reporting.TransferProgress(ndjson=True, interval=1,
+                                    file=out) as progress:
+        progress.start('a', 100)
+        now = 2.0
+        progress.update('a', 50)
+        # reports are rate limited
+        now = 2.5
+        progress.update('a', 10)
+        now = 3.0
+        progress.finish('a')
+
+    reports = [json.loads(line) for line in out.getvalue().splitlines()]
+    # one report each for the update, the finish and the exit
+    assert len(reports) == 3
+    assert reports[0]['throughput'] == 25.0
+    assert reports[0]['eta'] == 2.0
+    assert reports[-1]['bytes'] == reports[-1]['total_bytes'] == 60
+    assert reports[-1]['files_done'] == 1